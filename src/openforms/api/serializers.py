@@ -1,3 +1,5 @@
+from typing import Any
+
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
 
@@ -69,6 +71,8 @@ class ValidationErrorSerializer(ExceptionSerializer):
 
 class ListWithChildSerializer(serializers.ListSerializer):
     child_serializer_class = None  # class or dotted import path
+    # model field identifying the existing objects in (bulk) updates
+    lookup_field: str = ""
 
     def __init__(self, *args, **kwargs):
         child_serializer_class = self.get_child_serializer_class()
@@ -96,6 +100,75 @@ class ListWithChildSerializer(serializers.ListSerializer):
 
         return model._default_manager.bulk_create(objects_to_create)
 
+    def get_lookup_value(self, index: int, data_dict: dict) -> Any:
+        return data_dict.get(self.lookup_field)
+
+    def update(self, instance, validated_data):
+        """
+        Synchronize the existing objects with the submitted collection.
+
+        The existing objects are matched with the items on the lookup field. Only the
+        objects that differ from their item are updated, items without matching object
+        are created and objects without matching item are deleted. Contrary to
+        replacing all the objects, this keeps the primary keys (and thus the foreign
+        keys pointing to the objects) intact.
+        """
+        assert self.lookup_field, "Bulk updates require a lookup field"
+        validated_data = self.preprocess_validated_data(validated_data)
+        model = self.get_child_serializer_class().Meta.model
+        writable_fields = {
+            field.source for field in self.child.fields.values() if not field.read_only
+        }
+        model_fields = [
+            field
+            for field in model._meta.concrete_fields
+            if field.name in writable_fields
+        ]
+
+        existing_objects = {
+            str(getattr(obj, self.lookup_field)): obj for obj in instance
+        }
+        objects, objects_to_create, objects_to_update = [], [], []
+        fields_to_update = set()
+        for index, data_dict in enumerate(validated_data):
+            # build the object the same way as in the create, so that fields that are
+            # not specified are reset to their defaults
+            new_obj = self.process_object(model(**data_dict))
+            lookup_value = self.get_lookup_value(index, data_dict)
+            obj = (
+                existing_objects.pop(str(lookup_value), None)
+                if lookup_value is not None
+                else None
+            )
+            if obj is None:
+                objects_to_create.append(new_obj)
+                objects.append(new_obj)
+                continue
+
+            changed_fields = [
+                field
+                for field in model_fields
+                if getattr(obj, field.attname) != getattr(new_obj, field.attname)
+            ]
+            for field in changed_fields:
+                setattr(obj, field.name, getattr(new_obj, field.name))
+            if changed_fields:
+                objects_to_update.append(obj)
+                fields_to_update.update(field.name for field in changed_fields)
+            objects.append(obj)
+
+        if existing_objects:
+            model._default_manager.filter(
+                pk__in=[obj.pk for obj in existing_objects.values()]
+            ).delete()
+        if objects_to_update:
+            model._default_manager.bulk_update(
+                objects_to_update, fields=sorted(fields_to_update)
+            )
+        if objects_to_create:
+            model._default_manager.bulk_create(objects_to_create)
+        return objects
+
 
 class PublicFieldsSerializerMixin:
     # Mixin to distinguish between public and private serializer fields
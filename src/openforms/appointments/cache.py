@@ -0,0 +1,123 @@
+"""
+Short-lived, shared cache of the appointment availability.
+
+Every citizen making an appointment queries the products, locations, dates and times
+through the API endpoints, which call the appointment plugin. Many of these lookups are
+identical (the same product at the same location), and the appointment systems
+throttle us if we forward all of them.
+
+The results of the lookups are cached for a short time (per method, see
+:data:`TIMEOUTS`) in the shared Django cache. Concurrent identical lookups are
+coalesced - one request performs the upstream call while the others wait for its
+result to appear in the cache.
+
+Booking or cancelling an appointment changes the availability, so the cached results
+of the plugin are invalidated after doing so, see :func:`invalidate_availability`.
+"""
+
+import hashlib
+import logging
+import time
+from datetime import date, datetime
+from typing import Any
+
+from django.core.cache import cache
+
+from .base import BasePlugin, Location, Product
+
+__all__ = ["AvailabilityCache", "invalidate_availability"]
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "appointments:availability"
+
+TIMEOUTS = {
+    "get_available_products": 60 * 10,
+    "get_locations": 60 * 10,
+    "get_dates": 60,
+    "get_times": 30,
+}
+
+# upper bound for the upstream call of the request performing the lookup
+LOCK_TIMEOUT = 30
+# how long other requests wait for the result before doing the lookup themselves
+MAX_WAIT = 10
+WAIT_INTERVAL = 0.1
+
+_MISSING = object()
+
+
+def _get_generation_key(plugin: BasePlugin) -> str:
+    return f"{KEY_PREFIX}:{plugin.identifier}:generation"
+
+
+def invalidate_availability(plugin: BasePlugin) -> None:
+    """
+    Discard the cached lookups of the plugin.
+    """
+    # the generation is part of the cache keys, so the existing entries are no longer
+    # looked up (and expire by themselves)
+    cache.set(_get_generation_key(plugin), time.time_ns(), timeout=None)
+
+
+class AvailabilityCache:
+    """
+    Perform the availability lookups of the plugin through the cache.
+    """
+
+    def __init__(self, plugin: BasePlugin):
+        self.plugin = plugin
+
+    def get_available_products(
+        self,
+        current_products: list[Product] | None = None,
+        location_id: str = "",
+        **kwargs,
+    ) -> list[Product]:
+        if current_products is not None:
+            kwargs["current_products"] = current_products
+        if location_id:
+            kwargs["location_id"] = location_id
+        return self._get("get_available_products", **kwargs)
+
+    def get_locations(self, products: list[Product] | None = None) -> list[Location]:
+        return self._get("get_locations", products)
+
+    def get_dates(self, products: list[Product], location: Location) -> list[date]:
+        return self._get("get_dates", products, location)
+
+    def get_times(
+        self, products: list[Product], location: Location, day: date
+    ) -> list[datetime]:
+        return self._get("get_times", products, location, day)
+
+    def _get_key(self, method: str, args: tuple, kwargs: dict[str, Any]) -> str:
+        generation = cache.get(_get_generation_key(self.plugin), 0)
+        # the arguments are (lists of) dataclasses and dates, which have a stable repr
+        arguments = repr((args, sorted(kwargs.items())))
+        digest = hashlib.sha256(arguments.encode("utf-8")).hexdigest()
+        return f"{KEY_PREFIX}:{self.plugin.identifier}:{generation}:{method}:{digest}"
+
+    def _get(self, method: str, *args, **kwargs):
+        key = self._get_key(method, args, kwargs)
+        if (result := cache.get(key, _MISSING)) is not _MISSING:
+            return result
+
+        lock_key = f"{key}:lock"
+        deadline = time.monotonic() + MAX_WAIT
+        while not (locked := cache.add(lock_key, True, timeout=LOCK_TIMEOUT)):
+            # another request is performing the same lookup, wait for its result
+            time.sleep(WAIT_INTERVAL)
+            if (result := cache.get(key, _MISSING)) is not _MISSING:
+                return result
+            if time.monotonic() > deadline:
+                logger.info("Timed out waiting for the %s lookup result", method)
+                break
+
+        try:
+            result = getattr(self.plugin, method)(*args, **kwargs)
+            cache.set(key, result, timeout=TIMEOUTS[method])
+        finally:
+            if locked:
+                cache.delete(lock_key)
+        return result
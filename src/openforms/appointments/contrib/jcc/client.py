@@ -9,4 +9,5 @@ def get_client() -> Client:
     config = JccConfig.get_solo()
     assert isinstance(config, JccConfig)
     assert config.service is not None
-    return build_client(config.service)
+    # the WSDL is only loaded once per process, rather than for every request
+    return build_client(config.service, shared=True)
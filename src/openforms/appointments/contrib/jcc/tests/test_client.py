@@ -6,6 +6,7 @@ from privates.test import temp_private_root
 from simple_certmanager.test.factories import CertificateFactory
 from zeep.client import Client as ZeepClient
 
+from soap.client import clear_shared_clients
 from soap.tests.factories import SoapServiceFactory
 
 from ..client import get_client
@@ -15,6 +16,11 @@ from .utils import WSDL
 
 @temp_private_root()
 class ClientConfigurationTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_shared_clients)
+
     @patch("openforms.appointments.contrib.jcc.client.JccConfig.get_solo")
     def test_client_transport_supports_mtls(self, m_get_solo):
         # Smoke test to check that the service configuration is honoured
@@ -15,6 +15,7 @@ from openforms.logging import logevent
 from openforms.submissions.models import Submission
 
 from .base import BasePlugin, CustomerDetails, Location, Product
+from .cache import invalidate_availability
 from .constants import AppointmentDetailsStatus
 from .exceptions import (
     AppointmentCreateFailed,
@@ -59,6 +60,7 @@ def book(appointment: Appointment, remarks: str = "") -> str:
         customer,
         remarks=remarks,
     )
+    invalidate_availability(plugin)
     appointment_info = AppointmentInfo.objects.create(
         status=AppointmentDetailsStatus.success,
         appointment_id=appointment_id,
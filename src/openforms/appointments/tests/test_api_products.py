@@ -5,6 +5,7 @@ from rest_framework.test import APITestCase
 
 from openforms.submissions.tests.factories import SubmissionFactory
 from openforms.submissions.tests.mixins import SubmissionsMixin
+from openforms.utils.tests.cache import clear_caches
 
 from ..base import Product
 from ..models import AppointmentsConfig
@@ -18,9 +19,15 @@ class ProductListTests(SubmissionsMixin, APITestCase):
         cls.submission = SubmissionFactory.create()
         cls.endpoint = reverse("api:appointments-products-list")
 
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+
     @patch("openforms.appointments.api.views.get_plugin")
     def test_list_products_with_fixed_location_in_config(self, mock_get_plugin):
         mock_plugin = mock_get_plugin.return_value
+        mock_plugin.get_available_products.return_value = []
         config_patcher = patch(
             "openforms.appointments.utils.AppointmentsConfig.get_solo",
             return_value=AppointmentsConfig(
@@ -42,6 +49,7 @@ class ProductListTests(SubmissionsMixin, APITestCase):
     @patch("openforms.appointments.api.views.get_plugin")
     def test_list_products_with_existing_product(self, mock_get_plugin):
         mock_plugin = mock_get_plugin.return_value
+        mock_plugin.get_available_products.return_value = []
         config_patcher = patch(
             "openforms.appointments.utils.AppointmentsConfig.get_solo",
             return_value=AppointmentsConfig(plugin="demo"),
@@ -0,0 +1,82 @@
+from datetime import date
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from openforms.utils.tests.cache import clear_caches
+
+from ..base import Location, Product
+from ..cache import AvailabilityCache, invalidate_availability
+from ..contrib.demo.plugin import DemoAppointment
+
+
+class AvailabilityCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+        self.plugin = DemoAppointment("demo")
+        self.products = [Product(identifier="1", name="")]
+        self.location = Location(identifier="1", name="")
+
+    def test_identical_lookups_are_cached(self):
+        with patch.object(
+            self.plugin, "get_dates", return_value=[date(2024, 1, 15)]
+        ) as m_get_dates:
+            dates1 = AvailabilityCache(self.plugin).get_dates(
+                self.products, self.location
+            )
+            dates2 = AvailabilityCache(self.plugin).get_dates(
+                self.products, self.location
+            )
+
+        self.assertEqual(dates1, [date(2024, 1, 15)])
+        self.assertEqual(dates2, [date(2024, 1, 15)])
+        m_get_dates.assert_called_once_with(self.products, self.location)
+
+    def test_different_lookups_are_not_shared(self):
+        with patch.object(self.plugin, "get_times", return_value=[]) as m_get_times:
+            availability = AvailabilityCache(self.plugin)
+            availability.get_times(self.products, self.location, date(2024, 1, 15))
+            availability.get_times(self.products, self.location, date(2024, 1, 16))
+
+        self.assertEqual(m_get_times.call_count, 2)
+
+    def test_invalidation(self):
+        with patch.object(self.plugin, "get_dates", return_value=[]) as m_get_dates:
+            AvailabilityCache(self.plugin).get_dates(self.products, self.location)
+            invalidate_availability(self.plugin)
+            AvailabilityCache(self.plugin).get_dates(self.products, self.location)
+
+        self.assertEqual(m_get_dates.call_count, 2)
+
+    def test_errors_are_not_cached(self):
+        with patch.object(
+            self.plugin, "get_locations", side_effect=[RuntimeError, []]
+        ) as m_get_locations:
+            with self.assertRaises(RuntimeError):
+                AvailabilityCache(self.plugin).get_locations(self.products)
+
+            locations = AvailabilityCache(self.plugin).get_locations(self.products)
+
+        self.assertEqual(locations, [])
+        self.assertEqual(m_get_locations.call_count, 2)
+
+    def test_concurrent_lookups_wait_for_the_result(self):
+        availability = AvailabilityCache(self.plugin)
+        key = availability._get_key("get_dates", (self.products, self.location), {})
+        # another request is performing the lookup
+        cache.add(f"{key}:lock", True)
+
+        def other_request_finishes(seconds):
+            cache.set(key, [date(2024, 1, 15)])
+
+        with (
+            patch("openforms.appointments.cache.time.sleep", other_request_finishes),
+            patch.object(self.plugin, "get_dates") as m_get_dates,
+        ):
+            dates = availability.get_dates(self.products, self.location)
+
+        self.assertEqual(dates, [date(2024, 1, 15)])
+        m_get_dates.assert_not_called()
@@ -17,6 +17,7 @@ from openforms.payments.constants import PaymentStatus
 from openforms.payments.tests.factories import SubmissionPaymentFactory
 from openforms.submissions.constants import SUBMISSIONS_SESSION_KEY
 from openforms.submissions.models import Submission
+from openforms.submissions.ownership import get_session_set
 from openforms.submissions.tests.factories import (
     SubmissionFactory,
     SubmissionStepFactory,
@@ -62,7 +63,8 @@ class VerifyCancelAppointmentLinkViewTests(FrontendRedirectMixin, TestCase):
         )
         # Assert submission is stored in session
         self.assertIn(
-            str(submission.uuid), self.client.session[SUBMISSIONS_SESSION_KEY]
+            str(submission.uuid),
+            get_session_set(self.client.session, SUBMISSIONS_SESSION_KEY),
         )
 
     def test_403_response_with_unfound_submission(self):
@@ -170,7 +172,9 @@ class VerifyCancelAppointmentLinkViewTests(FrontendRedirectMixin, TestCase):
         self.assertRedirects(
             response, expected_redirect_url.url, fetch_redirect_response=False
         )
-        self.assertNotIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertFalse(
+            get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY)
+        )
 
     def test_after_successful_auth_redirects_to_form(self):
         submission = SubmissionFactory.create(
@@ -219,9 +223,10 @@ class VerifyCancelAppointmentLinkViewTests(FrontendRedirectMixin, TestCase):
             fetch_redirect_response=False,
         )
 
-        self.assertIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertTrue(get_session_set(self.client.session, SUBMISSIONS_SESSION_KEY))
         self.assertIn(
-            str(submission.uuid), self.client.session[SUBMISSIONS_SESSION_KEY]
+            str(submission.uuid),
+            get_session_set(self.client.session, SUBMISSIONS_SESSION_KEY),
         )
 
     def test_invalid_auth_plugin_raises_exception(self):
@@ -260,7 +265,9 @@ class VerifyCancelAppointmentLinkViewTests(FrontendRedirectMixin, TestCase):
         response = self.client.get(endpoint)
 
         self.assertEqual(403, response.status_code)
-        self.assertNotIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertFalse(
+            get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY)
+        )
 
     def test_invalid_auth_attribute_raises_exception(self):
         submission = SubmissionFactory.create(
@@ -299,7 +306,9 @@ class VerifyCancelAppointmentLinkViewTests(FrontendRedirectMixin, TestCase):
         response = self.client.get(endpoint)
 
         self.assertEqual(403, response.status_code)
-        self.assertNotIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertFalse(
+            get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY)
+        )
 
     def test_invalid_auth_value_raises_exception(self):
         submission = SubmissionFactory.create(
@@ -337,7 +346,9 @@ class VerifyCancelAppointmentLinkViewTests(FrontendRedirectMixin, TestCase):
         response = self.client.get(endpoint)
 
         self.assertEqual(403, response.status_code)
-        self.assertNotIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertFalse(
+            get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY)
+        )
 
 
 @freeze_time("2021-07-15T21:15:00Z")
@@ -411,11 +422,13 @@ class VerifyChangeAppointmentLinkViewTests(FrontendRedirectMixin, TestCase):
         self.assertEqual(Submission.objects.count(), 2)
         # Assert old submission not stored in session
         self.assertNotIn(
-            str(submission.uuid), self.client.session[SUBMISSIONS_SESSION_KEY]
+            str(submission.uuid),
+            get_session_set(self.client.session, SUBMISSIONS_SESSION_KEY),
         )
         # Assert new  submission is stored in session
         self.assertIn(
-            str(new_submission.uuid), self.client.session[SUBMISSIONS_SESSION_KEY]
+            str(new_submission.uuid),
+            get_session_set(self.client.session, SUBMISSIONS_SESSION_KEY),
         )
 
     def test_403_response_with_unfound_submission(self):
@@ -624,7 +637,9 @@ class VerifyChangeAppointmentLinkViewTests(FrontendRedirectMixin, TestCase):
         self.assertRedirects(
             response, expected_redirect_url.url, fetch_redirect_response=False
         )
-        self.assertNotIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertFalse(
+            get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY)
+        )
 
     def test_after_successful_auth_redirects_to_form(self):
         submission = SubmissionFactory.create(
@@ -678,9 +693,10 @@ class VerifyChangeAppointmentLinkViewTests(FrontendRedirectMixin, TestCase):
             fetch_redirect_response=False,
         )
 
-        self.assertIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertTrue(get_session_set(self.client.session, SUBMISSIONS_SESSION_KEY))
         self.assertIn(
-            str(new_submission.uuid), self.client.session[SUBMISSIONS_SESSION_KEY]
+            str(new_submission.uuid),
+            get_session_set(self.client.session, SUBMISSIONS_SESSION_KEY),
         )
 
     def test_invalid_auth_plugin_raises_exception(self):
@@ -720,7 +736,9 @@ class VerifyChangeAppointmentLinkViewTests(FrontendRedirectMixin, TestCase):
         response = self.client.get(endpoint)
 
         self.assertEqual(403, response.status_code)
-        self.assertNotIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertFalse(
+            get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY)
+        )
 
     def test_invalid_auth_attribute_raises_exception(self):
         submission = SubmissionFactory.create(
@@ -760,7 +778,9 @@ class VerifyChangeAppointmentLinkViewTests(FrontendRedirectMixin, TestCase):
         response = self.client.get(endpoint)
 
         self.assertEqual(403, response.status_code)
-        self.assertNotIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertFalse(
+            get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY)
+        )
 
     def test_invalid_auth_value_raises_exception(self):
         submission = SubmissionFactory.create(
@@ -799,7 +819,9 @@ class VerifyChangeAppointmentLinkViewTests(FrontendRedirectMixin, TestCase):
         response = self.client.get(endpoint)
 
         self.assertEqual(403, response.status_code)
-        self.assertNotIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertFalse(
+            get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY)
+        )
 
     def test_change_appointment_details_after_payment(self):
         submission = SubmissionFactory.from_components(
@@ -15,6 +15,7 @@ from openforms.logging import logevent
 from openforms.submissions.models import Submission
 
 from .base import BasePlugin, Customer, Location, Product
+from .cache import invalidate_availability
 from .constants import AppointmentDetailsStatus
 from .exceptions import (
     AppointmentCreateFailed,
@@ -149,6 +150,7 @@ def book_appointment_for_submission(submission: Submission) -> None:
         appointment_id = plugin.create_appointment(
             [product], location, start_at, appointment_client
         )
+        invalidate_availability(plugin)
         appointment_info = AppointmentInfo.objects.create(
             status=AppointmentDetailsStatus.success,
             appointment_id=appointment_id,
@@ -244,6 +246,7 @@ def delete_appointment_for_submission(submission: Submission, plugin=None) -> No
 
     try:
         plugin.delete_appointment(appointment_info.appointment_id)
+        invalidate_availability(plugin)
         appointment_info.cancel()
     except AppointmentDeleteFailed as e:
         logevent.appointment_cancel_failure(appointment_info, plugin, e)
@@ -591,8 +591,46 @@ FORMS_EXPORT_REMOVED_AFTER_DAYS = config("FORMS_EXPORT_REMOVED_AFTER_DAYS", defa
 # :mod:`openforms.setup`. Value is in seconds.
 DEFAULT_TIMEOUT_REQUESTS = config("DEFAULT_TIMEOUT_REQUESTS", default=10.0)
 
+# Maximum number of concurrent requests when resolving the service fetch actions of a
+# logic evaluation pass.
+SERVICE_FETCH_MAX_WORKERS = config("SERVICE_FETCH_MAX_WORKERS", default=4)
+
+# Maximum number of attachments uploaded concurrently by the registration backends.
+REGISTRATION_ATTACHMENT_UPLOAD_MAX_WORKERS = config(
+    "REGISTRATION_ATTACHMENT_UPLOAD_MAX_WORKERS", default=4
+)
+
 MAX_FILE_UPLOAD_SIZE = config("MAX_FILE_UPLOAD_SIZE", default="50M", cast=Filesize())
 
+# Documents of at least this size are base64 encoded while they are being sent to the
+# Documenten API/StUF-ZDS, rather than encoding them in memory upfront.
+DOCUMENT_UPLOAD_STREAMING_THRESHOLD = config(
+    "DOCUMENT_UPLOAD_STREAMING_THRESHOLD", default="1M", cast=Filesize()
+)
+
+# Submissions are deleted/anonymized in batches of this size by the data removal
+# tasks, pausing for the configured number of seconds in between batches.
+DATA_REMOVAL_BATCH_SIZE = config("DATA_REMOVAL_BATCH_SIZE", default=500)
+DATA_REMOVAL_BATCH_DELAY = config("DATA_REMOVAL_BATCH_DELAY", default=0.5)
+
+# How long the WSDL/XSD documents of the (shared) SOAP clients are cached, in seconds.
+SOAP_WSDL_CACHE_TIMEOUT = config("SOAP_WSDL_CACHE_TIMEOUT", default=60 * 60 * 24)
+
+# Number of parsed user-contributed templates (see openforms.template) kept in memory,
+# per process. Templates with a source larger than the max size are not cached.
+TEMPLATE_CACHE_SIZE = config("TEMPLATE_CACHE_SIZE", default=1000)
+TEMPLATE_CACHE_MAX_SOURCE_SIZE = config(
+    "TEMPLATE_CACHE_MAX_SOURCE_SIZE", default=100_000
+)
+
+# Number of bytes of static/media assets (stylesheets, fonts, images...) used in PDFs
+# kept in memory, per process.
+PDF_ASSET_CACHE_SIZE = config("PDF_ASSET_CACHE_SIZE", default=32 * 1024 * 1024)
+
+# Audit log events that are written out-of-band by a Celery task, rather than in the
+# request or task producing them.
+AUDITLOG_QUEUED_EVENTS = config("AUDITLOG_QUEUED_EVENTS", split=True, default=[])
+
 # Deal with being hosted on a subpath
 SUBPATH = config("SUBPATH", default="")
 if SUBPATH:
@@ -742,6 +780,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "openforms.forms.tasks.deactivate_forms",
         "schedule": crontab(minute="*"),
     },
+    "fold-form-statistics": {
+        "task": "openforms.forms.tasks.fold_form_statistics",
+        "schedule": crontab(minute="*/5"),
+    },
     "cleanup-outgoing-request-logs": {
         "task": "log_outgoing_requests.tasks.prune_logs",
         "schedule": crontab(hour=0, minute=0, day_of_week="*"),
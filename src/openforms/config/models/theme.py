@@ -1,3 +1,5 @@
+import hashlib
+import json
 import uuid as _uuid
 
 from django.core.validators import FileExtensionValidator, RegexValidator
@@ -142,3 +144,25 @@ class Theme(models.Model):
             urls.append(self.stylesheet_file.url)
 
         return urls
+
+    def get_stylesheets_digest(self) -> str:
+        """
+        Get a digest of the styles (and thus the fonts) applied by the theme.
+
+        The digest changes when the stylesheets or the design tokens are changed,
+        including replacing the contents of the uploaded stylesheet.
+        """
+        styles = {
+            "stylesheets": self.get_stylesheets(),
+            "design_token_values": self.design_token_values,
+        }
+        if self.stylesheet_file:
+            storage = self.stylesheet_file.storage
+            try:
+                modified = storage.get_modified_time(self.stylesheet_file.name)
+            except (OSError, NotImplementedError):
+                pass
+            else:
+                styles["stylesheet_file_modified"] = modified.isoformat()
+        serialized = json.dumps(styles, sort_keys=True)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
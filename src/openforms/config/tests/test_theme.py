@@ -1,9 +1,10 @@
+import os
 import shutil
 import tempfile
 from pathlib import Path
 
 from django.conf import settings
-from django.test import override_settings
+from django.test import SimpleTestCase, override_settings
 from django.urls import reverse
 
 from django_webtest import WebTest
@@ -13,6 +14,7 @@ from webtest import Upload
 from openforms.accounts.tests.factories import SuperUserFactory
 from openforms.forms.tests.factories import FormFactory
 
+from ..models import Theme
 from .factories import ThemeFactory
 
 LOGO_FILE = Path(settings.BASE_DIR) / "docs" / "logo.svg"
@@ -122,3 +124,45 @@ class AdminTests(WebTest):
         self.assertEqual(response.status_code, 302)
         theme.refresh_from_db()
         self.assertEqual(theme.stylesheet_file, "config/themes/my-theme.css")
+
+
+class ThemeStylesheetsDigestTests(SimpleTestCase):
+    def test_digest_changes_with_the_styles(self):
+        theme = Theme(stylesheet="https://example.com/theme.css")
+        digest = theme.get_stylesheets_digest()
+
+        self.assertEqual(
+            Theme(stylesheet="https://example.com/theme.css").get_stylesheets_digest(),
+            digest,
+        )
+
+        with self.subTest("stylesheet URL"):
+            other = Theme(stylesheet="https://example.com/other.css")
+
+            self.assertNotEqual(other.get_stylesheets_digest(), digest)
+
+        with self.subTest("design tokens"):
+            other = Theme(
+                stylesheet="https://example.com/theme.css",
+                design_token_values={"of": {"typography": {"sans-serif": "Arial"}}},
+            )
+
+            self.assertNotEqual(other.get_stylesheets_digest(), digest)
+
+    def test_digest_changes_when_uploaded_stylesheet_is_replaced(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        stylesheet = Path(media_root.name) / "theme.css"
+        stylesheet.write_text("body { font-family: Foo; }")
+
+        with override_settings(MEDIA_ROOT=media_root.name):
+            theme = Theme(stylesheet_file="theme.css")
+            digest = theme.get_stylesheets_digest()
+
+            stylesheet.write_text("body { font-family: Bar; }")
+            stat = stylesheet.stat()
+            os.utime(
+                stylesheet, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000)
+            )
+
+            self.assertNotEqual(theme.get_stylesheets_digest(), digest)
@@ -1,3 +1,4 @@
+import json
 from base64 import b64encode
 from typing import BinaryIO, Literal, TypeAlias
 
@@ -6,6 +7,7 @@ from django.core.files.base import ContentFile
 from zgw_consumers.nlx import NLXClient
 
 from openforms.translations.utils import to_iso639_2b
+from openforms.utils.streaming import Base64Content, Base64StreamingBody, should_stream
 
 from .utils import get_today
 
@@ -34,8 +36,15 @@ class DocumentenClient(NLXClient):
     ):
         assert author, "author must be a non-empty string"
         today = get_today()
-        file_content = content.read()
-        base64_body = b64encode(file_content).decode()
+        size = getattr(content, "size", None)
+        stream_content = should_stream(size)
+        if stream_content:
+            base64_content = Base64Content(file=content, size=size)
+            base64_body = base64_content.marker
+        else:
+            file_content = content.read()
+            base64_body = b64encode(file_content).decode()
+            size = len(file_content) if size is None else size
         data = {
             "informatieobjecttype": informatieobjecttype,
             "bronorganisatie": bronorganisatie,
@@ -49,15 +58,20 @@ class DocumentenClient(NLXClient):
             "bestandsnaam": filename,
             "beschrijving": description,
             "indicatieGebruiksrecht": False,
-            "bestandsomvang": (
-                content.size if hasattr(content, "size") else len(file_content)
-            ),
+            "bestandsomvang": size,
         }
 
         if vertrouwelijkheidaanduiding:
             data["vertrouwelijkheidaanduiding"] = vertrouwelijkheidaanduiding
 
-        response = self.post("enkelvoudiginformatieobjecten", json=data)
+        if stream_content:
+            response = self.post(
+                "enkelvoudiginformatieobjecten",
+                data=Base64StreamingBody(json.dumps(data), base64_content),
+                headers={"Content-Type": "application/json"},
+            )
+        else:
+            response = self.post("enkelvoudiginformatieobjecten", json=data)
         response.raise_for_status()
 
         return response.json()
@@ -0,0 +1,67 @@
+import base64
+import json
+
+from django.core.files.base import ContentFile
+from django.test import SimpleTestCase, override_settings
+
+import requests_mock
+
+from ..clients.documenten import DocumentenClient
+
+
+@requests_mock.Mocker()
+class CreateDocumentTests(SimpleTestCase):
+    def _create_document(self, content: ContentFile) -> dict:
+        client = DocumentenClient(base_url="https://documenten.nl/api/v1/")
+        return client.create_document(
+            informatieobjecttype="https://catalogi.nl/api/v1/informatieobjecttypen/1",
+            bronorganisatie="000000000",
+            title="Attachment",
+            author="Aanvrager",
+            language="nl",
+            format="text/plain",
+            content=content,
+            status="definitief",
+            filename="attachment.txt",
+        )
+
+    @override_settings(DOCUMENT_UPLOAD_STREAMING_THRESHOLD=1024)
+    def test_small_documents_are_encoded_in_memory(self, m):
+        m.post(
+            "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten",
+            status_code=201,
+            json={
+                "url": "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/1"
+            },
+        )
+
+        self._create_document(ContentFile(b"small", name="attachment.txt"))
+
+        data = m.last_request.json()
+        self.assertEqual(base64.b64decode(data["inhoud"]), b"small")
+        self.assertEqual(data["bestandsomvang"], 5)
+
+    @override_settings(DOCUMENT_UPLOAD_STREAMING_THRESHOLD=1024)
+    def test_large_documents_are_streamed(self, m):
+        m.post(
+            "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten",
+            status_code=201,
+            json={
+                "url": "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/1"
+            },
+        )
+        raw = b"a" * 100_000
+
+        result = self._create_document(ContentFile(raw, name="attachment.txt"))
+
+        self.assertEqual(
+            result["url"],
+            "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/1",
+        )
+        request = m.last_request
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        self.assertEqual(int(request.headers["Content-Length"]), len(request.body))
+        data = json.loads(request.body.read())
+        self.assertEqual(base64.b64decode(data["inhoud"]), raw)
+        self.assertEqual(data["bestandsomvang"], 100_000)
+        self.assertEqual(data["bestandsnaam"], "attachment.txt")
@@ -0,0 +1,128 @@
+"""
+Process (large numbers of) submissions in batches.
+
+Deleting or anonymizing all the submissions of a category in one go holds locks on
+large parts of the submission tables for a long time (the deletes cascade through the
+steps, variables, attachments...) and causes replication lag. Instead, the submissions
+are processed in batches ordered by primary key, each in their own transaction, with a
+(configurable) pause in between batches.
+
+After every batch, the primary key of the last processed submission is recorded as
+checkpoint. If the processing is interrupted (e.g. the worker crashed or the time
+budget of the task ran out), the next run resumes from the checkpoint rather than
+scanning the already processed range again.
+"""
+
+import logging
+import time
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import QuerySet
+
+import elasticapm
+
+from openforms.submissions.models import Submission
+
+__all__ = ["process_in_batches"]
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_TIMEOUT = 60 * 60 * 48
+
+BatchProcessor = Callable[[list[int]], dict[str, int]]
+
+
+def _get_checkpoint_key(name: str) -> str:
+    return f"data-removal:checkpoint:{name}"
+
+
+def process_in_batches(
+    queryset: QuerySet[Submission],
+    name: str,
+    process_batch: BatchProcessor,
+    deadline: float | None = None,
+) -> bool:
+    """
+    Process the submissions in the queryset in batches.
+
+    :param queryset: the submissions to process. Submissions that are processed must
+      drop out of the queryset (e.g. because they are deleted).
+    :param name: identifies the checkpoint, and is used in the logs.
+    :param process_batch: callback processing the submissions with the given primary
+      keys, returning the number of processed objects per model.
+    :param deadline: :func:`time.monotonic` value after which no new batches are
+      started.
+    :return: whether all submissions were processed.
+    """
+    batch_size = settings.DATA_REMOVAL_BATCH_SIZE
+    checkpoint_key = _get_checkpoint_key(name)
+    last_pk = cache.get(checkpoint_key, 0)
+    if last_pk:
+        logger.info("Resuming %s after submission %s", name, last_pk)
+
+    batch_number = 0
+    while True:
+        if deadline is not None and time.monotonic() > deadline:
+            logger.info("Time budget exhausted, interrupting %s", name)
+            return False
+
+        pks = list(
+            queryset.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not pks:
+            break
+
+        batch_number += 1
+        start = time.monotonic()
+        with (
+            elasticapm.capture_span(
+                name, span_type="app.data_removal", labels={"batch": batch_number}
+            ),
+            transaction.atomic(),
+        ):
+            counts = process_batch(pks)
+        last_pk = pks[-1]
+        cache.set(checkpoint_key, last_pk, timeout=CHECKPOINT_TIMEOUT)
+
+        logger.info(
+            "Processed batch %d of %s (%d submissions, up to %s) in %.2fs: %r",
+            batch_number,
+            name,
+            len(pks),
+            last_pk,
+            time.monotonic() - start,
+            counts,
+            extra={
+                "batch": batch_number,
+                "batch_size": len(pks),
+                "last_pk": last_pk,
+                "counts": counts,
+            },
+        )
+
+        if len(pks) < batch_size:
+            break
+        # give the database (and its replicas) some room to breathe
+        time.sleep(settings.DATA_REMOVAL_BATCH_DELAY)
+
+    cache.delete(checkpoint_key)
+    return True
+
+
+def delete_batch(pks: list[int]) -> dict[str, int]:
+    _, counts = Submission.objects.filter(pk__in=pks).delete()
+    return counts
+
+
+def anonymize_batch(pks: list[int]) -> dict[str, int]:
+    num_submissions = 0
+    submissions = Submission.objects.filter(pk__in=pks).select_related("auth_info")
+    for submission in submissions.iterator():
+        submission.remove_sensitive_data()
+        num_submissions += 1
+    return {Submission._meta.label: num_submissions}
@@ -1,21 +1,29 @@
-import itertools
 import logging
+import time
 from datetime import timedelta
 
+from django.conf import settings
 from django.db.models import F
 
 from openforms.celery import app
 from openforms.submissions.constants import RegistrationStatuses
 from openforms.submissions.models import Submission
 
+from .batching import anonymize_batch, delete_batch, process_in_batches
 from .constants import RemovalMethods
 
 logger = logging.getLogger(__name__)
 
 
+def _get_deadline() -> float:
+    # leave some room to finish the current batch before the soft time limit
+    return time.monotonic() + settings.CELERY_TASK_SOFT_TIME_LIMIT * 0.8
+
+
 @app.task(ignore_result=True)
 def delete_submissions():
     logger.debug("Deleting submissions")
+    deadline = _get_deadline()
 
     successful_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "successful_submissions_removal_limit",
@@ -25,10 +33,6 @@ def delete_submissions():
         removal_method=RemovalMethods.delete_permanently,
         time_since_creation__gt=(timedelta(days=1) * F("removal_limit")),
     )
-    logger.info(
-        "Deleting %s successful submissions", successful_submissions_to_delete.count()
-    )
-    successful_submissions_to_delete.delete()
 
     incomplete_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "incomplete_submissions_removal_limit",
@@ -41,10 +45,6 @@ def delete_submissions():
         removal_method=RemovalMethods.delete_permanently,
         time_since_creation__gt=(timedelta(days=1) * F("removal_limit")),
     )
-    logger.info(
-        "Deleting %s incomplete submissions", incomplete_submissions_to_delete.count()
-    )
-    incomplete_submissions_to_delete.delete()
 
     errored_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "errored_submissions_removal_limit",
@@ -55,26 +55,30 @@ def delete_submissions():
         time_since_creation__gt=(timedelta(days=1) * F("removal_limit")),
     )
 
-    logger.info(
-        "Deleting %s errored submissions", errored_submissions_to_delete.count()
-    )
-    errored_submissions_to_delete.delete()
-
     other_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "all_submissions_removal_limit"
     ).filter(
         time_since_creation__gt=(timedelta(days=1) * F("removal_limit")),
     )
-    logger.info(
-        "Deleting %s other submissions regardless of registration",
-        other_submissions_to_delete.count(),
+
+    categories = (
+        ("delete:successful", successful_submissions_to_delete),
+        ("delete:incomplete", incomplete_submissions_to_delete),
+        ("delete:errored", errored_submissions_to_delete),
+        ("delete:other", other_submissions_to_delete),
     )
-    other_submissions_to_delete.delete()
+    for name, queryset in categories:
+        logger.info("Deleting submissions (%s)", name)
+        if not process_in_batches(queryset, name, delete_batch, deadline=deadline):
+            # continue where we left off in a fresh task
+            delete_submissions.delay()
+            return
 
 
 @app.task(ignore_result=True)
 def make_sensitive_data_anonymous() -> None:
     logger.debug("Making sensitive submission data anonymous")
+    deadline = _get_deadline()
 
     successful_submissions = Submission.objects.annotate_removal_fields(
         "successful_submissions_removal_limit",
@@ -109,22 +113,14 @@ def make_sensitive_data_anonymous() -> None:
         _is_cleaned=False,
     )
 
-    logger.info(
-        "Anonymizing %s successful submissions",
-        successful_submissions.count(),
-    )
-    logger.info(
-        "anonymizing %s incomplete submissions",
-        incomplete_submissions.count(),
+    categories = (
+        ("anonymize:successful", successful_submissions),
+        ("anonymize:incomplete", incomplete_submissions),
+        ("anonymize:errored", errored_submissions),
     )
-    logger.info(
-        "anonymizing %s errored submissions",
-        errored_submissions.count(),
-    )
-
-    for submission in itertools.chain(
-        successful_submissions.iterator(),
-        incomplete_submissions.iterator(),
-        errored_submissions.iterator(),
-    ):
-        submission.remove_sensitive_data()
+    for name, queryset in categories:
+        logger.info("Anonymizing submissions (%s)", name)
+        if not process_in_batches(queryset, name, anonymize_batch, deadline=deadline):
+            # continue where we left off in a fresh task
+            make_sensitive_data_anonymous.delay()
+            return
@@ -1,12 +1,15 @@
 from datetime import timedelta
+from unittest.mock import patch
 
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
-from django.test import TestCase, tag
+from django.test import TestCase, override_settings, tag
 from django.utils import timezone
 
 from freezegun import freeze_time
 
 from openforms.config.models import GlobalConfiguration
+from openforms.forms.models import Form
 from openforms.forms.models.form_step import FormStep
 from openforms.forms.tests.factories import (
     FormDefinitionFactory,
@@ -22,7 +25,9 @@ from openforms.submissions.tests.factories import (
     SubmissionFactory,
     SubmissionStepFactory,
 )
+from openforms.utils.tests.cache import clear_caches
 
+from ..batching import delete_batch, process_in_batches
 from ..constants import RemovalMethods
 from ..tasks import delete_submissions, make_sensitive_data_anonymous
 
@@ -1311,3 +1316,84 @@ class MakeSensitiveDataAnonymousTask(TestCase):
                 "This is also not sensitive",
             )
             self.assertTrue(submission_to_be_anonymous._is_cleaned)
+
+
+@override_settings(DATA_REMOVAL_BATCH_SIZE=2, DATA_REMOVAL_BATCH_DELAY=0.1)
+class BatchedRemovalTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(clear_caches)
+
+        patcher = patch("openforms.data_removal.batching.time")
+        self.m_time = patcher.start()
+        self.m_time.monotonic.return_value = 0.0
+        self.addCleanup(patcher.stop)
+
+    def _create_old_submissions(self, num: int) -> list[Submission]:
+        config = GlobalConfiguration.get_solo()
+        submissions = SubmissionFactory.create_batch(num, registration_success=True)
+        Submission.objects.filter(pk__in=[s.pk for s in submissions]).update(
+            created_on=timezone.now()
+            - timedelta(days=config.successful_submissions_removal_limit + 1)
+        )
+        return submissions
+
+    def test_submissions_are_deleted_in_batches(self):
+        self._create_old_submissions(5)
+
+        with patch(
+            "openforms.data_removal.tasks.delete_batch", wraps=delete_batch
+        ) as m_delete_batch:
+            delete_submissions()
+
+        self.assertFalse(Submission.objects.exists())
+        self.assertEqual(
+            [len(call.args[0]) for call in m_delete_batch.call_args_list], [2, 2, 1]
+        )
+        # pause in between batches only
+        self.assertEqual(self.m_time.sleep.call_count, 2)
+        self.m_time.sleep.assert_called_with(0.1)
+
+    def test_removal_resumes_from_checkpoint(self):
+        submissions = self._create_old_submissions(3)
+        queryset = Submission.objects.all()
+        # a previous run got interrupted after processing the first submission
+        cache.set("data-removal:checkpoint:test", submissions[0].pk)
+
+        completed = process_in_batches(queryset, "test", delete_batch)
+
+        self.assertTrue(completed)
+        self.assertEqual(list(Submission.objects.all()), [submissions[0]])
+        self.assertIsNone(cache.get("data-removal:checkpoint:test"))
+
+    def test_removal_interrupted_when_time_budget_is_exhausted(self):
+        submissions = self._create_old_submissions(3)
+        # the time budget runs out during the first batch
+        self.m_time.monotonic.side_effect = [0.0, 0.0, 0.0, 100.0]
+
+        completed = process_in_batches(
+            Submission.objects.all(), "test", delete_batch, deadline=60.0
+        )
+
+        self.assertFalse(completed)
+        self.assertEqual(list(Submission.objects.all()), [submissions[2]])
+        self.assertEqual(cache.get("data-removal:checkpoint:test"), submissions[1].pk)
+
+    @patch("openforms.data_removal.tasks.process_in_batches", return_value=False)
+    def test_task_continues_in_new_task_when_interrupted(self, m_process_in_batches):
+        with patch("openforms.data_removal.tasks.delete_submissions.delay") as m_delay:
+            delete_submissions()
+
+        m_process_in_batches.assert_called_once()
+        m_delay.assert_called_once_with()
+
+    def test_submissions_are_anonymized_in_batches(self):
+        submissions = self._create_old_submissions(3)
+        Form.objects.filter(
+            pk__in=[submission.form_id for submission in submissions]
+        ).update(successful_submissions_removal_method=RemovalMethods.make_anonymous)
+
+        make_sensitive_data_anonymous()
+
+        self.assertEqual(Submission.objects.filter(_is_cleaned=True).count(), 3)
+        self.assertEqual(self.m_time.sleep.call_count, 1)
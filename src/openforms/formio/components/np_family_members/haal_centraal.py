@@ -1,5 +1,6 @@
 from openforms.contrib.haal_centraal.clients import get_brp_client
 from openforms.contrib.haal_centraal.clients.brp import Person
+from openforms.submissions.lookup_cache import cached_lookup
 from openforms.submissions.models import Submission
 
 
@@ -10,15 +11,29 @@ def get_np_family_members_haal_centraal(
     submission: Submission | None = None,
 ) -> list[tuple[str, str]]:
     # TODO: add tests for missing configuration and error handling!
-    with get_brp_client(submission) as client:
-        family_data = client.get_family_members(bsn, include_children, include_partners)
+    def get_family_members() -> list[tuple[str, str]]:
+        with get_brp_client(submission) as client:
+            family_data = client.get_family_members(
+                bsn, include_children, include_partners
+            )
+        return [
+            (family_member.bsn, get_np_name(family_member))
+            for family_member in family_data
+            if bsn
+        ]
 
-    family_member_choices = [
-        (family_member.bsn, get_np_name(family_member))
-        for family_member in family_data
-        if bsn
-    ]
-    return family_member_choices
+    family_member_choices = cached_lookup(
+        submission,
+        "haal-centraal:family-members",
+        {
+            "bsn": bsn,
+            "include_children": include_children,
+            "include_partners": include_partners,
+        },
+        get_family_members,
+    )
+    # the cached choices are deserialized from JSON
+    return [tuple(choice) for choice in family_member_choices]
 
 
 def get_np_name(person: Person) -> str:
@@ -1,3 +1,4 @@
+from openforms.submissions.lookup_cache import cached_lookup
 from openforms.submissions.models import Submission
 from stuf.stuf_bg.client import get_client
 
@@ -15,8 +16,14 @@ def get_np_family_members_stuf_bg(
     if include_partners:
         attributes.append("inp.heeftAlsEchtgenootPartner")
 
-    with get_client() as client:
-        data = client.get_values(bsn, attributes)
+    def get_values() -> dict:
+        with get_client() as client:
+            return client.get_values(bsn, attributes)
+
+    # shared with the StUF-BG prefill plugin
+    data = cached_lookup(
+        submission, "stuf-bg:values", {"bsn": bsn, "attributes": attributes}, get_values
+    )
 
     # Kids
     family_members = []
@@ -1,26 +1,163 @@
+import hashlib
+import json
 import re
-from collections import UserDict
-from collections.abc import Hashable
-from typing import Iterator, cast
+from collections import UserDict, defaultdict
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from typing import Iterator, NamedTuple, cast
 
 from glom import PathAccessError, assign, glom
 
 from openforms.typing import DataMapping, JSONObject, JSONValue
+from openforms.utils.cache import LRUCache
 
 from .typing import Component
-from .utils import flatten_by_path, is_visible_in_frontend, iter_components
+from .utils import flatten_by_path, is_visible_in_frontend
 
 # TODO: mechanism to wrap/mark root components?
 
 RE_PATH = re.compile(r"(components|columns|rows)\.([0-9]+)")
 
+PathBits = tuple[str | int, ...]
+
+
+def _to_path_bits(path: str) -> PathBits:
+    return tuple(int(bit) if bit.isdigit() else bit for bit in path.split("."))
+
+
+def _resolve(configuration: JSONObject, bits: PathBits):
+    node = configuration
+    for bit in bits:
+        node = node[bit]
+    return node
+
+
+def _iter_components_with_path_bits(
+    configuration: JSONObject, prefix: PathBits = ()
+) -> Iterator[tuple[Component, PathBits]]:
+    # mirrors :func:`openforms.formio.utils.iter_components`, but tracks the location
+    components = configuration.get("components", [])
+    if configuration.get("type") == "columns":
+        assert not components, "Both nested components and columns found"
+        for col_index, column in enumerate(configuration["columns"]):
+            yield from _iter_components_with_path_bits(
+                column, prefix=(*prefix, "columns", col_index)
+            )
+
+    for index, component in enumerate(components):
+        bits = (*prefix, "components", index)
+        yield component, bits
+        yield from _iter_components_with_path_bits(component, prefix=bits)
+
+
+class VisibilityNode(NamedTuple):
+    # location relative to the parent node (or the root)
+    relative_path: PathBits
+    parent: int | None
+    # component key, if the node is a component
+    key: str | None
+
+
+@dataclass(frozen=True)
+class ConfigurationIndex:
+    """
+    Immutable, precomputed structure of a Formio configuration.
+
+    The index only holds the *locations* of components within the configuration, so
+    it can be shared between (processing of) configurations with the same content
+    without sharing the (mutable) configuration itself.
+
+    Treat the containers as read-only, they are shared between threads.
+    """
+
+    # depth-first ordered component key -> location in the configuration
+    component_paths: dict[str, PathBits]
+    # configuration path -> location in the configuration
+    flattened_paths: dict[str, PathBits]
+    # component key -> configuration path
+    reverse_flattened: dict[str, str]
+    # depth-first (pre-order) table of the nodes relevant for visibility checks - the
+    # parents always precede their children
+    visibility_nodes: tuple[VisibilityNode, ...]
+    # component key -> index in the visibility nodes table
+    visibility_node_indices: dict[str, int]
+
+    @classmethod
+    def from_configuration(cls, configuration: JSONObject) -> "ConfigurationIndex":
+        component_paths = {
+            component["key"]: bits
+            for component, bits in _iter_components_with_path_bits(configuration)
+        }
+        flattened = flatten_by_path(configuration)
+        reverse_flattened = {
+            component["key"]: path for path, component in flattened.items()
+        }
+
+        # Every component and every node in between (like columns) can hide its
+        # descendants. Build a parent-pointer table of these nodes.
+        visibility_nodes: list[VisibilityNode] = []
+        node_indices: dict[str, int] = {}  # configuration path -> node index
+        for config_path, component in flattened.items():
+            path_bits = [".".join(bit) for bit in RE_PATH.findall(config_path)]
+            parent = None
+            for depth in range(len(path_bits)):
+                node_path = ".".join(path_bits[: depth + 1])
+                if node_path not in node_indices:
+                    node_indices[node_path] = len(visibility_nodes)
+                    visibility_nodes.append(
+                        VisibilityNode(
+                            relative_path=_to_path_bits(path_bits[depth]),
+                            parent=parent,
+                            key=None,
+                        )
+                    )
+                parent = node_indices[node_path]
+            if parent is not None:
+                node = visibility_nodes[parent]
+                visibility_nodes[parent] = node._replace(key=component["key"])
+
+        return cls(
+            component_paths=component_paths,
+            flattened_paths={path: _to_path_bits(path) for path in flattened},
+            reverse_flattened=reverse_flattened,
+            visibility_nodes=tuple(visibility_nodes),
+            visibility_node_indices={
+                key: node_indices[config_path]
+                for key, config_path in reverse_flattened.items()
+            },
+        )
+
+
+_index_cache: LRUCache[str, ConfigurationIndex] = LRUCache(maxsize=512)
+
+
+def get_configuration_index(configuration: JSONObject) -> ConfigurationIndex:
+    """
+    Get the (process-level cached) index for a Formio configuration.
+
+    The cache is keyed by a digest of the configuration content, so identical
+    configurations (e.g. the same form definition loaded in different requests) share
+    the index.
+    """
+    try:
+        serialized = json.dumps(configuration, sort_keys=True)
+    except (TypeError, ValueError):  # not plain JSON (anymore), don't cache
+        return ConfigurationIndex.from_configuration(configuration)
+    digest = hashlib.md5(serialized.encode("utf-8")).hexdigest()
+    return _index_cache.get_or_set(
+        digest, lambda: ConfigurationIndex.from_configuration(configuration)
+    )
+
 
 class FormioConfigurationWrapper:
     """
     Wrap around the Formio configuration dictionary for further processing.
 
     This datastructure caches the internal datastructure to optimize mutations of the
-    formio configuration.
+    formio configuration. The (expensive) traversal of the configuration tree is done
+    once per distinct configuration and shared through the
+    :class:`ConfigurationIndex`, the wrapper only resolves the component locations
+    in its own configuration instance.
     """
 
     _configuration: JSONObject
@@ -28,16 +165,24 @@ class FormioConfigurationWrapper:
     _cached_component_map: dict[str, Component] | None = None
     _flattened_by_path: None | dict[str, Component] = None
     _reverse_flattened: None | dict[str, str] = None
+    _index: ConfigurationIndex | None = None
+    _resolved_visibility_nodes: list[JSONObject] | None = None
 
     def __init__(self, configuration: JSONObject):
         self._configuration = configuration
 
+    @property
+    def index(self) -> ConfigurationIndex:
+        if self._index is None:
+            self._index = get_configuration_index(self.configuration)
+        return self._index
+
     @property
     def component_map(self) -> dict[str, Component]:
         if self._cached_component_map is None:
             self._cached_component_map = {
-                component["key"]: component
-                for component in iter_components(self.configuration, recursive=True)
+                key: _resolve(self.configuration, bits)
+                for key, bits in self.index.component_paths.items()
             }
         return self._cached_component_map
 
@@ -56,6 +201,11 @@ class FormioConfigurationWrapper:
     ) -> "FormioConfigurationWrapper":
         self._configuration["components"] += other_wrapper._configuration["components"]
         self.component_map.update(other_wrapper.component_map)
+        # the structure changed, the index (if already calculated) no longer applies
+        self._index = None
+        self._flattened_by_path = None
+        self._reverse_flattened = None
+        self._resolved_visibility_nodes = None
         return self
 
     @property
@@ -65,27 +215,120 @@ class FormioConfigurationWrapper:
     @property
     def flattened_by_path(self) -> dict[str, Component]:
         if self._flattened_by_path is None:
-            self._flattened_by_path = flatten_by_path(self.configuration)
+            self._flattened_by_path = {
+                path: _resolve(self.configuration, bits)
+                for path, bits in self.index.flattened_paths.items()
+            }
         return self._flattened_by_path
 
     @property
     def reverse_flattened(self) -> dict[str, str]:
         if self._reverse_flattened is None:
-            self._reverse_flattened = {
-                component["key"]: path
-                for path, component in self.flattened_by_path.items()
-            }
+            self._reverse_flattened = dict(self.index.reverse_flattened)
         return self._reverse_flattened
 
+    @property
+    def _visibility_nodes(self) -> list[Component]:
+        if self._resolved_visibility_nodes is None:
+            nodes = []
+            for node_meta in self.index.visibility_nodes:
+                parent = (
+                    self.configuration
+                    if node_meta.parent is None
+                    else nodes[node_meta.parent]
+                )
+                nodes.append(_resolve(parent, node_meta.relative_path))
+            self._resolved_visibility_nodes = nodes
+        return self._resolved_visibility_nodes
+
     def is_visible_in_frontend(self, key: str, values: DataMapping) -> bool:
-        config_path = self.reverse_flattened[key]
-        path_bits = [".".join(bit) for bit in RE_PATH.findall(config_path)]
-        nodes = []  # leftmost is root, rightmost is leaf
-        for depth in range(len(path_bits)):
-            path = ".".join(path_bits[: depth + 1])
-            component = cast(Component, glom(self.configuration, path))
-            nodes.append(component)
-        return all(is_visible_in_frontend(node, values) for node in nodes)
+        """
+        Check if the component is visible, taking the parent components into account.
+        """
+        index = self.index
+        nodes = self._visibility_nodes
+        node_index = index.visibility_node_indices[key]
+        # walk up the parent pointers, from leaf to root
+        while node_index is not None:
+            if not is_visible_in_frontend(cast(Component, nodes[node_index]), values):
+                return False
+            node_index = index.visibility_nodes[node_index].parent
+        return True
+
+    def get_visibility(self, values: DataMapping) -> "ComponentVisibility":
+        """
+        Determine the visibility of all components in a single top-down pass.
+
+        Equivalent to calling :meth:`is_visible_in_frontend` for every component, but
+        every node is checked at most once and the descendants of hidden nodes are not
+        checked at all.
+
+        :returns: mapping of component key to visibility, which can be updated when
+          values change, see :meth:`ComponentVisibility.recompute`.
+        """
+        return ComponentVisibility(self, values)
+
+
+class ComponentVisibility(Mapping[str, bool]):
+    """
+    The visibility of the components of a configuration, by component key.
+    """
+
+    def __init__(self, wrapper: FormioConfigurationWrapper, values: DataMapping):
+        self._index = wrapper.index
+        self._nodes = wrapper._visibility_nodes
+        num_nodes = len(self._nodes)
+
+        # the conditionals are read from the (live) configuration, as logic can change
+        # them
+        self._dependents: defaultdict[str, list[int]] = defaultdict(list)
+        # the table is in pre-order, so the descendants of a node directly follow it
+        self._subtree_ends = list(range(1, num_nodes + 1))
+        for node_index, node in enumerate(self._nodes):
+            conditional = node.get("conditional") or {}
+            if trigger_key := conditional.get("when"):
+                self._dependents[trigger_key].append(node_index)
+        for node_index in reversed(range(num_nodes)):
+            if (parent := self._index.visibility_nodes[node_index].parent) is not None:
+                self._subtree_ends[parent] = max(
+                    self._subtree_ends[parent], self._subtree_ends[node_index]
+                )
+
+        self._visible_nodes: list[bool] = [False] * num_nodes
+        self._visibility: dict[str, bool] = {}
+        self._check_nodes(0, num_nodes, values)
+
+    def __getitem__(self, key: str) -> bool:
+        return self._visibility[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._visibility)
+
+    def __len__(self) -> int:
+        return len(self._visibility)
+
+    def _check_nodes(self, start: int, end: int, values: DataMapping) -> None:
+        for node_index in range(start, end):
+            node_meta = self._index.visibility_nodes[node_index]
+            parent_visible = (
+                node_meta.parent is None or self._visible_nodes[node_meta.parent]
+            )
+            is_visible = parent_visible and is_visible_in_frontend(
+                cast(Component, self._nodes[node_index]), values
+            )
+            self._visible_nodes[node_index] = is_visible
+            if node_meta.key is not None:
+                self._visibility[node_meta.key] = is_visible
+
+    def recompute(self, changed_key: str, values: DataMapping) -> None:
+        """
+        Update the visibility after the value of ``changed_key`` changed.
+
+        Only the nodes with a conditional on the changed key (and their descendants)
+        are checked again.
+        """
+        for node_index in self._dependents.get(changed_key, []):
+            self._check_nodes(node_index, self._subtree_ends[node_index], values)
 
 
 class FormioData(UserDict):
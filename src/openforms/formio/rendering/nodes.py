@@ -1,5 +1,6 @@
 import copy
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Callable, Iterator, Literal
 
 from glom import Path, assign, glom
@@ -20,6 +21,25 @@ from ..utils import (
 if TYPE_CHECKING:
     from openforms.submissions.rendering import Renderer
 
+    from .plan import PlannedComponent
+
+_NOT_FOUND = object()
+
+
+def _lookup(data: DataMapping, segments: tuple[str, ...]) -> Any:
+    """
+    Look up a (nested) key in plain dictionaries.
+
+    Returns ``_NOT_FOUND`` if anything other than a dictionary is encountered, so that
+    the caller can defer to glom.
+    """
+    value = data
+    for segment in segments:
+        if not isinstance(value, dict):
+            return _NOT_FOUND
+        value = value.get(segment)
+    return value
+
 
 @dataclass
 class RenderConfiguration:
@@ -70,7 +90,9 @@ class ComponentNode(Node):
         from .registry import register
 
         assert "type" in component
-        node_cls = register[component["type"]]
+        plan = renderer.render_plan
+        planned = plan.get(component) if plan is not None else None
+        node_cls = planned.node_cls if planned else register[component["type"]]
         nested_node = node_cls(
             step_data=step_data,
             component=component,
@@ -165,12 +187,22 @@ class ComponentNode(Node):
         assert "key" in self.component
         return self.component["key"]
 
+    @cached_property
+    def planned(self) -> "PlannedComponent | None":
+        """
+        The static information about this component from the render plan, if any.
+        """
+        plan = self.renderer.render_plan
+        return plan.get(self.component) if plan is not None else None
+
     @property
     def key_as_path(self) -> Path:
         """
         See https://glom.readthedocs.io/en/latest/api.html?highlight=Path#glom.Path
         Using Path("a.b") in glom will not use the nested path, but will look for a key "a.b"
         """
+        if self.planned is not None:
+            return self.planned.key_as_path
         return Path.from_text(self.key)
 
     @property
@@ -194,6 +226,13 @@ class ComponentNode(Node):
 
         TODO: build and use the type conversion for Formio components.
         """
+        # fast path for top-level (non-repeating group) components - glom is
+        # relatively expensive for simple nested dictionary lookups
+        if self.planned is not None and not self.path:
+            value = _lookup(self.step_data, self.planned.key_segments)
+            if value is not _NOT_FOUND:
+                return value
+
         path = Path(self.path, self.key_as_path) if self.path else self.key_as_path
 
         value = glom(self.step_data, path, default=None)
@@ -234,7 +273,12 @@ class ComponentNode(Node):
             return
 
         # in export mode, only emit if the component is not a layout component
-        if self.mode != RenderModes.export or not is_layout_component(self.component):
+        is_layout = (
+            self.planned.is_layout
+            if self.planned is not None
+            else is_layout_component(self.component)
+        )
+        if self.mode != RenderModes.export or not is_layout:
             yield self
 
         for child in self.get_children():
@@ -274,6 +318,9 @@ class ComponentNode(Node):
         # in export mode, expose the raw datatype
         if self.mode == RenderModes.export:
             return self.value
+        if self.planned is not None:
+            formatter = self.planned.get_formatter(as_html=self.renderer.as_html)
+            return formatter(self.component, self.value)
         return format_value(self.component, self.value, as_html=self.renderer.as_html)
 
     @property
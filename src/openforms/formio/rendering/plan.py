@@ -0,0 +1,101 @@
+"""
+Render plans - the static part of rendering a Formio configuration.
+
+Rendering a submission builds a tree of :class:`ComponentNode` instances for every
+step. A good part of that work only depends on the form definition and not on the
+submission data: which node class handles a component, how its key maps to a path in
+the data, whether it's a layout component and which formatter to use for its value.
+
+A render plan captures this once for a form, so that it can be re-used for every
+submission of the same form being rendered (e.g. in exports or batch registrations),
+leaving only the data-dependent visibility and values to be evaluated per submission.
+
+Logic rules can still modify the configuration of a particular submission, so a
+planned component is only used as long as the actual component still matches it.
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+
+from glom import Path
+
+from ..registry import register as formio_register
+from ..typing import Component
+from ..utils import is_layout_component, iter_components
+
+if TYPE_CHECKING:
+    from .nodes import ComponentNode
+
+__all__ = ["PlannedComponent", "RenderPlan", "build_render_plan"]
+
+
+@dataclass(frozen=True)
+class PlannedComponent:
+    type: str
+    key: str
+    node_cls: type["ComponentNode"]
+    key_as_path: Path
+    key_segments: tuple[str, ...]
+    is_layout: bool
+    _formatters: dict[bool, Any] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    def matches(self, component: Component) -> bool:
+        return component.get("type") == self.type and component.get("key") == self.key
+
+    def get_formatter(self, as_html: bool):
+        # formatters are stateless apart from their output mode, so they can be
+        # shared between all nodes of this component
+        formatter = self._formatters.get(as_html)
+        if formatter is None:
+            component_type = self.type if self.type in formio_register else "default"
+            formatter = formio_register[component_type].formatter(as_html=as_html)
+            self._formatters[as_html] = formatter
+        return formatter
+
+
+@dataclass(frozen=True)
+class RenderPlan:
+    components: Mapping[str, PlannedComponent]
+
+    def get(self, component: Component) -> PlannedComponent | None:
+        """
+        Look up the planned component, if it still matches the given component.
+        """
+        planned = self.components.get(component.get("key", ""))
+        if planned is None or not planned.matches(component):
+            return None
+        return planned
+
+
+def build_render_plan(configurations: Iterable[Component]) -> RenderPlan:
+    """
+    Build the render plan for the Formio configurations of (the steps of) a form.
+
+    Component keys are unique within a form. Should the same key occur more than once
+    anyway, the component is left out of the plan and rendered the regular way.
+    """
+    from .registry import register  # circular import
+
+    components: dict[str, PlannedComponent] = {}
+    duplicate_keys: set[str] = set()
+    for configuration in configurations:
+        for component in iter_components(configuration, recursive=True):
+            if "key" not in component or "type" not in component:
+                continue
+            key = component["key"]
+            if key in components:
+                duplicate_keys.add(key)
+                continue
+            components[key] = PlannedComponent(
+                type=component["type"],
+                key=key,
+                node_cls=register[component["type"]],
+                key_as_path=(key_as_path := Path.from_text(key)),
+                key_segments=tuple(key_as_path.values()),
+                is_layout=bool(is_layout_component(component)),
+            )
+    for key in duplicate_keys:
+        del components[key]
+    return RenderPlan(components=components)
@@ -0,0 +1,98 @@
+from django.test import SimpleTestCase
+
+from ..default import EditGridNode, FieldSetNode
+from ..nodes import ComponentNode, _lookup
+from ..plan import build_render_plan
+
+
+class RenderPlanTests(SimpleTestCase):
+    def test_plan_contains_all_components(self):
+        configuration = {
+            "components": [
+                {"type": "textfield", "key": "name"},
+                {
+                    "type": "fieldset",
+                    "key": "fieldset",
+                    "components": [{"type": "number", "key": "nested.age"}],
+                },
+                {
+                    "type": "editgrid",
+                    "key": "repeatingGroup",
+                    "components": [{"type": "textfield", "key": "item"}],
+                },
+            ]
+        }
+
+        plan = build_render_plan([configuration])
+
+        self.assertEqual(
+            set(plan.components),
+            {"name", "fieldset", "nested.age", "repeatingGroup", "item"},
+        )
+        self.assertIs(plan.components["name"].node_cls, ComponentNode)
+        self.assertIs(plan.components["fieldset"].node_cls, FieldSetNode)
+        self.assertIs(plan.components["repeatingGroup"].node_cls, EditGridNode)
+        self.assertTrue(plan.components["fieldset"].is_layout)
+        self.assertFalse(plan.components["name"].is_layout)
+        self.assertEqual(plan.components["nested.age"].key_segments, ("nested", "age"))
+
+    def test_duplicate_keys_are_not_planned(self):
+        configurations = [
+            {"components": [{"type": "textfield", "key": "name"}]},
+            {"components": [{"type": "email", "key": "name"}]},
+        ]
+
+        plan = build_render_plan(configurations)
+
+        self.assertNotIn("name", plan.components)
+        self.assertIsNone(plan.get({"type": "textfield", "key": "name"}))
+
+    def test_changed_components_do_not_match(self):
+        plan = build_render_plan(
+            [{"components": [{"type": "textfield", "key": "name"}]}]
+        )
+
+        self.assertIsNotNone(plan.get({"type": "textfield", "key": "name"}))
+        self.assertIsNone(plan.get({"type": "textarea", "key": "name"}))
+        self.assertIsNone(plan.get({"type": "textfield", "key": "other"}))
+
+    def test_formatters_are_reused(self):
+        plan = build_render_plan(
+            [{"components": [{"type": "number", "key": "amount", "decimalLimit": 2}]}]
+        )
+        planned = plan.components["amount"]
+
+        formatter = planned.get_formatter(as_html=False)
+
+        self.assertIs(planned.get_formatter(as_html=False), formatter)
+        self.assertIsNot(planned.get_formatter(as_html=True), formatter)
+        self.assertFalse(formatter.as_html)
+
+    def test_unknown_component_types_use_default_formatter(self):
+        plan = build_render_plan(
+            [{"components": [{"type": "unknown-type", "key": "foo"}]}]
+        )
+
+        formatter = plan.components["foo"].get_formatter(as_html=False)
+
+        self.assertEqual(
+            formatter({"type": "unknown-type", "key": "foo"}, "bar"), "bar"
+        )
+
+
+class LookupTests(SimpleTestCase):
+    def test_nested_lookups(self):
+        data = {"name": "Jane", "nested": {"age": 42}, "empty": None}
+
+        with self.subTest("top-level key"):
+            self.assertEqual(_lookup(data, ("name",)), "Jane")
+
+        with self.subTest("nested key"):
+            self.assertEqual(_lookup(data, ("nested", "age")), 42)
+
+        with self.subTest("missing key"):
+            self.assertIsNone(_lookup(data, ("missing",)))
+
+        with self.subTest("non-dict containers are not handled"):
+            self.assertIsNotNone(_lookup(data, ("empty", "foo")))
+            self.assertIsNotNone(_lookup({"items": ["a"]}, ("items", "0")))
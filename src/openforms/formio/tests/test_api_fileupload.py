@@ -18,6 +18,7 @@ from rest_framework.test import APITestCase, APITransactionTestCase
 from openforms.config.models import GlobalConfiguration
 from openforms.submissions.attachments import temporary_upload_from_url
 from openforms.submissions.constants import UPLOADS_SESSION_KEY
+from openforms.submissions.ownership import get_session_set
 from openforms.submissions.tests.factories import SubmissionFactory
 from openforms.submissions.tests.mixins import SubmissionsMixin
 
@@ -81,7 +82,10 @@ class FormIOTemporaryFileUploadTest(SubmissionsMixin, APITestCase):
         self.assertEqual(upload.file_size, 10)
 
         # added to session
-        self.assertEqual([str(upload.uuid)], self.client.session[UPLOADS_SESSION_KEY])
+        self.assertEqual(
+            {str(upload.uuid)},
+            get_session_set(self.client.session, UPLOADS_SESSION_KEY),
+        )
 
     def test_upload_empty(self):
         self._add_submission_to_session(self.submission)
@@ -394,5 +398,5 @@ class ConcurrentUploadTests(SubmissionsMixin, APITransactionTestCase):
             for url in urls
         }
 
-        session_uuids = set(self.client.session[UPLOADS_SESSION_KEY])
+        session_uuids = get_session_set(self.client.session, UPLOADS_SESSION_KEY)
         self.assertEqual(session_uuids, uuids)
@@ -1,6 +1,9 @@
+from copy import deepcopy
 from unittest import TestCase
+from unittest.mock import patch
 
-from ..datastructures import FormioData
+from ..datastructures import FormioConfigurationWrapper, FormioData
+from ..utils import flatten_by_path, is_visible_in_frontend, iter_components
 
 
 class FormioDataTests(TestCase):
@@ -86,3 +89,143 @@ class FormioDataTests(TestCase):
         }
 
         self.assertEqual(formio_data, expected)
+
+
+CONFIGURATION = {
+    "components": [
+        {"type": "textfield", "key": "topLevel"},
+        {
+            "type": "fieldset",
+            "key": "fieldset",
+            "components": [{"type": "textfield", "key": "inFieldset"}],
+        },
+        {
+            "type": "columns",
+            "key": "columns",
+            "columns": [
+                {"size": 6, "components": [{"type": "number", "key": "column1"}]},
+                {
+                    "size": 6,
+                    "components": [
+                        {
+                            "type": "fieldset",
+                            "key": "nestedFieldset",
+                            "hidden": True,
+                            "components": [{"type": "email", "key": "deepest"}],
+                        }
+                    ],
+                },
+            ],
+        },
+    ]
+}
+
+
+class FormioConfigurationWrapperTests(TestCase):
+    def test_indexes_match_configuration_traversal(self):
+        configuration = deepcopy(CONFIGURATION)
+        wrapper = FormioConfigurationWrapper(configuration)
+
+        expected_component_map = {
+            component["key"]: component
+            for component in iter_components(configuration, recursive=True)
+        }
+        self.assertEqual(
+            list(wrapper.component_map.keys()), list(expected_component_map.keys())
+        )
+        for key, component in expected_component_map.items():
+            with self.subTest(key=key):
+                self.assertIs(wrapper[key], component)
+
+        flattened = flatten_by_path(configuration)
+        self.assertEqual(list(wrapper.flattened_by_path), list(flattened))
+        for path, component in flattened.items():
+            with self.subTest(path=path):
+                self.assertIs(wrapper.flattened_by_path[path], component)
+
+        self.assertEqual(
+            wrapper.reverse_flattened["deepest"],
+            "components.2.columns.1.components.0.components.0",
+        )
+
+    def test_index_is_shared_but_configuration_is_not(self):
+        wrapper1 = FormioConfigurationWrapper(deepcopy(CONFIGURATION))
+        wrapper2 = FormioConfigurationWrapper(deepcopy(CONFIGURATION))
+
+        self.assertIs(wrapper1.index, wrapper2.index)
+
+        wrapper1["topLevel"]["hidden"] = True
+
+        self.assertNotIn("hidden", wrapper2["topLevel"])
+        self.assertIsNot(wrapper1["deepest"], wrapper2["deepest"])
+
+    def test_visibility_takes_ancestors_into_account(self):
+        wrapper = FormioConfigurationWrapper(deepcopy(CONFIGURATION))
+
+        self.assertTrue(wrapper.is_visible_in_frontend("column1", {}))
+        self.assertFalse(wrapper.is_visible_in_frontend("nestedFieldset", {}))
+        self.assertFalse(wrapper.is_visible_in_frontend("deepest", {}))
+
+    def test_batch_visibility(self):
+        wrapper = FormioConfigurationWrapper(deepcopy(CONFIGURATION))
+        wrapper["inFieldset"]["conditional"] = {
+            "show": True,
+            "when": "topLevel",
+            "eq": "show",
+        }
+
+        for data in ({}, {"topLevel": "show"}):
+            with self.subTest(data=data):
+                visibility = wrapper.get_visibility(data)
+
+                self.assertEqual(set(visibility), set(wrapper.component_map))
+                for key, is_visible in visibility.items():
+                    self.assertEqual(
+                        is_visible, wrapper.is_visible_in_frontend(key, data), key
+                    )
+
+        self.assertTrue(wrapper.get_visibility({"topLevel": "show"})["inFieldset"])
+        self.assertFalse(wrapper.get_visibility({})["inFieldset"])
+
+    def test_batch_visibility_short_circuits_hidden_subtrees(self):
+        wrapper = FormioConfigurationWrapper(deepcopy(CONFIGURATION))
+        wrapper["deepest"]["conditional"] = {"show": True, "when": "x", "eq": "y"}
+
+        with patch(
+            "openforms.formio.datastructures.is_visible_in_frontend",
+            wraps=is_visible_in_frontend,
+        ) as m_is_visible:
+            visibility = wrapper.get_visibility({})
+
+        self.assertFalse(visibility["deepest"])
+        checked_components = [call.args[0] for call in m_is_visible.call_args_list]
+        self.assertNotIn(wrapper["deepest"], checked_components)
+
+    def test_recompute_visibility_of_dependent_components(self):
+        wrapper = FormioConfigurationWrapper(deepcopy(CONFIGURATION))
+        wrapper["fieldset"]["conditional"] = {
+            "show": False,
+            "when": "topLevel",
+            "eq": "hide",
+        }
+        data = {"topLevel": "hide"}
+        visibility = wrapper.get_visibility(data)
+        self.assertFalse(visibility["inFieldset"])
+
+        data["topLevel"] = ""
+        with patch(
+            "openforms.formio.datastructures.is_visible_in_frontend",
+            wraps=is_visible_in_frontend,
+        ) as m_is_visible:
+            visibility.recompute("unrelated", data)
+
+            m_is_visible.assert_not_called()
+
+            visibility.recompute("topLevel", data)
+
+        self.assertEqual(visibility, wrapper.get_visibility(data))
+        self.assertTrue(visibility["inFieldset"])
+        # only the fieldset and its descendants are checked again
+        checked_components = [call.args[0] for call in m_is_visible.call_args_list]
+        self.assertEqual(checked_components[0], wrapper["fieldset"])
+        self.assertNotIn(wrapper["topLevel"], checked_components)
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from ..models import FormStatistics
+from ..models import FormStatistics, FormStatisticsBucket
 
 
 @admin.register(FormStatistics)
@@ -31,3 +31,34 @@ class FormStatisticsAdmin(admin.ModelAdmin):
 
     def has_change_permission(self, request, obj=None):
         return False
+
+
+@admin.register(FormStatisticsBucket)
+class FormStatisticsBucketAdmin(admin.ModelAdmin):
+    list_display = (
+        "form_name",
+        "granularity",
+        "start",
+        "submission_count",
+    )
+    fields = (
+        "form",
+        "form_name",
+        "granularity",
+        "start",
+        "submission_count",
+    )
+
+    search_fields = ("form_name",)
+    date_hierarchy = "start"
+    list_filter = ("granularity", "start")
+    ordering = ("-start",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -17,6 +17,8 @@ from ...models import Form, FormDefinition, FormVariable
 
 
 class FormVariableListSerializer(ListWithChildSerializer):
+    lookup_field = "key"
+
     def get_child_serializer_class(self):
         return FormVariableSerializer
 
@@ -58,7 +58,18 @@ class FormLogicBaseSerializer(serializers.HyperlinkedModelSerializer):
         self.fields["form"].label = related_field.verbose_name
 
 
-class FormLogicListSerializer(ListWithChildSerializer):
+class FormLogicBaseListSerializer(ListWithChildSerializer):
+    lookup_field = "uuid"
+
+    def get_lookup_value(self, index: int, data_dict: dict) -> str | None:
+        # The UUID is read-only (a new one is generated for new rules, also when
+        # importing forms), so it's not in the validated data. The form designer does
+        # send the UUID of the existing rules though.
+        item = self.initial_data[index]
+        return (item.get("uuid") or None) if isinstance(item, dict) else None
+
+
+class FormLogicListSerializer(FormLogicBaseListSerializer):
     child_serializer_class = (
         "openforms.forms.api.serializers.logic.form_logic.FormLogicSerializer"
     )
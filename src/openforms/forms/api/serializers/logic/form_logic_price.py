@@ -1,9 +1,11 @@
-from openforms.api.serializers import ListWithChildSerializer
-from openforms.forms.api.serializers.logic.form_logic import FormLogicBaseSerializer
+from openforms.forms.api.serializers.logic.form_logic import (
+    FormLogicBaseListSerializer,
+    FormLogicBaseSerializer,
+)
 from openforms.forms.models import FormPriceLogic
 
 
-class FormPriceLogicListSerializer(ListWithChildSerializer):
+class FormPriceLogicListSerializer(FormLogicBaseListSerializer):
     child_serializer_class = "openforms.forms.api.serializers.logic.form_logic_price.FormPriceLogicSerializer"
 
 
@@ -25,6 +25,7 @@ from openforms.utils.patches.rest_framework_nested.viewsets import NestedViewSet
 from openforms.utils.urls import is_admin_request
 from openforms.variables.constants import FormVariableSources
 
+from ..caching import invalidate_form_variables
 from ..messages import add_success_message
 from ..models import Form, FormDefinition, FormStep, FormVersion
 from ..tasks import recouple_submission_variables_to_form_variables
@@ -529,12 +530,16 @@ class FormViewSet(viewsets.ModelViewSet):
     @transaction.atomic
     def variables_bulk_update(self, request, *args, **kwargs):
         form = self.get_object()
-        form_variables = form.formvariable_set.all()
-        # We expect that all the variables that should be associated with a form come in the request.
-        # So we can delete any existing variables because they will be replaced.
-        form_variables.delete()
+        # We expect that all the variables that should be associated with a form come
+        # in the request. The existing variables are matched on their key, only the
+        # changes are applied and the variables that are not present are deleted.
+        form_variables = form.formvariable_set.select_related(
+            "form", "form_definition", "service_fetch_configuration"
+        )
+        existing_keys = {variable.key for variable in form_variables}
 
         serializer = FormVariableSerializer(
+            instance=form_variables,
             data=request.data,
             many=True,
             context={
@@ -552,8 +557,14 @@ class FormViewSet(viewsets.ModelViewSet):
         )
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        # bulk_update/bulk_create don't send the post_save signal that normally
+        # invalidates the cached variables
+        invalidate_form_variables(form.id)
 
-        recouple_submission_variables_to_form_variables.delay(form.id)
+        # the existing variables keep their primary key, only the submission variables
+        # of (re-)added variables may need to be coupled again
+        if any(variable.key not in existing_keys for variable in serializer.instance):
+            recouple_submission_variables_to_form_variables.delay(form.id)
 
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -602,12 +613,15 @@ class FormViewSet(viewsets.ModelViewSet):
     @transaction.atomic
     def logic_rules_bulk_update(self, request, *args, **kwargs):
         form = self.get_object()
-        logic_rules = form.formlogic_set.all()
         # We expect that all the logic rules associated with a form come in the request.
-        # So we can delete any existing rule because they will be replaced.
-        logic_rules.delete()
+        # The existing rules are matched on their UUID, only the changes are applied and
+        # the rules that are not present are deleted.
+        logic_rules = form.formlogic_set.select_related(
+            "form", "trigger_from_step__form"
+        )
 
         serializer = FormLogicSerializer(
+            instance=logic_rules,
             data=request.data,
             many=True,
             context={
@@ -660,12 +674,13 @@ class FormViewSet(viewsets.ModelViewSet):
     @transaction.atomic
     def price_logic_rules_bulk_update(self, request, *args, **kwargs):
         form = self.get_object()
-        price_logic_rules = form.formpricelogic_set.all()
-        # We expect that all the price logic rules associated with a form come in the request.
-        # So we can delete any existing rule because they will be replaced.
-        price_logic_rules.delete()
+        # We expect that all the price logic rules associated with a form come in the
+        # request. The existing rules are matched on their UUID, only the changes are
+        # applied and the rules that are not present are deleted.
+        price_logic_rules = form.formpricelogic_set.select_related("form")
 
         serializer = FormPriceLogicSerializer(
+            instance=price_logic_rules,
             data=request.data,
             many=True,
             context={
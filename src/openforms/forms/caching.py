@@ -0,0 +1,61 @@
+"""
+Shared (cross-process) caches of form-level data.
+
+Every request touching a submission needs the form variables of its form, which
+rarely change compared to how often they are read. They are cached in the Django cache
+under a key including a version token. Invalidating the cache is done by discarding
+the version token, after which the next reader generates a new one - stale entries
+written by concurrent readers (that loaded the variables before the change) are never
+read again and expire eventually.
+"""
+
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Form, FormVariable
+
+__all__ = ["get_form_variables", "invalidate_form_variables"]
+
+FORM_VARIABLES_CACHE_TIMEOUT = 60 * 60 * 24  # 1 day
+
+
+def _get_version_key(form_id: int) -> str:
+    return f"form-variables:{form_id}:version"
+
+
+def _get_version(form_id: int) -> str:
+    version_key = _get_version_key(form_id)
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(version_key)
+    return version
+
+
+def get_form_variables(form: Form) -> list[FormVariable]:
+    """
+    Retrieve the variables of a form, from the cache if possible.
+
+    The returned instances are not shared with other callers and may be modified.
+    Relations other than the form itself are not loaded.
+    """
+    version = _get_version(form.pk)
+    cache_key = f"form-variables:{form.pk}:{version}"
+    form_variables = cache.get(cache_key)
+    if form_variables is None:
+        form_variables = list(FormVariable.objects.filter(form_id=form.pk))
+        cache.set(cache_key, form_variables, timeout=FORM_VARIABLES_CACHE_TIMEOUT)
+
+    for form_variable in form_variables:
+        form_variable.form = form
+    return form_variables
+
+
+def invalidate_form_variables(form_id: int) -> None:
+    version_key = _get_version_key(form_id)
+    cache.delete(version_key)
+    # readers in other transactions may still see the old data until the changes are
+    # committed
+    transaction.on_commit(lambda: cache.delete(version_key))
@@ -54,3 +54,8 @@ class StatementCheckboxChoices(models.TextChoices):
     global_setting = "global_setting", _("Global setting")
     required = "required", _("Required")
     disabled = "disabled", _("Disabled")
+
+
+class StatisticsGranularities(models.TextChoices):
+    hour = "hour", _("Hour")
+    day = "day", _("Day")
@@ -0,0 +1,79 @@
+# Generated by Django 4.2.10 on 2024-03-12 10:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forms", "0093_fix_prefill_bis"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FormStatisticsBucket",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "form_name",
+                    models.CharField(
+                        help_text="The name of the submitted form. This is saved separately in case of form deletion.",
+                        max_length=150,
+                        verbose_name="form name",
+                    ),
+                ),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[("hour", "Hour"), ("day", "Day")],
+                        max_length=10,
+                        verbose_name="granularity",
+                    ),
+                ),
+                (
+                    "start",
+                    models.DateTimeField(
+                        help_text="Start of the hour or day.", verbose_name="start"
+                    ),
+                ),
+                (
+                    "submission_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The number of forms submitted in this hour or day.",
+                        verbose_name="Submission count",
+                    ),
+                ),
+                (
+                    "form",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to="forms.form",
+                        verbose_name="form",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "form statistics bucket",
+                "verbose_name_plural": "form statistics buckets",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="formstatisticsbucket",
+            constraint=models.UniqueConstraint(
+                fields=("form", "granularity", "start"),
+                name="unique_form_statistics_bucket",
+            ),
+        ),
+    ]
@@ -2,6 +2,8 @@ from django.db import models
 from django.utils.formats import localize
 from django.utils.translation import gettext_lazy as _
 
+from ..constants import StatisticsGranularities
+
 
 class FormStatistics(models.Model):
     form = models.OneToOneField(
@@ -41,3 +43,55 @@ class FormStatistics(models.Model):
         return _("{form_name} last submitted on {last_submitted}").format(
             form_name=self.form_name, last_submitted=localize(self.last_submission)
         )
+
+
+class FormStatisticsBucket(models.Model):
+    """
+    The number of submissions of a form in a particular hour or day.
+    """
+
+    form = models.ForeignKey(
+        "forms.Form",
+        verbose_name=_("form"),
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+    )
+    form_name = models.CharField(
+        verbose_name=_("form name"),
+        max_length=150,
+        help_text=_(
+            "The name of the submitted form. This is saved separately in case of form deletion."
+        ),
+    )
+    granularity = models.CharField(
+        verbose_name=_("granularity"),
+        max_length=10,
+        choices=StatisticsGranularities.choices,
+    )
+    start = models.DateTimeField(
+        verbose_name=_("start"),
+        help_text=_("Start of the hour or day."),
+    )
+    submission_count = models.PositiveIntegerField(
+        verbose_name=_("Submission count"),
+        default=0,
+        help_text=_("The number of forms submitted in this hour or day."),
+    )
+
+    class Meta:
+        verbose_name = _("form statistics bucket")
+        verbose_name_plural = _("form statistics buckets")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["form", "granularity", "start"],
+                name="unique_form_statistics_bucket",
+            ),
+        ]
+
+    def __str__(self):
+        return _("{form_name} ({granularity} of {start})").format(
+            form_name=self.form_name,
+            granularity=self.get_granularity_display(),
+            start=localize(self.start),
+        )
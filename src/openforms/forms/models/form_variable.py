@@ -93,7 +93,13 @@ class FormVariableManager(models.Manager):
                 )
             )
 
-        return self.bulk_create(form_variables)
+        created = self.bulk_create(form_variables)
+        # bulk_create does not send the post_save signal
+        if created:
+            from ..caching import invalidate_form_variables
+
+            invalidate_form_variables(form_step.form_id)
+        return created
 
 
 class FormVariable(models.Model):
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import uuid as _uuid
 
 from django.core.exceptions import ValidationError
@@ -69,10 +71,16 @@ class FormLogic(OrderedModel):
                 code="invalid",
             )
 
+    def get_hash(self) -> str:
+        """
+        Calculate a digest of the trigger and actions, identifying the rule revision.
+        """
+        bits = [self.json_logic_trigger, self.actions]
+        return hashlib.md5(json.dumps(bits, sort_keys=True).encode("utf-8")).hexdigest()
+
     @property
     def action_operations(self):
-        from openforms.submissions.logic.actions import compile_action_operation
+        from openforms.submissions.logic.compilation import get_compiled_rule
 
-        for action in map(compile_action_operation, self.actions):
-            action.rule = self
+        for action in get_compiled_rule(self).bind_actions(self):
             yield action
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import invalidate_form_variables
+from .models import FormVariable
+
+
+@receiver(post_save, sender=FormVariable, dispatch_uid="forms.form_variable_saved")
+@receiver(post_delete, sender=FormVariable, dispatch_uid="forms.form_variable_deleted")
+def invalidate_form_variables_cache(sender, instance: FormVariable, **kwargs):
+    invalidate_form_variables(instance.form_id)
@@ -0,0 +1,183 @@
+"""
+Form submission counters.
+
+Completing a submission increments the submission counter of its form. Updating the
+:class:`FormStatistics` record of the form for every completion makes concurrent
+completions of the same form wait on the row lock, so instead the completions are
+counted in the cache, per form and per hour. A periodic task folds these counters into
+the :class:`FormStatistics` records and the hourly/daily
+:class:`FormStatisticsBucket` records.
+
+The counters are decremented by the folded amount (rather than deleted), so that
+completions happening while the counters are being folded are not lost. Folding runs
+don't overlap - they would fold the same counts twice.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import UTC, datetime, timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .constants import StatisticsGranularities
+from .models import Form, FormStatistics, FormStatisticsBucket
+
+__all__ = ["record_form_submission", "fold_form_statistics"]
+
+KEY_PREFIX = "form-statistics"
+# counters that have not been folded by then are lost
+COUNTER_TIMEOUT = 60 * 60 * 48
+
+FOLDED_UNTIL_KEY = f"{KEY_PREFIX}:folded-until"
+FOLD_LOCK_KEY = f"{KEY_PREFIX}:fold-lock"
+# released at the end of the run, the timeout only guards against crashed runs
+FOLD_LOCK_TIMEOUT = 60 * 15
+
+logger = logging.getLogger(__name__)
+
+
+def _truncate_to_hour(value: datetime) -> datetime:
+    return value.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def _truncate_to_day(value: datetime) -> datetime:
+    return timezone.localtime(value).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _get_counter_key(form_id: int, hour: datetime) -> str:
+    return f"{KEY_PREFIX}:{form_id}:{hour:%Y%m%d%H}"
+
+
+def _get_first_submission_key(form_id: int) -> str:
+    return f"{KEY_PREFIX}:{form_id}:first"
+
+
+def _get_last_submission_key(form_id: int) -> str:
+    return f"{KEY_PREFIX}:{form_id}:last"
+
+
+def record_form_submission(form_id: int, timestamp: datetime) -> None:
+    """
+    Count a submission of the form, to be folded into the form statistics later.
+    """
+    key = _get_counter_key(form_id, _truncate_to_hour(timestamp))
+    try:
+        cache.incr(key)
+    except ValueError:
+        # no counter for this hour yet
+        if not cache.add(key, 1, timeout=COUNTER_TIMEOUT):
+            cache.incr(key)
+
+    cache.add(_get_first_submission_key(form_id), timestamp, timeout=COUNTER_TIMEOUT)
+    cache.set(_get_last_submission_key(form_id), timestamp, timeout=COUNTER_TIMEOUT)
+
+
+def _get_hours_to_fold(now: datetime) -> list[datetime]:
+    current_hour = _truncate_to_hour(now)
+    oldest_hour = _truncate_to_hour(now - timedelta(seconds=COUNTER_TIMEOUT))
+    folded_until = cache.get(FOLDED_UNTIL_KEY)
+    if folded_until is not None and folded_until > oldest_hour:
+        oldest_hour = folded_until
+
+    hours = []
+    hour = oldest_hour
+    while hour <= current_hour:
+        hours.append(hour)
+        hour += timedelta(hours=1)
+    return hours
+
+
+def fold_form_statistics(now: datetime | None = None) -> None:
+    """
+    Fold the counted submissions into the form statistics.
+
+    Nothing is done if another run is still in progress.
+    """
+    if not cache.add(FOLD_LOCK_KEY, True, timeout=FOLD_LOCK_TIMEOUT):
+        logger.info("Form statistics are already being folded, skipping this run.")
+        return
+
+    try:
+        _fold_form_statistics(now or timezone.now())
+    finally:
+        cache.delete(FOLD_LOCK_KEY)
+
+
+def _fold_form_statistics(now: datetime) -> None:
+    hours = _get_hours_to_fold(now)
+    form_names = dict(Form.objects.values_list("pk", "name"))
+
+    keys = {
+        _get_counter_key(form_id, hour): (form_id, hour)
+        for form_id in form_names
+        for hour in hours
+    }
+    counts_per_form: defaultdict[int, dict[datetime, int]] = defaultdict(dict)
+    for key, count in cache.get_many(list(keys)).items():
+        if not count:
+            continue
+        form_id, hour = keys[key]
+        counts_per_form[form_id][hour] = count
+
+    for form_id, counts in counts_per_form.items():
+        with transaction.atomic():
+            _update_form_statistics(form_id, form_names[form_id], counts)
+        for hour, count in counts.items():
+            cache.decr(_get_counter_key(form_id, hour), count)
+
+    # increments for the previous hour may still come in around the turn of the hour
+    cache.set(
+        FOLDED_UNTIL_KEY,
+        _truncate_to_hour(now) - timedelta(hours=1),
+        timeout=COUNTER_TIMEOUT,
+    )
+
+
+def _update_form_statistics(
+    form_id: int, form_name: str, counts: dict[datetime, int]
+) -> None:
+    total = sum(counts.values())
+    first_submission = cache.get(_get_first_submission_key(form_id)) or min(counts)
+    last_submission = cache.get(_get_last_submission_key(form_id)) or max(counts)
+
+    form_statistics, created = FormStatistics.objects.get_or_create(
+        form_id=form_id,
+        defaults={
+            "form_name": form_name,
+            "submission_count": total,
+            "last_submission": last_submission,
+        },
+    )
+    if created:
+        # the first submission is set automatically on creation
+        FormStatistics.objects.filter(pk=form_statistics.pk).update(
+            first_submission=first_submission
+        )
+    else:
+        FormStatistics.objects.filter(pk=form_statistics.pk).update(
+            form_name=form_name,
+            submission_count=F("submission_count") + total,
+            last_submission=Greatest(F("last_submission"), last_submission),
+        )
+
+    buckets: dict[tuple[str, datetime], int] = defaultdict(int)
+    for hour, count in counts.items():
+        buckets[(StatisticsGranularities.hour, hour)] += count
+        buckets[(StatisticsGranularities.day, _truncate_to_day(hour))] += count
+
+    for (granularity, start), count in buckets.items():
+        bucket, created = FormStatisticsBucket.objects.get_or_create(
+            form_id=form_id,
+            granularity=granularity,
+            start=start,
+            defaults={"form_name": form_name, "submission_count": count},
+        )
+        if not created:
+            FormStatisticsBucket.objects.filter(pk=bucket.pk).update(
+                form_name=form_name,
+                submission_count=F("submission_count") + count,
+            )
@@ -56,9 +56,9 @@ def detect_formiojs_configuration_snake_case(
 def recouple_submission_variables_to_form_variables(form_id: int) -> None:
     """Recouple SubmissionValueVariable to FormVariable
 
-    When the FormVariable bulk create/update endpoint is called, all existing FormVariable related to the form are
-    deleted and new are created. If there are existing submissions for this form, the SubmissionValueVariables don't
-    have a related FormVariable anymore. This task tries to recouple them.
+    When a FormVariable is deleted (e.g. by the FormVariable bulk create/update endpoint), the related
+    SubmissionValueVariables of existing submissions don't have a related FormVariable anymore. If a variable with the
+    same key is added again later, this task tries to recouple them.
     """
     from openforms.submissions.models import SubmissionValueVariable
 
@@ -139,3 +139,13 @@ def deactivate_forms():
 
             else:
                 transaction.on_commit(lambda: logevent.form_deactivated(form))
+
+
+@app.task(ignore_result=True)
+def fold_form_statistics() -> None:
+    """
+    Fold the submission counters kept in the cache into the form statistics.
+    """
+    from .statistics import fold_form_statistics as fold
+
+    fold()
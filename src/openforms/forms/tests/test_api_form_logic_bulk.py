@@ -298,6 +298,66 @@ class FormLogicAPITests(APITestCase):
         self.assertEqual(status.HTTP_200_OK, response.status_code)
         self.assertEqual(0, FormLogic.objects.all().count())
 
+    def test_update_form_logic_keeps_existing_rules(self):
+        user = SuperUserFactory.create()
+        form = FormFactory.create()
+        FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [{"type": "textfield", "key": "textfield"}]
+            },
+        )
+        trigger = {"==": [{"var": "textfield"}, "foo"]}
+        actions = [
+            {
+                "component": "textfield",
+                "action": {
+                    "name": "Hide element",
+                    "type": "property",
+                    "property": {"value": "hidden", "type": "bool"},
+                    "state": True,
+                },
+            }
+        ]
+        rule1 = FormLogicFactory.create(
+            form=form, order=0, json_logic_trigger=trigger, actions=actions
+        )
+        rule2 = FormLogicFactory.create(
+            form=form, order=1, json_logic_trigger=trigger, actions=actions
+        )
+        form_url = f"http://testserver{reverse('api:form-detail', kwargs={'uuid_or_slug': form.uuid})}"
+        data = [
+            {
+                "uuid": str(rule2.uuid),
+                "form": form_url,
+                "order": 0,
+                "description": "Updated",
+                "json_logic_trigger": trigger,
+                "actions": actions,
+            },
+            {
+                "uuid": "",
+                "form": form_url,
+                "order": 1,
+                "json_logic_trigger": trigger,
+                "actions": actions,
+            },
+        ]
+
+        self.client.force_authenticate(user=user)
+        url = reverse("api:form-logic-rules", kwargs={"uuid_or_slug": form.uuid})
+        response = self.client.put(url, data=data)
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertFalse(FormLogic.objects.filter(pk=rule1.pk).exists())
+        rules = list(FormLogic.objects.filter(form=form).order_by("order"))
+        self.assertEqual(len(rules), 2)
+        self.assertEqual(rules[0].pk, rule2.pk)
+        self.assertEqual(rules[0].uuid, rule2.uuid)
+        self.assertEqual(rules[0].description, "Updated")
+        self.assertNotEqual(rules[1].uuid, rule2.uuid)
+        self.assertEqual(response.json()[0]["uuid"], str(rule2.uuid))
+
     def test_invalid_logic_trigger(self):
         user = SuperUserFactory.create()
         form = FormFactory.create()
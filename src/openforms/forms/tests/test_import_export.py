@@ -5,7 +5,9 @@ from textwrap import dedent
 from unittest.mock import patch
 
 from django.core.management import call_command
-from django.test import TestCase, override_settings, tag
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings, tag
+from django.test.utils import CaptureQueriesContext
 from django.utils import translation
 
 from freezegun import freeze_time
@@ -23,7 +25,7 @@ from openforms.variables.tests.factories import ServiceFetchConfigurationFactory
 
 from ..constants import EXPORT_META_KEY
 from ..models import Form, FormDefinition, FormLogic, FormStep, FormVariable
-from ..utils import form_to_json
+from ..utils import form_to_json, import_form_data, remap_uuids
 from .factories import (
     CategoryFactory,
     FormDefinitionFactory,
@@ -1058,3 +1060,67 @@ class ImportExportTests(TestCase):
         nl_translations = textfield["openForms"]["translations"]["nl"]
         self.assertIn("label", nl_translations)
         self.assertEqual(nl_translations["label"], "Tekstveld")
+
+
+class RemapUUIDsTests(SimpleTestCase):
+    def test_remaps_uuids_in_nested_data(self):
+        old, new = (
+            "4d3b9d2f-5f1c-4a0e-9b6e-2b0c1f4a9e11",
+            "0b0c6b74-7e84-4a24-bd3f-0a7e3a1d4c52",
+        )
+        other = "8c5f7d1a-3b2e-4c6d-9e8f-1a2b3c4d5e6f"
+        data = [
+            {
+                "url": f"http://testserver/api/v2/forms/{old}",
+                "uuid": old,
+                "other": other,
+                "actions": [{"form_step_uuid": old, "value": 1}],
+                f"key-{old}": None,
+            }
+        ]
+
+        result = remap_uuids(data, {old: new})
+
+        self.assertEqual(
+            result,
+            [
+                {
+                    "url": f"http://testserver/api/v2/forms/{new}",
+                    "uuid": new,
+                    "other": other,
+                    "actions": [{"form_step_uuid": new, "value": 1}],
+                    f"key-{new}": None,
+                }
+            ],
+        )
+
+
+class ImportNumQueriesTests(TestCase):
+    def _count_import_queries(self, num_rules: int) -> int:
+        form = FormFactory.create(
+            generate_minimal_setup=True,
+            formstep__form_definition__configuration={
+                "components": [{"type": "textfield", "key": "foo"}]
+            },
+        )
+        for index in range(num_rules):
+            FormVariableFactory.create(
+                form=form, key=f"variable{index}", user_defined=True
+            )
+        FormLogicFactory.create_batch(
+            num_rules,
+            form=form,
+            json_logic_trigger={"==": [{"var": "foo"}, "bar"]},
+        )
+        import_data = form_to_json(form.pk)
+
+        with CaptureQueriesContext(connection) as queries:
+            import_form_data(import_data)
+
+        return len(queries)
+
+    def test_variables_and_logic_rules_are_created_in_bulk(self):
+        num_queries_small = self._count_import_queries(num_rules=1)
+        num_queries_large = self._count_import_queries(num_rules=20)
+
+        self.assertEqual(num_queries_small, num_queries_large)
@@ -1,6 +1,7 @@
 import datetime
 from unittest.mock import patch
 
+from django.test import TestCase
 from django.utils import timezone
 
 from freezegun import freeze_time
@@ -13,11 +14,19 @@ from openforms.submissions.constants import PostSubmissionEvents
 from openforms.submissions.tasks import retry_processing_submissions
 from openforms.submissions.tests.factories import SubmissionFactory
 from openforms.submissions.tests.mixins import SubmissionsMixin
+from openforms.utils.tests.cache import clear_caches
 
-from ..models.form_statistics import FormStatistics
+from .. import statistics
+from ..constants import StatisticsGranularities
+from ..models.form_statistics import FormStatistics, FormStatisticsBucket
+from ..statistics import fold_form_statistics, record_form_submission
 
 
 class FormStatisticsTests(SubmissionsMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(clear_caches)
+
     @freeze_time("2020-12-11T12:00:00+00:00")
     def test_form_statistics_is_created(self):
         form = FormFactory.create()
@@ -29,6 +38,10 @@ class FormStatisticsTests(SubmissionsMixin, APITestCase):
         with self.captureOnCommitCallbacks(execute=True):
             response = self.client.post(endpoint, {"privacy_policy_accepted": True})
 
+        self.assertFalse(FormStatistics.objects.exists())
+
+        fold_form_statistics()
+
         form_statistics = FormStatistics.objects.get()
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -65,6 +78,8 @@ class FormStatisticsTests(SubmissionsMixin, APITestCase):
             with self.captureOnCommitCallbacks(execute=True):
                 response = self.client.post(endpoint, {"privacy_policy_accepted": True})
 
+            fold_form_statistics()
+
             form_statistics = FormStatistics.objects.get()
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -112,3 +127,119 @@ class FormStatisticsTests(SubmissionsMixin, APITestCase):
 
         self.assertEqual(form_statistics.form, form)
         self.assertEqual(form_statistics.submission_count, 1)
+
+
+class FormStatisticsCounterTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(clear_caches)
+
+    def test_counts_are_folded_into_buckets(self):
+        form = FormFactory.create(name="Popular form")
+        timestamps = [
+            # 2020-12-11 in Europe/Amsterdam
+            datetime.datetime(2020, 12, 11, 10, 15, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2020, 12, 11, 10, 45, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2020, 12, 11, 11, 5, tzinfo=datetime.timezone.utc),
+            # 2020-12-12 in Europe/Amsterdam
+            datetime.datetime(2020, 12, 11, 23, 30, tzinfo=datetime.timezone.utc),
+        ]
+        for timestamp in timestamps:
+            record_form_submission(form.pk, timestamp)
+
+        with freeze_time("2020-12-11T23:35:00+00:00"):
+            fold_form_statistics()
+
+        form_statistics = FormStatistics.objects.get()
+        self.assertEqual(form_statistics.submission_count, 4)
+        self.assertEqual(form_statistics.first_submission, timestamps[0])
+        self.assertEqual(form_statistics.last_submission, timestamps[-1])
+
+        hourly = dict(
+            FormStatisticsBucket.objects.filter(
+                form=form, granularity=StatisticsGranularities.hour
+            ).values_list("start", "submission_count")
+        )
+        self.assertEqual(
+            hourly,
+            {
+                datetime.datetime(2020, 12, 11, 10, tzinfo=datetime.timezone.utc): 2,
+                datetime.datetime(2020, 12, 11, 11, tzinfo=datetime.timezone.utc): 1,
+                datetime.datetime(2020, 12, 11, 23, tzinfo=datetime.timezone.utc): 1,
+            },
+        )
+        daily = dict(
+            FormStatisticsBucket.objects.filter(
+                form=form, granularity=StatisticsGranularities.day
+            ).values_list("start", "submission_count")
+        )
+        self.assertEqual(
+            daily,
+            {
+                # midnight in Europe/Amsterdam
+                datetime.datetime(2020, 12, 10, 23, tzinfo=datetime.timezone.utc): 3,
+                datetime.datetime(2020, 12, 11, 23, tzinfo=datetime.timezone.utc): 1,
+            },
+        )
+
+    def test_counts_are_only_folded_once(self):
+        form = FormFactory.create()
+        timestamp = datetime.datetime(
+            2020, 12, 11, 10, 15, tzinfo=datetime.timezone.utc
+        )
+
+        with freeze_time(timestamp) as frozen_datetime:
+            record_form_submission(form.pk, timezone.now())
+            fold_form_statistics()
+            fold_form_statistics()
+
+            frozen_datetime.tick(delta=datetime.timedelta(minutes=10))
+            record_form_submission(form.pk, timezone.now())
+            fold_form_statistics()
+
+        form_statistics = FormStatistics.objects.get()
+        self.assertEqual(form_statistics.submission_count, 2)
+        bucket = FormStatisticsBucket.objects.get(
+            granularity=StatisticsGranularities.hour
+        )
+        self.assertEqual(bucket.submission_count, 2)
+
+    def test_overlapping_folds_count_submissions_once(self):
+        form = FormFactory.create()
+        update_form_statistics = statistics._update_form_statistics
+
+        def fold_concurrently(*args):
+            # another run starting while this one is still in progress
+            fold_form_statistics()
+            update_form_statistics(*args)
+
+        with freeze_time("2020-12-11T10:15:00+00:00"):
+            record_form_submission(form.pk, timezone.now())
+            with patch(
+                "openforms.forms.statistics._update_form_statistics",
+                side_effect=fold_concurrently,
+            ) as mock_update:
+                fold_form_statistics()
+
+            # the lock is released after the run
+            record_form_submission(form.pk, timezone.now())
+            fold_form_statistics()
+
+        self.assertEqual(mock_update.call_count, 1)
+        self.assertEqual(FormStatistics.objects.get().submission_count, 2)
+        bucket = FormStatisticsBucket.objects.get(
+            granularity=StatisticsGranularities.hour
+        )
+        self.assertEqual(bucket.submission_count, 2)
+
+    def test_counts_of_previous_hour_are_folded_after_the_turn_of_the_hour(self):
+        form = FormFactory.create()
+
+        with freeze_time("2020-12-11T10:59:00+00:00") as frozen_datetime:
+            fold_form_statistics()
+            record_form_submission(form.pk, timezone.now())
+
+            frozen_datetime.tick(delta=datetime.timedelta(minutes=5))
+            fold_form_statistics()
+
+        self.assertEqual(FormStatistics.objects.get().submission_count, 1)
@@ -0,0 +1,68 @@
+from django.test import TestCase
+
+from openforms.utils.tests.cache import clear_caches
+from openforms.variables.constants import FormVariableSources
+
+from ...caching import get_form_variables
+from ...models import FormVariable
+from ..factories import FormFactory, FormStepFactory, FormVariableFactory
+
+
+class FormVariablesCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+
+    def test_variables_are_cached(self):
+        form = FormFactory.create()
+        FormVariableFactory.create(
+            form=form, key="foo", source=FormVariableSources.user_defined
+        )
+
+        with self.assertNumQueries(1):
+            variables1 = get_form_variables(form)
+        with self.assertNumQueries(0):
+            variables2 = get_form_variables(form)
+
+        self.assertEqual([var.key for var in variables2], ["foo"])
+        # every caller gets its own instances
+        self.assertIsNot(variables1[0], variables2[0])
+        self.assertIs(variables2[0].form, form)
+
+    def test_cache_is_invalidated_on_changes(self):
+        form = FormFactory.create()
+        variable = FormVariableFactory.create(
+            form=form,
+            key="foo",
+            source=FormVariableSources.user_defined,
+            initial_value="before",
+        )
+        get_form_variables(form)
+
+        with self.subTest("save"):
+            variable.initial_value = "after"
+            variable.save()
+
+            variables = get_form_variables(form)
+
+            self.assertEqual(variables[0].initial_value, "after")
+
+        with self.subTest("bulk create"):
+            FormStepFactory.create(
+                form=form,
+                form_definition__configuration={
+                    "components": [{"type": "textfield", "key": "bar"}]
+                },
+            )
+
+            variables = get_form_variables(form)
+
+            self.assertEqual({var.key for var in variables}, {"foo", "bar"})
+
+        with self.subTest("queryset delete"):
+            FormVariable.objects.filter(form=form).delete()
+
+            variables = get_form_variables(form)
+
+            self.assertEqual(variables, [])
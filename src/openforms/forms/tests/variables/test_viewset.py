@@ -16,12 +16,15 @@ from openforms.accounts.tests.factories import (
     SuperUserFactory,
     UserFactory,
 )
+from openforms.forms.caching import get_form_variables
 from openforms.forms.models import FormVariable
 from openforms.forms.tests.factories import (
     FormFactory,
     FormStepFactory,
     FormVariableFactory,
 )
+from openforms.submissions.tests.factories import SubmissionValueVariableFactory
+from openforms.utils.tests.cache import clear_caches
 from openforms.variables.constants import (
     DataMappingTypes,
     FormVariableDataTypes,
@@ -130,6 +133,93 @@ class FormVariableViewsetTest(APITestCase):
         self.assertFalse(form_variables.filter(key="variable2").exists())
         self.assertTrue(form_variables.filter(key="variable3").exists())
 
+    @patch(
+        "openforms.forms.api.viewsets.recouple_submission_variables_to_form_variables.delay"
+    )
+    def test_bulk_update_keeps_existing_variables(self, m_recouple):
+        user = StaffUserFactory.create(user_permissions=["change_form"])
+        form = FormFactory.create()
+        form_path = reverse("api:form-detail", kwargs={"uuid_or_slug": form.uuid})
+        variable = FormVariableFactory.create(
+            form=form,
+            key="variable1",
+            source=FormVariableSources.user_defined,
+            data_type=FormVariableDataTypes.string,
+            initial_value="",
+        )
+        submission_variable = SubmissionValueVariableFactory.create(
+            submission__form=form, form_variable=variable, key="variable1"
+        )
+        data = [
+            {
+                "form": f"http://testserver{form_path}",
+                "form_definition": None,
+                "key": "variable1",
+                "name": "Renamed",
+                "source": FormVariableSources.user_defined,
+                "data_type": FormVariableDataTypes.string,
+                "initial_value": "",
+            }
+        ]
+        url = reverse("api:form-variables", kwargs={"uuid_or_slug": form.uuid})
+        self.client.force_authenticate(user)
+
+        with self.subTest("update existing variable"):
+            response = self.client.put(url, data=data)
+
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+            updated_variable = FormVariable.objects.get(form=form)
+            self.assertEqual(updated_variable.pk, variable.pk)
+            self.assertEqual(updated_variable.name, "Renamed")
+            submission_variable.refresh_from_db()
+            self.assertEqual(submission_variable.form_variable, variable)
+            m_recouple.assert_not_called()
+
+        with self.subTest("add variable"):
+            response = self.client.put(
+                url,
+                data=data + [{**data[0], "key": "variable2", "name": "New"}],
+            )
+
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+            self.assertEqual(FormVariable.objects.filter(form=form).count(), 2)
+            m_recouple.assert_called_once_with(form.id)
+
+    def test_bulk_update_invalidates_cached_variables(self):
+        self.addCleanup(clear_caches)
+        user = StaffUserFactory.create(user_permissions=["change_form"])
+        form = FormFactory.create()
+        form_path = reverse("api:form-detail", kwargs={"uuid_or_slug": form.uuid})
+        FormVariableFactory.create(
+            form=form,
+            key="variable1",
+            source=FormVariableSources.user_defined,
+            data_type=FormVariableDataTypes.string,
+            initial_value="before",
+        )
+        # populate the cache
+        get_form_variables(form)
+        data = [
+            {
+                "form": f"http://testserver{form_path}",
+                "form_definition": None,
+                "key": "variable1",
+                "name": "Variable 1",
+                "source": FormVariableSources.user_defined,
+                "data_type": FormVariableDataTypes.string,
+                "initial_value": "after",
+            }
+        ]
+        url = reverse("api:form-variables", kwargs={"uuid_or_slug": form.uuid})
+        self.client.force_authenticate(user)
+
+        response = self.client.put(url, data=data)
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        variables = get_form_variables(form)
+        self.assertEqual(len(variables), 1)
+        self.assertEqual(variables[0].initial_value, "after")
+
     def test_it_accepts_inline_service_fetch_configs(self):
         designer = StaffUserFactory.create(user_permissions=["change_form"])
         service = ServiceFactory.create(
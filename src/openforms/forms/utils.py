@@ -1,6 +1,7 @@
 import json
 import logging
 import random
+import re
 import string
 import zipfile
 from typing import Any
@@ -173,6 +174,40 @@ def check_form_definition(uuid: str, attrs: dict[str, Any], for_existing_form: b
     return None
 
 
+UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
+# resources that nothing else refers to, which are validated entry by entry and then
+# created in bulk
+BULK_IMPORT_RESOURCES = ("formVariables", "formLogic")
+
+
+def remap_uuids(value: Any, uuid_mapping: dict[str, str]) -> Any:
+    """
+    Replace the UUIDs in the (parsed JSON) value according to the mapping.
+
+    UUIDs are also replaced when they're part of a larger string, such as API resource
+    URLs or keys in JSON logic expressions.
+    """
+    if not uuid_mapping:
+        return value
+    match value:
+        case str() if "-" in value:
+            return UUID_RE.sub(
+                lambda match: uuid_mapping.get(match.group(0), match.group(0)), value
+            )
+        case list():
+            return [remap_uuids(item, uuid_mapping) for item in value]
+        case dict():
+            return {
+                remap_uuids(key, uuid_mapping): remap_uuids(item, uuid_mapping)
+                for key, item in value.items()
+            }
+        case _:
+            return value
+
+
 @transaction.atomic
 @override(language=settings.LANGUAGE_CODE)
 def import_form_data(
@@ -204,16 +239,27 @@ def import_form_data(
         if resource not in import_data:
             continue
 
-        data = import_data[resource]
-        for old, new in uuid_mapping.items():
-            data = data.replace(old, new)
-
         try:
             serializer = SERIALIZERS[resource]
         except KeyError:
             raise ValidationError(f"Unknown resource {resource}")
 
-        for entry in json.loads(data):
+        # the references to the resources imported so far are updated in a single
+        # pass over the parsed data
+        entries = remap_uuids(json.loads(import_data[resource]), uuid_mapping)
+
+        if resource in BULK_IMPORT_RESOURCES:
+            # by now, the form resource has been created (or it was an existing one)
+            _import_in_bulk(
+                resource,
+                entries,
+                form=existing_form_instance or created_form,
+                request=request,
+                uuid_mapping=uuid_mapping,
+            )
+            continue
+
+        for entry in entries:
             if old_uuid := entry.get("uuid"):
                 entry["uuid"] = str(uuid4())
 
@@ -254,8 +300,8 @@ def import_form_data(
                     # existing instead of creating new definition. This may be
                     # both single and multiple use (is_reusable=True) form
                     # definitions, depending on whether it's for an existing form or not.
-                    # Note that the mapping will include the same UUID  here often,
-                    # which is okay for find-and-replace.
+                    # Note that the mapping will include the same UUID here often,
+                    # which is okay for the remapping.
                     serializer_kwargs["instance"] = existing_form_definition_instance
                     entry["uuid"] = old_uuid
                     uuid_mapping[old_uuid] = old_uuid
@@ -263,45 +309,8 @@ def import_form_data(
             if resource == "forms" and existing_form_instance:
                 serializer_kwargs["instance"] = existing_form_instance
 
-            if resource in ("formVariables", "formLogic"):
-                # by now, the form resource has been created (or it was an existing one)
-                _form = existing_form_instance or created_form
-                serializer_kwargs["context"].update(
-                    {
-                        "forms": {str(_form.uuid): _form},
-                        "form_definitions": {
-                            str(fd.uuid): fd
-                            for fd in FormDefinition.objects.filter(
-                                formstep__form=_form
-                            )
-                        },
-                    }
-                )
-                if "service_fetch_configuration" in entry:
-                    # The transferring between systems case is very tricky
-                    # better not import these, we don't know where this came from.
-                    # services and ids may point to different things
-                    # in different OF instances.
-                    del entry["service_fetch_configuration"]
-
-            if resource == "formLogic":
-                # by now, the form resource has been created (or it was an existing one)
-                _form = existing_form_instance or created_form
-                serializer_kwargs["context"].update(
-                    {
-                        "form_variables": FormVariableWrapper(_form),
-                        "form_steps": {
-                            form_step.uuid: form_step
-                            for form_step in _form.formstep_set.all()
-                        },
-                    }
-                )
-
             deserialized = serializer(**serializer_kwargs)
 
-            if resource == "formLogic" and "order" not in entry:
-                entry["order"] = 0
-
             try:
                 is_create = (
                     deserialized.instance is None or not deserialized.instance.pk
@@ -316,10 +325,6 @@ def import_form_data(
                 instance = deserialized.save()
                 if resource == "forms":
                     created_form = deserialized.instance
-                if resource == "formSteps":
-                    # Once the form steps have been created, we create the component FormVariables
-                    # based on the form definition configurations.
-                    FormVariable.objects.create_for_form(created_form)
                 if resource == "formDefinitions" and is_create:
                     uuid_mapping[old_uuid] = str(instance.uuid)
 
@@ -350,6 +355,61 @@ def import_form_data(
                 else:
                     raise e
 
+        if resource == "formSteps":
+            # Once the form steps have been created, we create the component FormVariables
+            # based on the form definition configurations.
+            FormVariable.objects.create_for_form(created_form)
+
+
+def _import_in_bulk(
+    resource: str,
+    entries: list[dict],
+    form: Form,
+    request,
+    uuid_mapping: dict[str, str],
+) -> None:
+    serializer = SERIALIZERS[resource]
+    context = {
+        "request": request,
+        "form": form,
+        "is_import": True,
+        # context for :class:`openforms.api.fields.RelatedFieldFromContext` lookups
+        "forms": {str(form.uuid): form},
+        "form_definitions": {
+            str(fd.uuid): fd
+            for fd in FormDefinition.objects.filter(formstep__form=form)
+        },
+    }
+    if resource == "formLogic":
+        context.update(
+            {
+                "form_variables": FormVariableWrapper(form),
+                "form_steps": {
+                    form_step.uuid: form_step for form_step in form.formstep_set.all()
+                },
+            }
+        )
+
+    validated_data = []
+    for entry in entries:
+        if "service_fetch_configuration" in entry:
+            # The transferring between systems case is very tricky
+            # better not import these, we don't know where this came from.
+            # services and ids may point to different things
+            # in different OF instances.
+            del entry["service_fetch_configuration"]
+        if resource == "formLogic" and "order" not in entry:
+            entry["order"] = 0
+
+        deserialized = serializer(data=entry, context=context)
+        deserialized.is_valid(raise_exception=True)
+        validated_data.append(deserialized.validated_data)
+
+    instances = serializer(many=True, context=context).create(validated_data)
+    for entry, instance in zip(entries, instances):
+        if (old_uuid := entry.get("uuid")) and hasattr(instance, "uuid"):
+            uuid_mapping[old_uuid] = str(instance.uuid)
+
 
 def apply_component_conversions(configuration):
     """
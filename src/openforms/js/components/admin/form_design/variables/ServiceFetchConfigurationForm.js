@@ -8,7 +8,7 @@ import ActionButton from 'components/admin/forms/ActionButton';
 import Field from 'components/admin/forms/Field';
 import Fieldset from 'components/admin/forms/Fieldset';
 import FormRow from 'components/admin/forms/FormRow';
-import {NumberInput, TextInput} from 'components/admin/forms/Inputs';
+import {Checkbox, NumberInput, TextInput} from 'components/admin/forms/Inputs';
 import JsonWidget from 'components/admin/forms/JsonWidget';
 import MappingArrayInput from 'components/admin/forms/MappingArrayInput';
 import Select from 'components/admin/forms/Select';
@@ -170,6 +170,25 @@ const ServiceFetchConfigurationForm = ({formik, selectExisting = false}) => {
               </Field>
             </FormRow>
 
+            <FormRow>
+              <Checkbox
+                name="cacheShared"
+                label={
+                  <FormattedMessage
+                    defaultMessage="Share cached responses"
+                    description="Label cache shared"
+                  />
+                }
+                helpText={
+                  <FormattedMessage
+                    defaultMessage="Re-use the cached responses for all submissions making the same request. Only enable this if the responses do not contain personal data."
+                    description="Help text cache shared"
+                  />
+                }
+                {...formik.getFieldProps({name: 'cacheShared', type: 'checkbox'})}
+              />
+            </FormRow>
+
             <FormRow fields={['queryParams']}>
               <Field
                 name="queryParams"
@@ -26,6 +26,7 @@ const INITIAL_VALUES = {
   jsonLogicExpression: {},
   jqExpression: '',
   cacheTimeout: null,
+  cacheShared: false,
 };
 
 const ServiceFetchConfigurationPicker = ({
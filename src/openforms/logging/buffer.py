@@ -0,0 +1,159 @@
+"""
+Buffered writing of audit log entries.
+
+Every :mod:`openforms.logging.logevent` call results in a timeline log entry. A single
+request or task typically logs several events (e.g. filling a step, the results of the
+prefill plugins, the outcome of a registration attempt), and inserting each of them
+individually adds up.
+
+Within a :func:`buffered_logging` block, the log entries are collected and written
+with a single bulk insert at the end of the block instead. The insert happens on the
+database connection (and in the transaction, if any) of the block, so the audit logs
+are committed or rolled back together with the rest of the work.
+
+Only use it for atomic units of work. Entries in the buffer are lost if the process is
+killed, so long-running, non-atomic work (like calling external systems) should log
+unbuffered, or flush the buffer (see :func:`flush_log_buffer`) before the risky part.
+
+High-volume events can additionally be configured (see the
+``AUDITLOG_QUEUED_EVENTS`` setting) to be written out-of-band by a Celery task once
+the transaction has been committed, taking them off the request/response cycle
+entirely.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import TYPE_CHECKING, Iterator
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from openforms.typing import JSONObject
+
+if TYPE_CHECKING:
+    from .models import TimelineLogProxy
+
+__all__ = ["LogBuffer", "buffered_logging", "flush_log_buffer", "write_log_entry"]
+
+logger = logging.getLogger(__name__)
+
+_state = threading.local()
+
+
+def serialize_log_entry(entry: TimelineLogProxy) -> JSONObject:
+    """
+    Serialize an (unsaved) log entry so that it can be passed to a Celery task.
+    """
+    content_type = (
+        ContentType.objects.get_for_model(entry.content_object)
+        if entry.content_object is not None
+        else None
+    )
+    return {
+        "content_type_id": content_type.pk if content_type else None,
+        "object_id": str(entry.content_object.pk) if content_type else None,
+        "template": entry.template,
+        # the extra data is stored with this encoder anyway
+        "extra_data": json.loads(json.dumps(entry.extra_data, cls=DjangoJSONEncoder)),
+        "user_id": entry.user_id,
+        # the entries are only created later, record when the event happened
+        "timestamp": timezone.now().isoformat(),
+    }
+
+
+def enqueue_log_entries(entries: list[JSONObject]) -> None:
+    from .tasks import create_log_entries
+
+    # the related objects may have been created in the current transaction
+    transaction.on_commit(partial(create_log_entries.delay, entries))
+
+
+class LogBuffer:
+    def __init__(self):
+        self.entries: list[TimelineLogProxy] = []
+        self.queued: list[JSONObject] = []
+
+    def __len__(self) -> int:
+        return len(self.entries) + len(self.queued)
+
+    def add(self, entry: TimelineLogProxy, queued: bool = False) -> None:
+        if queued:
+            self.queued.append(serialize_log_entry(entry))
+        else:
+            self.entries.append(entry)
+
+    def flush(self) -> None:
+        from .models import TimelineLogProxy
+
+        entries, self.entries = self.entries, []
+        if entries:
+            TimelineLogProxy.objects.bulk_create(entries)
+
+        queued, self.queued = self.queued, []
+        if queued:
+            enqueue_log_entries(queued)
+
+
+def get_current_buffer() -> LogBuffer | None:
+    return getattr(_state, "buffer", None)
+
+
+@contextmanager
+def buffered_logging() -> Iterator[LogBuffer]:
+    """
+    Collect the audit log entries created in the block and write them in bulk.
+
+    Can be used as context manager or as decorator. Nested blocks share the buffer of
+    the outermost block, which takes care of writing the entries.
+    """
+    buffer = get_current_buffer()
+    if buffer is not None:
+        yield buffer
+        return
+
+    buffer = _state.buffer = LogBuffer()
+    try:
+        yield buffer
+    except BaseException:
+        _state.buffer = None
+        # the logs of whatever happened before the error are still relevant, but
+        # don't mask the original exception if they can't be written (e.g. because
+        # the transaction is broken)
+        num_entries = len(buffer)
+        try:
+            buffer.flush()
+        except Exception:
+            logger.exception(
+                "Could not write %d buffered audit log entries", num_entries
+            )
+        raise
+    else:
+        _state.buffer = None
+        buffer.flush()
+
+
+def flush_log_buffer() -> None:
+    """
+    Write the entries collected so far by the current buffer, if there is one.
+    """
+    if (buffer := get_current_buffer()) is not None:
+        buffer.flush()
+
+
+def write_log_entry(entry: TimelineLogProxy, queued: bool = False) -> None:
+    """
+    Write the log entry, or add it to the current buffer if there is one.
+    """
+    if (buffer := get_current_buffer()) is not None:
+        buffer.add(entry, queued=queued)
+    elif queued:
+        enqueue_log_entries([serialize_log_entry(entry)])
+    else:
+        entry.save()
@@ -16,6 +16,8 @@ from openforms.payments.constants import PaymentStatus
 from openforms.plugins.plugin import AbstractBasePlugin
 from openforms.typing import JSONObject
 
+from .buffer import write_log_entry
+
 if TYPE_CHECKING:
     from openforms.payments.models import SubmissionPayment
     from openforms.submissions.models import Submission, SubmissionStep
@@ -61,12 +63,13 @@ def _create_log(
         #   save it on the TimelineLogProxy model
         user = None
 
-    log_entry = TimelineLogProxy.objects.create(
+    log_entry = TimelineLogProxy(
         content_object=object,
         template=f"logging/events/{event}.txt",
         extra_data=extra_data,
         user=user,
     )
+    write_log_entry(log_entry, queued=event in settings.AUDITLOG_QUEUED_EVENTS)
     # logger.debug('Logged event in %s %s %s', event, object._meta.object_name, object.pk)
     return log_entry
 
@@ -129,13 +132,10 @@ def pdf_generation_start(submission: Submission):
 
 
 def pdf_generation_success(submission: Submission, submission_report):
-    _create_log(
-        submission,
-        "pdf_generation_success",
-        extra_data={
-            "report_id": submission_report.id,
-        },
-    )
+    extra_data = {"report_id": submission_report.id}
+    if submission_report.render_stats is not None:
+        extra_data["render_stats"] = submission_report.render_stats.as_dict()
+    _create_log(submission, "pdf_generation_success", extra_data=extra_data)
 
 
 def pdf_generation_failure(submission: Submission, submission_report, error: Exception):
@@ -0,0 +1,27 @@
+from django.utils.dateparse import parse_datetime
+
+from ..celery import app
+from .models import TimelineLogProxy
+
+
+@app.task(ignore_result=True)
+def create_log_entries(entries: list[dict]) -> None:
+    """
+    Write the (queued) audit log entries, see :mod:`openforms.logging.buffer`.
+    """
+    log_entries = TimelineLogProxy.objects.bulk_create(
+        [
+            TimelineLogProxy(
+                content_type_id=entry["content_type_id"],
+                object_id=entry["object_id"],
+                template=entry["template"],
+                extra_data=entry["extra_data"],
+                user_id=entry["user_id"],
+            )
+            for entry in entries
+        ]
+    )
+    # the timestamp is set on insert, restore the moment the events actually happened
+    for log_entry, entry in zip(log_entries, entries):
+        log_entry.timestamp = parse_datetime(entry["timestamp"])
+    TimelineLogProxy.objects.bulk_update(log_entries, fields=["timestamp"])
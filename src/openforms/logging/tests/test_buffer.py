@@ -0,0 +1,138 @@
+from datetime import datetime
+from unittest.mock import patch
+
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from freezegun import freeze_time
+
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from .. import logevent
+from ..buffer import buffered_logging
+from ..models import TimelineLogProxy
+from ..tasks import create_log_entries
+
+
+class BufferedLoggingTests(TestCase):
+    def test_entries_are_written_at_the_end_of_the_block(self):
+        submission = SubmissionFactory.create()
+
+        with buffered_logging() as buffer:
+            logevent.submission_start(submission)
+            logevent.form_submit_success(submission)
+
+            self.assertEqual(len(buffer), 2)
+            self.assertFalse(TimelineLogProxy.objects.exists())
+
+        logs = TimelineLogProxy.objects.order_by("pk")
+        self.assertEqual(
+            [log.event for log in logs], ["submission_start", "form_submit_success"]
+        )
+        self.assertEqual(logs[0].content_object, submission)
+
+    def test_single_insert(self):
+        submission = SubmissionFactory.create()
+        ContentType.objects.get_for_model(submission)  # warm the cache
+
+        with self.assertNumQueries(1):
+            with buffered_logging():
+                logevent.submission_start(submission)
+                logevent.pdf_generation_start(submission)
+                logevent.form_submit_success(submission)
+
+    def test_nested_blocks_share_the_buffer(self):
+        submission = SubmissionFactory.create()
+
+        with buffered_logging() as outer:
+            with buffered_logging() as inner:
+                logevent.submission_start(submission)
+
+            self.assertIs(inner, outer)
+            self.assertFalse(TimelineLogProxy.objects.exists())
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 1)
+
+    def test_entries_are_written_on_errors(self):
+        submission = SubmissionFactory.create()
+
+        with self.assertRaises(ZeroDivisionError):
+            with buffered_logging():
+                logevent.registration_start(submission)
+                1 / 0
+
+        self.assertEqual(TimelineLogProxy.objects.get().event, "registration_start")
+
+    def test_write_errors_do_not_mask_the_original_error(self):
+        submission = SubmissionFactory.create()
+
+        with (
+            patch.object(
+                TimelineLogProxy.objects, "bulk_create", side_effect=RuntimeError
+            ),
+            self.assertRaises(ZeroDivisionError),
+        ):
+            with buffered_logging():
+                logevent.registration_start(submission)
+                1 / 0
+
+    def test_unbuffered_entries_are_written_immediately(self):
+        submission = SubmissionFactory.create()
+
+        logevent.submission_start(submission)
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 1)
+
+
+@override_settings(AUDITLOG_QUEUED_EVENTS=["submission_step_fill"])
+@patch("openforms.logging.tasks.create_log_entries.delay")
+class QueuedLoggingTests(TestCase):
+    def test_queued_events_are_written_after_commit(self, m_delay):
+        submission = SubmissionFactory.from_components(
+            [{"type": "textfield", "key": "foo"}], {"foo": "bar"}
+        )
+        step = submission.submissionstep_set.get()
+
+        with (
+            freeze_time("2024-01-15T10:00:00+01:00"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            with buffered_logging():
+                logevent.submission_step_fill(step)
+                logevent.form_submit_success(submission)
+
+            self.assertEqual(
+                TimelineLogProxy.objects.get().event, "form_submit_success"
+            )
+            m_delay.assert_not_called()
+
+        m_delay.assert_called_once()
+        (entries,) = m_delay.call_args.args
+        self.assertEqual(len(entries), 1)
+
+        with freeze_time("2024-01-15T10:05:00+01:00"):
+            create_log_entries(entries)
+
+        log = TimelineLogProxy.objects.filter_event("submission_step_fill").get()
+        self.assertEqual(log.content_object, submission)
+        self.assertEqual(log.extra_data["step_id"], step.id)
+        self.assertEqual(
+            log.timestamp, datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc)
+        )
+
+    def test_unbuffered_queued_events(self, m_delay):
+        submission = SubmissionFactory.from_components(
+            [{"type": "textfield", "key": "foo"}], {"foo": "bar"}
+        )
+        step = submission.submissionstep_set.get()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            logevent.submission_step_fill(step)
+
+            m_delay.assert_not_called()
+
+        m_delay.assert_called_once()
+        self.assertFalse(
+            TimelineLogProxy.objects.filter_event("submission_step_fill").exists()
+        )
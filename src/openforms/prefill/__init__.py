@@ -64,7 +64,7 @@ def _fetch_prefill_values(
     @elasticapm.capture_span(span_type="app.prefill")
     def invoke_plugin(
         item: tuple[str, str, list[str]]
-    ) -> tuple[str, str, dict[str, Any]]:
+    ) -> tuple[str, str, list[str], dict[str, Any], Exception | None]:
         plugin_id, identifier_role, fields = item
 
         plugin = register[plugin_id]
@@ -75,15 +75,9 @@ def _fetch_prefill_values(
             values = plugin.get_prefill_values(submission, fields, identifier_role)
         except Exception as e:
             logger.exception(f"exception in prefill plugin '{plugin_id}'")
-            logevent.prefill_retrieve_failure(submission, plugin, e)
-            values = {}
-        else:
-            if values:
-                logevent.prefill_retrieve_success(submission, plugin, fields)
-            else:
-                logevent.prefill_retrieve_empty(submission, plugin, fields)
+            return plugin_id, identifier_role, fields, {}, e
 
-        return plugin_id, identifier_role, values
+        return plugin_id, identifier_role, fields, values, None
 
     invoke_plugin_args = []
     for plugin_id, field_groups in grouped_fields.items():
@@ -94,7 +88,17 @@ def _fetch_prefill_values(
         results = executor.map(invoke_plugin, invoke_plugin_args)
 
     collected_results = {}
-    for plugin_id, identifier_role, values_dict in list(results):
+    # the audit logs are written from this thread rather than the worker threads, so
+    # that they end up in the (buffered) logs of the current request
+    for plugin_id, identifier_role, fields, values_dict, error in list(results):
+        plugin = register[plugin_id]
+        if error is not None:
+            logevent.prefill_retrieve_failure(submission, plugin, error)
+        elif values_dict:
+            logevent.prefill_retrieve_success(submission, plugin, fields)
+        else:
+            logevent.prefill_retrieve_empty(submission, plugin, fields)
+
         assign(
             collected_results,
             Path(plugin_id, identifier_role),
@@ -159,12 +163,19 @@ def prefill_variables(submission: Submission, register: Registry | None = None)
     be used to fetch the value. If ``register`` is not specified, the default registry instance
     will be used.
     """
-    from openforms.formio.service import normalize_value_for_component
+    from openforms.logging.buffer import buffered_logging
 
     from .registry import register as default_register
 
     register = register or default_register
 
+    with buffered_logging():
+        _prefill_variables(submission, register)
+
+
+def _prefill_variables(submission: Submission, register: Registry) -> None:
+    from openforms.formio.service import normalize_value_for_component
+
     state = submission.load_submission_value_variables_state()
     variables_to_prefill = state.get_prefill_variables()
 
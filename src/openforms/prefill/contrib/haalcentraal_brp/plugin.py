@@ -15,6 +15,7 @@ from openforms.contrib.haal_centraal.constants import BRPVersions
 from openforms.contrib.haal_centraal.models import HaalCentraalConfig
 from openforms.plugins.exceptions import InvalidPluginConfiguration
 from openforms.pre_requests.clients import PreRequestClientContext
+from openforms.submissions.lookup_cache import cached_lookup
 from openforms.submissions.models import Submission
 
 from ...base import BasePlugin
@@ -64,8 +65,15 @@ class HaalCentraalPrefill(BasePlugin):
         client: BRPClient,
         bsn: str,
         attributes: AttributesSequence,
+        submission: Submission | None = None,
     ) -> dict[str, Any]:
-        if not (data := client.find_person(bsn, attributes=attributes)):
+        data = cached_lookup(
+            submission,
+            "haal-centraal:person",
+            {"bsn": bsn, "attributes": list(attributes)},
+            lambda: client.find_person(bsn, attributes=attributes),
+        )
+        if not data:
             return {}
 
         values = dict()
@@ -117,7 +125,9 @@ class HaalCentraalPrefill(BasePlugin):
             return {}
 
         with client:
-            return cls._get_values_for_bsn(client, bsn_value, attributes)
+            return cls._get_values_for_bsn(
+                client, bsn_value, attributes, submission=submission
+            )
 
     @classmethod
     def get_co_sign_values(
@@ -153,6 +163,7 @@ class HaalCentraalPrefill(BasePlugin):
                     Attributes.naam_geslachtsnaam,
                     Attributes.naam_voorletters,
                 ),
+                submission=submission,
             )
 
         first_names = values.get(Attributes.naam_voornamen, "")
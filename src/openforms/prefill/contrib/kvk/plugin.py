@@ -12,6 +12,7 @@ from openforms.contrib.kvk.api_models.basisprofiel import BasisProfiel
 from openforms.contrib.kvk.client import NoServiceConfigured, get_client
 from openforms.contrib.kvk.models import KVKConfig
 from openforms.plugins.exceptions import InvalidPluginConfiguration
+from openforms.submissions.lookup_cache import cached_lookup
 from openforms.submissions.models import Submission
 
 from ...base import BasePlugin
@@ -62,9 +63,12 @@ class KVK_KVKNumberPrefill(BasePlugin):
         if not (kvk_value := self.get_identifier_value(submission, identifier_role)):
             return {}
 
-        try:
+        def get_profile() -> BasisProfiel:
             with get_client() as client:
-                result = client.get_profile(kvk_value)
+                return client.get_profile(kvk_value)
+
+        try:
+            result = cached_lookup(submission, "kvk:profile", kvk_value, get_profile)
         except (RequestException, NoServiceConfigured):
             return {}
 
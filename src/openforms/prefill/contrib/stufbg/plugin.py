@@ -10,6 +10,7 @@ from lxml import etree
 
 from openforms.authentication.constants import AuthAttribute
 from openforms.plugins.exceptions import InvalidPluginConfiguration
+from openforms.submissions.lookup_cache import cached_lookup
 from openforms.submissions.models import Submission
 from openforms.utils.xml import fromstring
 from stuf.stuf_bg.client import NoServiceConfigured, get_client
@@ -101,10 +102,23 @@ class StufBgPrefill(BasePlugin):
         return FieldChoices.choices
 
     def _get_values_for_bsn(
-        self, bsn: str, attributes: list[FieldChoices]
+        self,
+        bsn: str,
+        attributes: list[FieldChoices],
+        submission: Submission | None = None,
     ) -> dict[str, Any]:
-        with get_client() as client:
-            data = client.get_values(bsn, [str(attr) for attr in attributes])
+        attribute_names = [str(attr) for attr in attributes]
+
+        def get_values():
+            with get_client() as client:
+                return client.get_values(bsn, attribute_names)
+
+        data = cached_lookup(
+            submission,
+            "stuf-bg:values",
+            {"bsn": bsn, "attributes": attribute_names},
+            get_values,
+        )
 
         response_dict = {}
         for attribute in attributes:
@@ -155,7 +169,7 @@ class StufBgPrefill(BasePlugin):
             logger.info("No BSN associated with submission, cannot prefill.")
             return {}
 
-        return self._get_values_for_bsn(bsn_value, attributes)
+        return self._get_values_for_bsn(bsn_value, attributes, submission=submission)
 
     def get_co_sign_values(
         self, submission: Submission, identifier: str
@@ -9,6 +9,11 @@ The clients used are:
   in the form builder
 """
 
+from contextlib import contextmanager
+from queue import SimpleQueue
+from typing import Callable, Generic, Iterator, TypeVar
+
+from ape_pie import APIClient
 from zgw_consumers.client import build_client
 
 from openforms.contrib.zgw.clients import CatalogiClient, DocumentenClient, ZakenClient
@@ -20,6 +25,44 @@ class NoServiceConfigured(RuntimeError):
     pass
 
 
+C = TypeVar("C", bound=APIClient)
+
+
+class ClientPool(Generic[C]):
+    """
+    A fixed size pool of open client sessions, to be shared between threads.
+
+    The clients are instantiated upfront in the calling thread (instantiating them may
+    require database queries) and kept open until the pool is closed, so that the
+    underlying HTTP connections are re-used.
+    """
+
+    def __init__(self, factory: Callable[[], C], size: int):
+        self._clients = [factory() for _ in range(max(size, 1))]
+        self._available: SimpleQueue[C] = SimpleQueue()
+        for client in self._clients:
+            client.__enter__()
+            self._available.put(client)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @contextmanager
+    def acquire(self) -> Iterator[C]:
+        client = self._available.get()
+        try:
+            yield client
+        finally:
+            self._available.put(client)
+
+    def close(self) -> None:
+        for client in self._clients:
+            client.__exit__(None, None, None)
+
+
 def get_zaken_client(config: ZGWApiGroupConfig) -> ZakenClient:
     if not (service := config.zrc_service):
         raise NoServiceConfigured("No Zaken API service configured!")
@@ -1,13 +1,16 @@
 import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from functools import partial, wraps
-from typing import Any, TypedDict
+from typing import Any, Callable, TypedDict
 
+from django.conf import settings
+from django.db import connections
 from django.urls import reverse
 from django.utils.translation import gettext, gettext_lazy as _
 
 import requests
 from furl import furl
-from glom import assign
+from glom import assign, glom
 from rest_framework import serializers
 from zgw_consumers.api_models.constants import VertrouwelijkheidsAanduidingen
 
@@ -22,7 +25,11 @@ from openforms.contrib.zgw.service import (
 from openforms.formio.api.fields import FormioVariableKeyField
 from openforms.registrations.contrib.objects_api.client import get_objects_client
 from openforms.submissions.mapping import SKIP, FieldConf, apply_data_mapping
-from openforms.submissions.models import Submission, SubmissionReport
+from openforms.submissions.models import (
+    Submission,
+    SubmissionFileAttachment,
+    SubmissionReport,
+)
 from openforms.template.validators import DjangoTemplateValidator
 from openforms.utils.mixins import JsonSchemaSerializerMixin
 from openforms.utils.validators import validate_rsin
@@ -34,13 +41,140 @@ from ...exceptions import RegistrationFailed
 from ...registry import register
 from ...utils import execute_unless_result_exists
 from .checks import check_config
-from .client import get_catalogi_client, get_documents_client, get_zaken_client
+from .client import (
+    ClientPool,
+    get_catalogi_client,
+    get_documents_client,
+    get_zaken_client,
+)
 from .models import ZGWApiGroupConfig, ZgwConfig
 from .utils import process_according_to_eigenschap_format
 
 logger = logging.getLogger(__name__)
 
 
+def _run_in_worker(func: Callable[..., Any], *args, **kwargs) -> Any:
+    try:
+        return func(*args, **kwargs)
+    finally:
+        # the (NLX) clients may perform queries - don't leak the connections of the
+        # worker threads
+        connections.close_all()
+
+
+def register_attachments(
+    submission: Submission, zgw: ZGWApiGroupConfig, zaak: dict, options: dict
+) -> None:
+    """
+    Create the documents for the submission attachments and relate them to the zaak.
+
+    The attachments are independent of each other, so they are uploaded concurrently
+    on a bounded pool of client sessions. The intermediate results are recorded in the
+    calling thread as soon as each call completes, so that a partially failed run
+    resumes with the documents and relations that are still missing.
+    """
+    registration_result = submission.registration_result or {}
+    pending_documents: list[tuple[SubmissionFileAttachment, str, dict]] = []
+    pending_relations: list[tuple[str, dict]] = []
+
+    for attachment in submission.attachments:
+        spec = f"intermediate.documents.{attachment.id}"
+        if document := glom(registration_result, f"{spec}.document", default=None):
+            if not glom(registration_result, f"{spec}.relation", default=None):
+                pending_relations.append((spec, document))
+            continue
+
+        # collect attributes of the attachment and add them to the configuration
+        # attribute names conform to the Documenten API specification
+        iot = attachment.informatieobjecttype or options["informatieobjecttype"]
+        bronorganisatie = attachment.bronorganisatie or options["organisatie_rsin"]
+        vertrouwelijkheidaanduiding = (
+            attachment.doc_vertrouwelijkheidaanduiding
+            or options["doc_vertrouwelijkheidaanduiding"]
+        )
+        # `titel` should be a non-empty string
+        # `get_display_name` is used to enforce this
+        titel = attachment.titel or options.get("titel", attachment.get_display_name())
+        doc_options = {
+            **options,
+            "informatieobjecttype": iot,
+            "organisatie_rsin": bronorganisatie,
+            "titel": titel,
+        }
+        if vertrouwelijkheidaanduiding:
+            doc_options["doc_vertrouwelijkheidaanduiding"] = vertrouwelijkheidaanduiding
+        pending_documents.append((attachment, spec, doc_options))
+
+    num_pending = len(pending_documents) + len(pending_relations)
+    if not num_pending:
+        return
+
+    pool_size = min(settings.REGISTRATION_ATTACHMENT_UPLOAD_MAX_WORKERS, num_pending)
+    # assume the same language as the submission
+    language = submission.language_code
+    name = submission.form.admin_name
+
+    with (
+        ClientPool(partial(get_documents_client, zgw), pool_size) as documents_pool,
+        ClientPool(partial(get_zaken_client, zgw), pool_size) as zaken_pool,
+        ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="zgw-attachments"
+        ) as executor,
+    ):
+
+        def create_document(attachment: SubmissionFileAttachment, doc_options: dict):
+            with documents_pool.acquire() as documents_client:
+                return create_attachment_document(
+                    client=documents_client,
+                    name=name,
+                    submission_attachment=attachment,
+                    options=doc_options,
+                    language=language,
+                )
+
+        def relate_document(document: dict):
+            with zaken_pool.acquire() as zaken_client:
+                return zaken_client.relate_document(zaak=zaak, document=document)
+
+        # maps the future to the spec of the result and whether it's a document
+        futures: dict[Future, tuple[str, bool]] = {}
+        for attachment, spec, doc_options in pending_documents:
+            future = executor.submit(
+                _run_in_worker, create_document, attachment, doc_options
+            )
+            futures[future] = (spec, True)
+        for spec, document in pending_relations:
+            future = executor.submit(_run_in_worker, relate_document, document)
+            futures[future] = (spec, False)
+
+        error: Exception | None = None
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                spec, is_document = futures.pop(future)
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    # let the other uploads complete so their results are recorded
+                    error = error or exc
+                    continue
+
+                if not is_document:
+                    execute_unless_result_exists(
+                        lambda: result, submission, f"{spec}.relation"
+                    )
+                    continue
+
+                document = execute_unless_result_exists(
+                    lambda: result, submission, f"{spec}.document"
+                )
+                future = executor.submit(_run_in_worker, relate_document, document)
+                futures[future] = (spec, False)
+
+        if error is not None:
+            raise error
+
+
 class VariablesProperties(TypedDict):
     component_key: str
     eigenschap: str
@@ -456,55 +590,7 @@ class ZGWRegistration(BasePlugin):
                 "intermediate.status",
             )
 
-            # TODO: threading? asyncio?
-            for attachment in submission.attachments:
-                # collect attributes of the attachment and add them to the configuration
-                # attribute names conform to the Documenten API specification
-                iot = attachment.informatieobjecttype or options["informatieobjecttype"]
-                bronorganisatie = (
-                    attachment.bronorganisatie or options["organisatie_rsin"]
-                )
-                vertrouwelijkheidaanduiding = (
-                    attachment.doc_vertrouwelijkheidaanduiding
-                    or options["doc_vertrouwelijkheidaanduiding"]
-                )
-                # `titel` should be a non-empty string
-                # `get_display_name` is used to enforce this
-                titel = attachment.titel or options.get(
-                    "titel", attachment.get_display_name()
-                )
-                doc_options = {
-                    **options,
-                    "informatieobjecttype": iot,
-                    "organisatie_rsin": bronorganisatie,
-                    "titel": titel,
-                }
-                if vertrouwelijkheidaanduiding:
-                    doc_options["doc_vertrouwelijkheidaanduiding"] = (
-                        vertrouwelijkheidaanduiding
-                    )
-
-                attachment_document = execute_unless_result_exists(
-                    partial(
-                        create_attachment_document,
-                        client=documents_client,
-                        name=submission.form.admin_name,
-                        submission_attachment=attachment,
-                        options=doc_options,
-                        language=attachment.submission_step.submission.language_code,  # assume same as submission
-                    ),
-                    submission,
-                    f"intermediate.documents.{attachment.id}.document",
-                )
-                execute_unless_result_exists(
-                    partial(
-                        zaken_client.relate_document,
-                        zaak=zaak,
-                        document=attachment_document,
-                    ),
-                    submission,
-                    f"intermediate.documents.{attachment.id}.relation",
-                )
+            register_attachments(submission, zgw, zaak, options)
 
             result.update(
                 {
@@ -1186,11 +1186,22 @@ class ZGWBackendTests(TestCase):
             create_rol,
             get_statustypen,
             create_status,
-            create_attachment1_document,
-            relate_attachment1_document,
-            create_attachment2_document,
-            relate_attachment2_document,
+            *attachment_requests,
         ) = m.request_history
+        # the attachments are uploaded concurrently, the order is not deterministic
+        create_attachment_documents = {
+            request.json()["bestandsnaam"]: request
+            for request in attachment_requests
+            if request.url.startswith("https://documenten.nl/")
+        }
+        relate_attachment_documents = [
+            request
+            for request in attachment_requests
+            if request.url == "https://zaken.nl/api/v1/zaakinformatieobjecten"
+        ]
+        self.assertEqual(len(relate_attachment_documents), 2)
+        create_attachment1_document = create_attachment_documents["attachment1.jpg"]
+        create_attachment2_document = create_attachment_documents["attachment2.jpg"]
 
         with self.subTest("Attachment 1: override fields"):
             # Verify attachments
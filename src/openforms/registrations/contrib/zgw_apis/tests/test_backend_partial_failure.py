@@ -4,6 +4,7 @@ from unittest.mock import patch
 
 from django.test import TestCase, tag
 
+import requests
 import requests_mock
 from glom import glom
 from privates.test import temp_private_root
@@ -22,6 +23,7 @@ from openforms.submissions.tests.factories import (
 from ....constants import RegistrationAttribute
 from ....exceptions import RegistrationFailed
 from ....tasks import register_submission
+from ..plugin import register_attachments
 from .factories import ZGWApiGroupConfigFactory
 
 
@@ -855,3 +857,112 @@ class eigenschappenPartialRegistrationFailureTests(TestCase):
             "https://test.openzaak.nl/catalogi/api/v1/eigenschappen/1",
         )
         self.assertIn("traceback", submission.registration_result)
+
+
+@temp_private_root()
+class ConcurrentAttachmentUploadTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.requests_mock = requests_mock.Mocker()
+        self.requests_mock.start()
+        self.addCleanup(self.requests_mock.stop)
+
+    def test_failed_uploads_resume_with_the_missing_documents(self):
+        zgw_api_group = ZGWApiGroupConfigFactory.create(
+            zrc_service__api_root="https://zaken.nl/api/v1/",
+            drc_service__api_root="https://documenten.nl/api/v1/",
+            ztc_service__api_root="https://catalogus.nl/api/v1/",
+        )
+        submission = SubmissionFactory.create(
+            completed=True,
+            registration_result={
+                "zaak": {"url": "https://zaken.nl/api/v1/zaken/1"},
+            },
+        )
+        attachments = [
+            SubmissionFileAttachmentFactory.create(
+                submission_step__submission=submission,
+                file_name=f"attachment{index}.txt",
+            )
+            for index in range(1, 4)
+        ]
+        options = {
+            "informatieobjecttype": "https://catalogi.nl/api/v1/informatieobjecttypen/1",
+            "organisatie_rsin": "000000000",
+            "doc_vertrouwelijkheidaanduiding": "",
+        }
+        fail_for = {"attachment2.txt"}
+
+        def create_document(request, context):
+            filename = request.json()["bestandsnaam"]
+            if filename in fail_for:
+                context.status_code = 500
+                return {"type": "Server error"}
+            context.status_code = 201
+            return generate_oas_component(
+                "documenten",
+                "schemas/EnkelvoudigInformatieObject",
+                url=f"https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/{filename}",
+            )
+
+        def relate_document(request, context):
+            context.status_code = 201
+            return generate_oas_component(
+                "zaken",
+                "schemas/ZaakInformatieObject",
+                informatieobject=request.json()["informatieobject"],
+            )
+
+        self.requests_mock.post(
+            "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten",
+            json=create_document,
+        )
+        self.requests_mock.post(
+            "https://zaken.nl/api/v1/zaakinformatieobjecten",
+            json=relate_document,
+        )
+
+        with self.subTest("partial failure"):
+            with self.assertRaises(requests.HTTPError):
+                register_attachments(
+                    submission,
+                    zgw_api_group,
+                    submission.registration_result["zaak"],
+                    options,
+                )
+
+            submission.refresh_from_db()
+            documents = submission.registration_result["intermediate"]["documents"]
+            self.assertEqual(
+                set(documents), {str(attachments[0].id), str(attachments[2].id)}
+            )
+            for attachment in (attachments[0], attachments[2]):
+                result = documents[str(attachment.id)]
+                self.assertEqual(
+                    result["relation"]["informatieobject"],
+                    result["document"]["url"],
+                )
+
+        self.requests_mock.reset_mock()
+        fail_for.clear()
+
+        with self.subTest("retry"):
+            register_attachments(
+                submission,
+                zgw_api_group,
+                submission.registration_result["zaak"],
+                options,
+            )
+
+            submission.refresh_from_db()
+            documents = submission.registration_result["intermediate"]["documents"]
+            self.assertEqual(len(documents), 3)
+            # only the failed attachment is uploaded (and related) again
+            history = self.requests_mock.request_history
+            self.assertEqual(len(history), 2)
+            self.assertEqual(history[0].json()["bestandsnaam"], "attachment2.txt")
+            self.assertEqual(
+                history[1].json()["informatieobject"],
+                "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/attachment2.txt",
+            )
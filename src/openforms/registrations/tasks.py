@@ -11,6 +11,7 @@ from rest_framework.exceptions import ValidationError
 from openforms.celery import app
 from openforms.config.models import GlobalConfiguration
 from openforms.logging import logevent
+from openforms.logging.buffer import flush_log_buffer
 from openforms.payments.constants import PaymentStatus
 from openforms.submissions.constants import PostSubmissionEvents, RegistrationStatuses
 from openforms.submissions.models import Submission
@@ -188,6 +189,10 @@ def register_submission(submission_id: int, event: PostSubmissionEvents) -> None
         return
 
     logevent.registration_start(submission)
+    # the registration calls external systems and is not atomic - make sure the start
+    # of the attempt is recorded even if the task gets killed, also when the task is
+    # executed inside a buffered_logging block
+    flush_log_buffer()
 
     submission.last_register_date = timezone.now()
     submission.registration_status = RegistrationStatuses.in_progress
@@ -16,6 +16,7 @@ from zgw_consumers.models import Service
 
 from openforms.config.models import GlobalConfiguration
 from openforms.forms.models import FormRegistrationBackend
+from openforms.logging.buffer import buffered_logging
 from openforms.logging.models import TimelineLogProxy
 from openforms.submissions.constants import PostSubmissionEvents, RegistrationStatuses
 from openforms.submissions.tests.factories import SubmissionFactory
@@ -91,6 +92,47 @@ class RegistrationHookTests(TestCase):
         )
         self.assertEqual(self.submission.last_register_date, timezone.now())
 
+    def test_registration_start_is_logged_before_calling_the_plugin(self):
+        register = Registry()
+        test_closure = self
+
+        @register("callback")
+        class Plugin(BasePlugin):
+            verbose_name = "Assertion callback"
+            configuration_options = OptionsSerializer
+
+            def register_submission(self, submission, options):
+                test_closure.assertTrue(
+                    TimelineLogProxy.objects.filter(
+                        extra_data__log_event="registration_start"
+                    ).exists()
+                )
+                return {"result": "ok"}
+
+        model_field = FormRegistrationBackend._meta.get_field("backend")
+        with patch_registry(model_field, register):
+            for buffered in (False, True):
+                with self.subTest(buffered=buffered):
+                    TimelineLogProxy.objects.all().delete()
+                    self.submission.registration_status = RegistrationStatuses.pending
+                    self.submission.save()
+
+                    if buffered:
+                        with buffered_logging():
+                            register_submission(
+                                self.submission.id, PostSubmissionEvents.on_completion
+                            )
+                    else:
+                        register_submission(
+                            self.submission.id, PostSubmissionEvents.on_completion
+                        )
+
+                    self.submission.refresh_from_db()
+                    self.assertEqual(
+                        self.submission.registration_status,
+                        RegistrationStatuses.success,
+                    )
+
     @freeze_time("2021-08-04T12:00:00+02:00")
     def test_failing_registration(self):
         register = Registry()
@@ -9,6 +9,7 @@ from openforms.api.permissions import TimestampedTokenPermission
 from ..constants import SUBMISSIONS_SESSION_KEY, UPLOADS_SESSION_KEY
 from ..form_logic import check_submission_logic
 from ..models import SubmissionStep
+from ..ownership import get_session_set, in_session_set, session_set_is_empty
 from ..tokens import (
     submission_report_token_generator,
     submission_status_token_generator,
@@ -20,9 +21,10 @@ def owns_submission(request: Request, submission_uuid: str | UUID) -> bool:
     # The assumption is that auth plugin requirements like LoA
     # MUST be checked upon/before adding the submission uuid to the session
     # therefore "owning a submission" means those requirements were met.
-    active_submissions = request.session.get(SUBMISSIONS_SESSION_KEY, [])
     # Use str so this works with both UUIDs and UUIDs in string format
-    return str(submission_uuid) in active_submissions
+    return in_session_set(
+        request.session, SUBMISSIONS_SESSION_KEY, str(submission_uuid)
+    )
 
 
 class AnyActiveSubmissionPermission(permissions.BasePermission):
@@ -34,11 +36,7 @@ class AnyActiveSubmissionPermission(permissions.BasePermission):
         if getattr(view, "action", None) in ("create",):
             return True
 
-        active_submissions = request.session.get(SUBMISSIONS_SESSION_KEY)
-        if not active_submissions:
-            return False
-
-        return True
+        return not session_set_is_empty(request.session, SUBMISSIONS_SESSION_KEY)
 
 
 class FormAuthenticationPermission(permissions.BasePermission):
@@ -75,7 +73,7 @@ class ActiveSubmissionPermission(AnyActiveSubmissionPermission):
         return owns_submission(request, submission_uuid)
 
     def filter_queryset(self, request: Request, view: APIView, queryset):
-        active_submissions = request.session.get(SUBMISSIONS_SESSION_KEY)
+        active_submissions = get_session_set(request.session, SUBMISSIONS_SESSION_KEY)
         if not active_submissions:
             return queryset.none()
         return queryset.filter(uuid__in=active_submissions)
@@ -87,21 +85,16 @@ class OwnsTemporaryUploadPermission(permissions.BasePermission):
     """
 
     def has_permission(self, request: Request, view: APIView) -> bool:
-        active_uploads = request.session.get(UPLOADS_SESSION_KEY)
-        if not active_uploads:
-            return False
-        return True
+        return not session_set_is_empty(request.session, UPLOADS_SESSION_KEY)
 
     def has_object_permission(self, request: Request, view: APIView, obj) -> bool:
-        active_uploads = request.session.get(UPLOADS_SESSION_KEY)
-
         upload_url_kwarg = view.lookup_url_kwarg or view.lookup_field
         upload_uuid = view.kwargs[upload_url_kwarg]
 
-        return str(upload_uuid) in active_uploads
+        return in_session_set(request.session, UPLOADS_SESSION_KEY, str(upload_uuid))
 
     def filter_queryset(self, request: Request, view: APIView, queryset):
-        active_uploads = request.session.get(UPLOADS_SESSION_KEY)
+        active_uploads = get_session_set(request.session, UPLOADS_SESSION_KEY)
         if not active_uploads:
             return queryset.none()
         return queryset.filter(uuid__in=active_uploads)
@@ -24,6 +24,7 @@ from openforms.authentication.service import is_authenticated_with_an_allowed_pl
 from openforms.formio.service import FormioData
 from openforms.forms.models import FormStep
 from openforms.logging import logevent
+from openforms.logging.buffer import buffered_logging
 from openforms.prefill import prefill_variables
 from openforms.utils.patches.rest_framework_nested.viewsets import NestedViewSetMixin
 
@@ -159,6 +160,7 @@ class SubmissionViewSet(
         return self._get_object_cache
 
     @transaction.atomic
+    @buffered_logging()
     def perform_create(self, serializer):
         super().perform_create(serializer)
 
@@ -516,6 +518,7 @@ class SubmissionStepViewSet(
         },
     )
     @transaction.atomic()
+    @buffered_logging()
     def update(self, request, *args, **kwargs):
         """
         The submission data is either created or updated, depending on whether there was
@@ -630,6 +633,7 @@ class SubmissionStepViewSet(
                 submission_step,
                 merged_data.data,
                 dirty=True,
+                incremental=True,
                 request=request,
             )
             submission_step.form_step.form_definition.configuration = new_configuration
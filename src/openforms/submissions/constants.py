@@ -3,6 +3,8 @@ from django.utils.translation import gettext_lazy as _
 
 SUBMISSIONS_SESSION_KEY = "form-submissions"
 UPLOADS_SESSION_KEY = "form-uploads"
+# identifies the sets of owned submissions and uploads, see openforms.submissions.ownership
+OWNERSHIP_SESSION_KEY = "form-ownership"
 
 IMAGE_COMPONENTS = ["signature"]
 
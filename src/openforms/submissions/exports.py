@@ -1,11 +1,17 @@
+import csv
 import dataclasses
-from typing import Iterator
+import json
+import tempfile
+from typing import IO, Any, Iterable, Iterator
 
-from django.http import HttpResponse
+from django.http import FileResponse, StreamingHttpResponse
 from django.utils.timezone import make_naive
 
 import tablib
 from lxml import etree
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 from tablib.formats._json import serialize_objects_handler
 
 from .models import Submission
@@ -30,6 +36,9 @@ class ExportFileTypes:
     XML = FileType("xml", "text/xml")
 
 
+EXPORT_CHUNK_SIZE = 500
+
+
 def iter_submission_data_nodes(submission: Submission) -> Iterator[Node]:
     renderer = Renderer(submission, mode=RenderModes.export, as_html=False)
     for data_nodes in renderer.get_children():
@@ -39,59 +48,173 @@ def iter_submission_data_nodes(submission: Submission) -> Iterator[Node]:
             yield node
 
 
+def iter_submission_export_rows(
+    queryset: SubmissionQuerySet, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[list[Any]]:
+    """
+    Turn a submissions queryset into export rows, starting with the header row.
+
+    The submissions are retrieved in chunks (with their related data prefetched) and
+    processed one by one, so the memory usage does not depend on the number of
+    submissions.
+
+    .. note:: the queryset of submissions must all be of the same form!
+    """
+    queryset = queryset.select_related("auth_info").prefetch_related(
+        "submissionstep_set", "submissionvaluevariable_set"
+    )
+    form = None
+    headers: list[str] = []
+    for submission in queryset.iterator(chunk_size=chunk_size):
+        # share the form instance, so that everything cached on it (like the logic
+        # rules) is re-used for all submissions
+        if form is None:
+            form = submission.form
+        else:
+            submission.form = form
+
+        data_nodes = list(iter_submission_data_nodes(submission))
+        if not headers:
+            headers = ["Formuliernaam", "Inzendingdatum"]
+            if form.translation_enabled:
+                headers.append("Taalcode")
+            for data_node in data_nodes:
+                if hasattr(data_node, "component"):
+                    headers.append(data_node.component["key"])
+                elif hasattr(data_node, "variable"):
+                    headers.append(data_node.variable.key)
+            yield headers
+
+        inzending_datum = (
+            make_naive(submission.completed_on) if submission.completed_on else None
+        )
+        submission_data = [form.admin_name, inzending_datum]
+        if form.translation_enabled:
+            submission_data.append(submission.language_code)
+        submission_data += [data_node.value for data_node in data_nodes]
+        yield submission_data
+
+
 def create_submission_export(queryset: SubmissionQuerySet) -> tablib.Dataset:
     """
     Turn a submissions queryset into a tablib dataset for export.
 
     .. note:: the queryset of submissions must all be of the same form!
     """
+    rows = iter_submission_export_rows(queryset)
     # queryset *could* be empty
-    if not queryset:
+    headers = next(rows, None)
+    if headers is None:
         return tablib.Dataset()
 
-    first_submission = queryset[0]
-    headers = ["Formuliernaam", "Inzendingdatum"]
-    if first_submission.form.translation_enabled:
-        headers.append("Taalcode")
+    data = tablib.Dataset(headers=headers)
+    for row in rows:
+        data.append(row)
+    return data
 
-    for data_node in iter_submission_data_nodes(first_submission):
-        if hasattr(data_node, "component"):
-            headers.append(data_node.component["key"])
-        elif hasattr(data_node, "variable"):
-            headers.append(data_node.variable.key)
 
-    data = tablib.Dataset(headers=headers)
+class _Echo:
+    """
+    File-like object returning the written value, for use with writers expecting a
+    file object.
+    """
 
-    for submission in queryset:
-        inzending_datum = (
-            make_naive(submission.completed_on) if submission.completed_on else None
+    def write(self, value):
+        return value
+
+
+def _stream_csv(rows: Iterator[list[Any]]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def _stream_json(rows: Iterator[list[Any]]) -> Iterator[str]:
+    headers = next(rows, [])
+    yield "["
+    for index, row in enumerate(rows):
+        record = json.dumps(
+            dict(zip(headers, row)),
+            default=serialize_objects_handler,
+            ensure_ascii=False,
         )
-        submission_data = [
-            submission.form.admin_name,
-            inzending_datum,
-        ]
-        if first_submission.form.translation_enabled:
-            submission_data.append(submission.language_code)
-        submission_data += [
-            data_node.value for data_node in iter_submission_data_nodes(submission)
-        ]
-        data.append(submission_data)
-    return data
+        yield f", {record}" if index else record
+    yield "]"
+
+
+def _stream_xml(rows: Iterator[list[Any]]) -> Iterator[bytes]:
+    headers = next(rows, None)
+    if headers is None:
+        yield XMLKeyValueExport.export_set(tablib.Dataset())
+        return
+
+    yield b"<?xml version='1.0' encoding='utf8'?>\n<submissions>\n"
+    for row in rows:
+        elem = XMLKeyValueExport.build_submission_element(zip(headers, row))
+        # mimic the pretty printing of the complete document
+        etree.indent(elem, space="  ", level=1)
+        yield b"  " + etree.tostring(elem, encoding="utf8", xml_declaration=False)
+        yield b"\n"
+    yield b"</submissions>\n"
+
+
+def _write_xlsx(rows: Iterator[list[Any]], file: IO[bytes]) -> None:
+    # the write-only mode flushes the rows to disk rather than keeping them in memory
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title="Tablib Dataset")
+    bold = Font(bold=True)
+    for index, row in enumerate(rows):
+        if index == 0:
+            worksheet.freeze_panes = "A2"
+        cells = []
+        for value in row:
+            try:
+                cell = WriteOnlyCell(worksheet, value=value)
+            except (ValueError, TypeError):
+                cell = WriteOnlyCell(worksheet, value=str(value))
+            if index == 0:
+                cell.font = bold
+            cells.append(cell)
+        worksheet.append(cells)
+    workbook.save(file)
+
+
+_STREAMING_WRITERS = {
+    ExportFileTypes.CSV.extension: _stream_csv,
+    ExportFileTypes.JSON.extension: _stream_json,
+    ExportFileTypes.XML.extension: _stream_xml,
+}
 
 
 def export_submissions(
     queryset: SubmissionQuerySet, file_type: FileType
-) -> HttpResponse:
-    export_data = create_submission_export(queryset)
+) -> StreamingHttpResponse | FileResponse:
+    """
+    Export the submissions, generating the file while it is being sent.
+
+    Rows are generated one submission at a time. Spreadsheets can't be streamed, so
+    those are written to a temporary file first.
+    """
     filename = f"submissions_export.{file_type.extension}"
+    rows = iter_submission_export_rows(queryset)
 
-    response = HttpResponse(
-        export_data.export(file_type.extension),
+    if (writer := _STREAMING_WRITERS.get(file_type.extension)) is not None:
+        response = StreamingHttpResponse(
+            writer(rows), content_type=file_type.content_type
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    assert file_type == ExportFileTypes.XLSX
+    file = tempfile.TemporaryFile()
+    _write_xlsx(rows, file)
+    file.seek(0)
+    return FileResponse(
+        file,
+        as_attachment=True,
+        filename=filename,
         content_type=file_type.content_type,
     )
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
-
-    return response
 
 
 def _xml_basic_value(value) -> str:
@@ -137,14 +260,19 @@ class XMLKeyValueExport:
             </field>
     """
 
+    @classmethod
+    def build_submission_element(cls, items: Iterable[tuple[str, Any]]):
+        elem = etree.Element("submission")
+        for key, value in items:
+            field = etree.SubElement(elem, "field", name=key)
+            _xml_value(field, value, wrap_single=True)
+        return elem
+
     @classmethod
     def export_set(cls, dset):
         root = etree.Element("submissions")
         for row in dset.dict:
-            elem = etree.SubElement(root, "submission")
-            for key, value in row.items():
-                field = etree.SubElement(elem, "field", name=key)
-                _xml_value(field, value, wrap_single=True)
+            root.append(cls.build_submission_element(row.items()))
 
         return etree.tostring(
             root, xml_declaration=True, encoding="utf8", pretty_print=True
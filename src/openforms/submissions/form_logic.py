@@ -15,6 +15,7 @@ from openforms.typing import DataMapping
 
 from .logic.actions import PropertyAction
 from .logic.datastructures import DataContainer
+from .logic.incremental import IncrementalEvaluation
 from .logic.rules import (
     EvaluatedRule,
     get_current_step,
@@ -33,6 +34,7 @@ def evaluate_form_logic(
     step: "SubmissionStep",
     data: DataMapping,
     dirty=False,
+    incremental=False,
     **context,
 ) -> DataMapping:
     """
@@ -58,6 +60,9 @@ def evaluate_form_logic(
        1. If a variable value is being update, update the variable state
        2. Else record the action to perform to the configuration (but don't apply it yet!)
 
+       In incremental mode, only the rules affected by data changes since the
+       previous evaluation are evaluated, the outcome of the other rules is replayed.
+
     6. The variables state is now completely resolved and can be used as input for the
        dynamic configuration.
     7. Apply the dynamic configuration
@@ -92,6 +97,11 @@ def evaluate_form_logic(
     rules = get_rules_to_evaluate(submission, step)
     data_container = DataContainer(state=submission_variables_state)
 
+    incremental_evaluation = None
+    if incremental:
+        incremental_evaluation = IncrementalEvaluation(submission, rules)
+        incremental_evaluation.prepare(data_container.data)
+
     # 5. Evaluate the logic rules in order
     mutation_operations = []
     evaluated_rules: list[EvaluatedRule] = []
@@ -107,9 +117,13 @@ def evaluate_form_logic(
             data_container,
             on_rule_check=evaluated_rules.append,
             submission=submission,
+            incremental=incremental_evaluation,
         ):
             mutation_operations.append(operation)
 
+    if incremental_evaluation is not None:
+        incremental_evaluation.save()
+
     # 6. The variable state is now completely resolved - we can start processing the
     # dynamic configuration and side effects.
 
@@ -147,9 +161,10 @@ def evaluate_form_logic(
     # only keep the changes in the data, so that old values do not overwrite otherwise
     # debounced client-side data changes
     data_diff = FormioData()
+    visibility = config_wrapper.get_visibility(data_container.data)
     for component in config_wrapper:
         key = component["key"]
-        is_visible = config_wrapper.is_visible_in_frontend(key, data_container.data)
+        is_visible = visibility[key]
         if is_visible:
             continue
 
@@ -165,6 +180,8 @@ def evaluate_form_logic(
         # clear the value
         data_container.update({key: empty_value})
         data_diff[key] = empty_value
+        # the cleared value may be used in the conditionals of subsequent components
+        visibility.recompute(key, data_container.data)
 
     # 7.2 Interpolate the component configuration with the variables.
     translate = (
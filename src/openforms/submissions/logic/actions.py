@@ -1,14 +1,10 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+from copy import deepcopy
+from dataclasses import dataclass, field
 from typing import Any, Mapping, TypedDict
 
-from django.core.cache import cache
-from django.core.serializers.json import DjangoJSONEncoder
-
 from glom import assign
-from json_logic import jsonLogic
 from typing_extensions import Self
 
 from openforms.dmn.service import evaluate_dmn
@@ -17,12 +13,14 @@ from openforms.formio.service import FormioConfigurationWrapper
 from openforms.forms.constants import LogicActionTypes
 from openforms.forms.models import FormLogic, FormVariable
 from openforms.typing import DataMapping, JSONObject
+from openforms.utils.json_logic import CompiledExpression, compile_expression
 from openforms.variables.models import ServiceFetchConfiguration
 
 from ..models import Submission, SubmissionStep
 from ..models.submission_step import DirtyData
 from .log_utils import log_errors
-from .service_fetching import perform_service_fetch
+from .result_cache import ResultCache
+from .service_fetching import ServiceFetchBatch, perform_service_fetch
 
 
 class ActionDetails(TypedDict):
@@ -97,7 +95,8 @@ class PropertyAction(ActionOperation):
         if self.component not in configuration:
             return None
         component = configuration[self.component]
-        assign(component, self.property, self.value, missing=dict)
+        # the action operation is shared, so ensure nothing can mutate its value
+        assign(component, self.property, deepcopy(self.value), missing=dict)
 
 
 class DisableNextAction(ActionOperation):
@@ -166,6 +165,10 @@ class StepApplicableAction(ActionOperation):
 class VariableAction(ActionOperation):
     variable: str
     value: JSONObject
+    program: CompiledExpression = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.program = compile_expression(self.value)
 
     @classmethod
     def from_action(cls, action: ActionDict) -> Self:
@@ -177,36 +180,52 @@ class VariableAction(ActionOperation):
         submission: Submission,
     ) -> DataMapping:
         with log_errors(self.value, self.rule):
-            return {self.variable: jsonLogic(self.value, context)}
+            return {self.variable: self.program(context)}
 
 
 @dataclass
 class ServiceFetchAction(ActionOperation):
     variable: str
     fetch_config: int
+    # set during logic evaluation to resolve the fetches concurrently
+    batch: ServiceFetchBatch | None = field(default=None, compare=False, repr=False)
 
     @classmethod
     def from_action(cls, action: ActionDict) -> Self:
         return cls(variable=action["variable"], fetch_config=action["action"]["value"])
 
-    def eval(
-        self,
-        context: DataMapping,
-        submission: Submission,
-    ) -> DataMapping:
+    def get_variable(self) -> FormVariable:
+        if self.batch is not None:
+            return self.batch.get_variable(
+                (self.variable, self.fetch_config), self._load_variable
+            )
+        return self._load_variable()
+
+    def _load_variable(self) -> FormVariable:
         # FIXME
         # https://github.com/open-formulieren/open-forms/issues/3052
         if self.fetch_config:  # the old way
-            var = FormVariable(
+            fetch_configs = ServiceFetchConfiguration.objects.select_related("service")
+            return FormVariable(
                 key=self.variable,
-                service_fetch_configuration=ServiceFetchConfiguration.objects.get(
-                    pk=self.fetch_config
-                ),
+                service_fetch_configuration=fetch_configs.get(pk=self.fetch_config),
             )
-        else:  # the current way
-            var = self.rule.form.formvariable_set.get(key=self.variable)
+        # the current way
+        return self.rule.form.formvariable_set.select_related(
+            "service_fetch_configuration__service"
+        ).get(key=self.variable)
+
+    def eval(
+        self,
+        context: DataMapping,
+        submission: Submission,
+    ) -> DataMapping:
+        var = self.get_variable()
         with log_errors({}, self.rule):  # TODO proper error handling
-            result = perform_service_fetch(var, context, str(submission.uuid))
+            if self.batch is not None:
+                result = self.batch.resolve(var, context)
+            else:
+                result = perform_service_fetch(var, context, str(submission.uuid))
             return {var.key: result.value}
 
 
@@ -258,15 +277,16 @@ class EvaluateDMNAction(ActionOperation):
             )
 
         # Perform DMN call or retrieve result from cache
-        inputs = json.dumps(dmn_inputs, cls=DjangoJSONEncoder, sort_keys=True)
-        cache_key = hash(
-            str(submission.uuid)
-            + self.decision_definition_id
-            + self.decision_definition_version
-            + self.plugin_id
-            + inputs
+        result_cache = ResultCache(namespace=f"dmn:{self.plugin_id}")
+        dmn_outputs = result_cache.get_or_set(
+            (
+                str(submission.uuid),
+                self.decision_definition_id,
+                self.decision_definition_version,
+                dmn_inputs,
+            ),
+            default=_evaluate_dmn,
         )
-        dmn_outputs = cache.get_or_set(cache_key, default=_evaluate_dmn)
 
         # Map DMN output to form variables
         return {
@@ -0,0 +1,65 @@
+"""
+Compiled logic rules, cached for the lifetime of the process.
+
+The same logic rules are evaluated over and over again for every submission of a form.
+Rather than interpreting the raw JSON-logic trigger and building the action operations
+from the raw action JSON for every evaluation, we compile them once per rule revision.
+
+The cache key is derived from the rule UUID and a digest of its content, so a rule
+that was modified (e.g. through the logic bulk update endpoint) is automatically
+recompiled in every process, while stale entries are evicted by the LRU policy.
+"""
+
+from copy import copy
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from openforms.forms.models import FormLogic
+from openforms.typing import DataMapping
+from openforms.utils.cache import LRUCache
+from openforms.utils.json_logic import CompiledExpression, compile_expression
+
+from .actions import ActionOperation, compile_action_operation
+
+__all__ = ["CompiledRule", "get_compiled_rule", "get_rule_hash"]
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    trigger: CompiledExpression
+    # unbound action operations - they are shared between threads and must not be
+    # mutated, use :meth:`bind_actions` instead.
+    actions: tuple[ActionOperation, ...]
+
+    def evaluate_trigger(self, data: DataMapping) -> Any:
+        return self.trigger(data)
+
+    def bind_actions(self, rule: FormLogic) -> Iterator[ActionOperation]:
+        for template in self.actions:
+            action = copy(template)
+            action.rule = rule
+            yield action
+
+
+def compile_rule(rule: FormLogic) -> CompiledRule:
+    return CompiledRule(
+        trigger=compile_expression(rule.json_logic_trigger),
+        actions=tuple(compile_action_operation(action) for action in rule.actions),
+    )
+
+
+_compiled_rules: LRUCache[tuple[str, str], CompiledRule] = LRUCache(maxsize=4096)
+
+
+def get_rule_hash(rule: FormLogic) -> str:
+    # the rule instances are typically cached on the form instance for the duration
+    # of the request, avoid calculating the digest over and over again
+    rule_hash = getattr(rule, "_rule_hash", None)
+    if rule_hash is None:
+        rule_hash = rule._rule_hash = rule.get_hash()
+    return rule_hash
+
+
+def get_compiled_rule(rule: FormLogic) -> CompiledRule:
+    key = (str(rule.uuid), get_rule_hash(rule))
+    return _compiled_rules.get_or_set(key, lambda: compile_rule(rule))
@@ -12,20 +12,34 @@ from ..models.submission_value_variable import SubmissionValueVariablesState
 class DataContainer:
     """
     A data container to manage the data/variables lifecycle during logic evaluation.
+
+    The nested data view is built once and patched in place when variable values are
+    updated, as it is read for every trigger and action of every logic rule.
     """
 
     state: SubmissionValueVariablesState
 
     _initial_data: tuple[tuple[str, Any]] = field(init=False, default_factory=tuple)
+    _data: FormioData | None = field(init=False, default=None)
 
     def __post_init__(self):
-        # ensure the initial data is immutable
-        self._initial_data = tuple(self.data.items())  # record for logging purposes
+        # ensure the initial data is immutable - build a separate copy since the
+        # (nested) data view is mutated in place on updates
+        self._initial_data = tuple(
+            self._build_data().data.items()
+        )  # record for logging purposes
 
     @property
     def initial_data(self) -> DataMapping:
         return dict(self._initial_data)
 
+    def _build_data(self) -> FormioData:
+        dynamic_values = {
+            key: variable.to_python() for key, variable in self.state.variables.items()
+        }
+        static_values = self.state.static_data()
+        return FormioData({**dynamic_values, **static_values})
+
     @property
     def data(self) -> DataMapping:
         """
@@ -35,20 +49,27 @@ class DataContainer:
         the static variables.
 
         :return: A datamapping (key: variable key, value: variable value) ready for
-          (template context) evaluation.
+          (template context) evaluation. Do not mutate it - use :meth:`update`
+          instead.
         """
-        dynamic_values = {
-            key: variable.to_python() for key, variable in self.state.variables.items()
-        }
-        static_values = self.state.static_data()
-        nested_data = FormioData({**dynamic_values, **static_values})
-        return nested_data.data
+        if self._data is None:
+            self._data = self._build_data()
+        return self._data.data
 
     def update(self, updates: DataMapping) -> None:
         """
         Update the dynamic data state.
         """
-        self.state.set_values(updates)
+        updated_keys = self.state.set_values(updates)
+        if self._data is None:
+            return
+
+        static_values = self.state.static_data()
+        for key in updated_keys:
+            # static variables take precedence, see :meth:`_build_data`
+            if key in static_values:
+                continue
+            self._data[key] = self.state.variables[key].to_python()
 
     def get_updated_step_data(self, step: SubmissionStep) -> FormioData:
         relevant_variables = self.state.get_variables_in_submission_step(
@@ -0,0 +1,288 @@
+"""
+Dependency analysis of form logic rules.
+
+Each logic rule reads a number of variables (in its trigger and in the actions) and
+writes a number of variables (through its actions). By extracting these references
+from the JSON-logic expressions, we can build a graph telling us which rules need to
+be re-evaluated when some input data changes - see
+:mod:`openforms.submissions.logic.incremental`.
+
+The analysis is conservative: whenever we can't statically determine what a rule
+depends on (dynamic ``var`` lookups, time-dependent operators, external service
+calls...), the rule is marked as *volatile* and is always evaluated.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Sequence
+
+from django.template.base import FilterExpression, TextNode, Variable, VariableNode
+
+from json_logic.meta import JSONLogicExpressionTree, Operation
+from json_logic.typing import JSON, Primitive
+
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.models import FormLogic
+from openforms.template import sandbox_backend, template_cache
+from openforms.utils.cache import LRUCache
+from openforms.utils.json_logic import introspect_json_logic
+from openforms.variables.models import ServiceFetchConfiguration
+
+from .compilation import get_rule_hash
+
+__all__ = [
+    "RuleDependencies",
+    "RuleDependencyGraph",
+    "get_rule_dependencies",
+    "get_rule_outputs",
+    "get_fetch_inputs",
+    "get_dependency_graph",
+]
+
+# operators whose outcome can't be derived from the (variable) input data alone
+VOLATILE_OPERATORS = {"today", "missing", "missing_some"}
+# operators evaluating (some of) their arguments in a different data scope
+SCOPED_OPERATORS = {"map", "reduce"}
+
+
+@dataclass(frozen=True)
+class RuleDependencies:
+    inputs: frozenset[str]
+    outputs: frozenset[str]
+    volatile: bool = False
+
+
+class _VolatileExpression(Exception):
+    pass
+
+
+def _iter_var_paths(tree: JSONLogicExpressionTree) -> Iterator[str]:
+    if isinstance(tree, Primitive):
+        return
+
+    if isinstance(tree, list):
+        for item in tree:
+            yield from _iter_var_paths(item)
+        return
+
+    assert isinstance(tree, Operation)
+    if tree.operator in VOLATILE_OPERATORS:
+        raise _VolatileExpression()
+
+    if tree.operator == "var":
+        path = tree.arguments[0] if tree.arguments else ""
+        # the whole data structure or a dynamically determined path
+        if not isinstance(path, (str, int)) or path in ("", None):
+            raise _VolatileExpression()
+        yield str(path)
+        # default values may be expressions too
+        yield from _iter_var_paths(tree.arguments[1:])
+        return
+
+    arguments = tree.arguments
+    if tree.operator in SCOPED_OPERATORS:
+        # the scoped logic (second argument) is evaluated against each item rather
+        # than the data, so only the iterable and initializer can refer to variables
+        arguments = [arg for index, arg in enumerate(arguments) if index != 1]
+    yield from _iter_var_paths(arguments)
+
+
+def get_expression_inputs(expression: JSON) -> frozenset[str]:
+    """
+    Extract the variable paths read by a JSON-logic expression.
+
+    :raises _VolatileExpression: if the inputs cannot be statically determined.
+    """
+    tree = introspect_json_logic(expression).tree
+    return frozenset(_iter_var_paths(tree))
+
+
+def _iter_filter_expression_paths(expression: FilterExpression) -> Iterator[str]:
+    variables = [expression.var] + [
+        arg for _, args in expression.filters for lookup, arg in args if lookup
+    ]
+    for variable in variables:
+        # literals are resolved at parse time
+        if isinstance(variable, Variable) and variable.lookups is not None:
+            yield ".".join(variable.lookups)
+
+
+def _iter_template_var_paths(source: str) -> Iterator[str]:
+    template = template_cache.get_template(source, backend=sandbox_backend)
+    for node in template.template.nodelist:
+        match node:
+            case TextNode():
+                continue
+            case VariableNode():
+                yield from _iter_filter_expression_paths(node.filter_expression)
+            # tags may read (and set) anything in the context
+            case _:
+                raise _VolatileExpression()
+
+
+def get_fetch_inputs(fetch_config: ServiceFetchConfiguration) -> frozenset[str]:
+    """
+    Extract the variable paths used in the templated request arguments of a service
+    fetch configuration.
+
+    :raises _VolatileExpression: if the inputs cannot be statically determined.
+    """
+    sources = [
+        fetch_config.path,
+        *(fetch_config.headers or {}).values(),
+        *(
+            value
+            for values in (fetch_config.query_params or {}).values()
+            for value in (values if isinstance(values, list) else (values,))
+        ),
+    ]
+    return frozenset(
+        path for source in sources for path in _iter_template_var_paths(source)
+    )
+
+
+def get_rule_dependencies(rule: FormLogic) -> RuleDependencies:
+    inputs: set[str] = set()
+    outputs: set[str] = set()
+    try:
+        inputs.update(get_expression_inputs(rule.json_logic_trigger))
+        for action in rule.actions:
+            action_details = action["action"]
+            match action_details["type"]:
+                case LogicActionTypes.variable:
+                    inputs.update(get_expression_inputs(action_details["value"]))
+                    outputs.add(action["variable"])
+                case LogicActionTypes.evaluate_dmn:
+                    config = action_details["config"]
+                    inputs.update(
+                        item["form_variable"] for item in config["input_mapping"]
+                    )
+                    outputs.update(
+                        item["form_variable"] for item in config["output_mapping"]
+                    )
+                case LogicActionTypes.fetch_from_service:
+                    # the request arguments may be templated with any variable
+                    outputs.add(action["variable"])
+                    raise _VolatileExpression()
+    # malformed rules are treated as volatile too - evaluation will log the errors
+    except Exception:
+        return RuleDependencies(
+            inputs=frozenset(inputs), outputs=frozenset(outputs), volatile=True
+        )
+    return RuleDependencies(inputs=frozenset(inputs), outputs=frozenset(outputs))
+
+
+def get_rule_outputs(rule: FormLogic) -> frozenset[str] | None:
+    """
+    Extract the variables written by the actions of a rule.
+
+    Unlike the inputs, the outputs can always be statically determined for valid
+    actions - ``None`` is returned for malformed actions.
+    """
+    outputs: set[str] = set()
+    try:
+        for action in rule.actions:
+            action_details = action["action"]
+            match action_details["type"]:
+                case LogicActionTypes.variable | LogicActionTypes.fetch_from_service:
+                    outputs.add(action["variable"])
+                case LogicActionTypes.evaluate_dmn:
+                    outputs.update(
+                        item["form_variable"]
+                        for item in action_details["config"]["output_mapping"]
+                    )
+    except (KeyError, TypeError):
+        return None
+    return frozenset(outputs)
+
+
+def paths_overlap(path: str, other: str) -> bool:
+    """
+    Check if two (dotted) variable paths refer to (part of) the same data.
+    """
+    if path == other:
+        return True
+    return path.startswith(f"{other}.") or other.startswith(f"{path}.")
+
+
+def _any_overlap(paths: Iterable[str], others: Iterable[str]) -> bool:
+    others = list(others)
+    return any(paths_overlap(path, other) for path in paths for other in others)
+
+
+def get_rules_revision(rules: Sequence[FormLogic]) -> str:
+    """
+    Calculate a digest uniquely identifying the (ordered) set of rules.
+    """
+    hasher = hashlib.sha256()
+    for rule in rules:
+        hasher.update(f"{rule.uuid}:{get_rule_hash(rule)};".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class RuleDependencyGraph:
+    """
+    The rule -> variables dependency graph for an ordered collection of rules.
+
+    Rules are identified by their UUID (as string).
+    """
+
+    def __init__(self, rules: Sequence[FormLogic], revision: str = ""):
+        self.revision = revision or get_rules_revision(rules)
+        self.dependencies: dict[str, RuleDependencies] = {
+            str(rule.uuid): get_rule_dependencies(rule) for rule in rules
+        }
+        self.input_paths: frozenset[str] = frozenset().union(
+            *(deps.inputs for deps in self.dependencies.values())
+        )
+        # rule -> rules reading one or more of its outputs, regardless of the rule
+        # order (an earlier rule may read the persisted output of a later rule)
+        self.dependents: dict[str, set[str]] = {
+            rule_id: {
+                other_id
+                for other_id, other in self.dependencies.items()
+                if other_id != rule_id and _any_overlap(deps.outputs, other.inputs)
+            }
+            for rule_id, deps in self.dependencies.items()
+        }
+
+    def get_dirty_rules(
+        self, changed_paths: Iterable[str], unknown_rules: Iterable[str] = ()
+    ) -> set[str]:
+        """
+        Determine which rules must be re-evaluated given the changed input paths.
+
+        :arg changed_paths: variable paths for which the value changed since the
+          previous evaluation.
+        :arg unknown_rules: rule IDs for which no previous evaluation result exists.
+        :returns: the rule IDs that must be evaluated, including the transitive
+          dependents of the rules directly affected.
+        """
+        changed_paths = list(changed_paths)
+        dirty = set(unknown_rules)
+        for rule_id, deps in self.dependencies.items():
+            if deps.volatile or _any_overlap(deps.inputs, changed_paths):
+                dirty.add(rule_id)
+
+        to_visit = list(dirty)
+        while to_visit:
+            rule_id = to_visit.pop()
+            for dependent in self.dependents.get(rule_id, ()):
+                if dependent in dirty:
+                    continue
+                dirty.add(dependent)
+                to_visit.append(dependent)
+        return dirty
+
+
+_graph_cache: LRUCache[str, RuleDependencyGraph] = LRUCache(maxsize=256)
+
+
+def get_dependency_graph(rules: Sequence[FormLogic]) -> RuleDependencyGraph:
+    """
+    Get the (process-level cached) dependency graph for the provided rules.
+    """
+    revision = get_rules_revision(rules)
+    return _graph_cache.get_or_set(
+        revision, lambda: RuleDependencyGraph(rules, revision=revision)
+    )
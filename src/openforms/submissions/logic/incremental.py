@@ -0,0 +1,121 @@
+"""
+Incremental evaluation of form logic rules.
+
+Logic checks are performed over and over again for the same submission while the
+end-user is filling out a step, while usually only a single field changed compared to
+the previous check. Most rules don't depend on that field at all, so their outcome is
+identical to the previous evaluation.
+
+The results of an evaluation pass (trigger outcome and variable mutations per rule)
+are stored in the cache, together with a digest of every value that is an input of
+any rule. On the next pass, the inputs are compared with the stored digests and only
+the rules affected by the changes (see
+:class:`openforms.submissions.logic.dependencies.RuleDependencyGraph`) are
+evaluated again - the results of the other rules are replayed from the cache.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+from json_logic import jsonLogic
+
+from openforms.forms.models import FormLogic
+from openforms.typing import DataMapping
+
+from ..models import Submission
+from .dependencies import RuleDependencyGraph, get_dependency_graph
+
+__all__ = ["IncrementalEvaluation", "RuleResult"]
+
+CACHE_TIMEOUT = 60 * 60  # 1 hour, typically much longer than a single session step
+
+
+@dataclass
+class RuleResult:
+    triggered: bool
+    # the variable mutations of each action, in order of the actions
+    mutations: list[DataMapping | None] = field(default_factory=list)
+
+
+def _get_digest(value: Any) -> str | None:
+    try:
+        serialized = json.dumps(value, cls=DjangoJSONEncoder, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.md5(serialized.encode("utf-8")).hexdigest()
+
+
+class IncrementalEvaluation:
+    """
+    Track which rules must be evaluated and record/replay the results of the others.
+
+    Usage:
+
+    1. Create an instance for the submission and the rules to evaluate.
+    2. Call :meth:`prepare` with the data at the start of the evaluation pass.
+    3. For every rule, check :meth:`needs_evaluation` - if it does, evaluate it and
+       :meth:`record` the result, otherwise replay the :meth:`get_result`.
+    4. Persist the results for the next evaluation pass with :meth:`save`.
+    """
+
+    def __init__(self, submission: Submission, rules: Sequence[FormLogic]):
+        self.submission = submission
+        self.graph: RuleDependencyGraph = get_dependency_graph(rules)
+        self._previous: dict[str, Any] = {}
+        self._input_digests: dict[str, str | None] = {}
+        self._results: dict[str, RuleResult] = {}
+        self._dirty_rules: set[str] = set()
+
+    @property
+    def cache_key(self) -> str:
+        return f"submission-logic:{self.submission.uuid}:{self.graph.revision}"
+
+    def prepare(self, data: DataMapping) -> None:
+        """
+        Determine the rules to evaluate based on the data at the start of the pass.
+        """
+        self._input_digests = {
+            path: _get_digest(jsonLogic({"var": path}, data))
+            for path in self.graph.input_paths
+        }
+        self._previous = cache.get(self.cache_key) or {}
+        previous_digests = self._previous.get("inputs", {})
+        previous_results: dict[str, RuleResult] = self._previous.get("rules", {})
+
+        changed_paths = [
+            path
+            for path, digest in self._input_digests.items()
+            if digest is None or previous_digests.get(path) != digest
+        ]
+        unknown_rules = [
+            rule_id
+            for rule_id in self.graph.dependencies
+            if rule_id not in previous_results
+        ]
+        self._dirty_rules = self.graph.get_dirty_rules(
+            changed_paths, unknown_rules=unknown_rules
+        )
+        self._results = {
+            rule_id: result
+            for rule_id, result in previous_results.items()
+            if rule_id not in self._dirty_rules
+        }
+
+    def needs_evaluation(self, rule: FormLogic) -> bool:
+        rule_id = str(rule.uuid)
+        return rule_id in self._dirty_rules or rule_id not in self._results
+
+    def get_result(self, rule: FormLogic) -> RuleResult:
+        return self._results[str(rule.uuid)]
+
+    def record(self, rule: FormLogic, result: RuleResult) -> None:
+        self._results[str(rule.uuid)] = result
+
+    def save(self) -> None:
+        state = {"inputs": self._input_digests, "rules": self._results}
+        cache.set(self.cache_key, state, timeout=CACHE_TIMEOUT)
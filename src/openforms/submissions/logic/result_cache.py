@@ -0,0 +1,74 @@
+"""
+Caching of the results of external calls performed during logic evaluation.
+
+Service fetches and DMN evaluations are performed over and over again while logic
+checks are done for a submission. Their results are cached in the (shared) Django
+cache, so that all processes can benefit from them.
+
+The cache keys are a digest of the (JSON-serialized) key parts, prefixed with a
+namespace (e.g. per service) so that entries are easy to identify. The hit/miss
+counters are tracked per namespace in the cache too, so they cover all processes.
+"""
+
+import hashlib
+import json
+from typing import Any, Callable, TypeVar
+
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.serializers.json import DjangoJSONEncoder
+
+__all__ = ["ResultCache"]
+
+T = TypeVar("T")
+
+KEY_PREFIX = "logic-results"
+
+_MISSING = object()
+
+
+class ResultCache:
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+
+    def make_key(self, *parts: Any) -> str:
+        """
+        Build a deterministic cache key from the provided key parts.
+        """
+        serialized = json.dumps(
+            parts, cls=DjangoJSONEncoder, sort_keys=True, separators=(",", ":")
+        )
+        digest = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+        return f"{KEY_PREFIX}:{self.namespace}:{digest}"
+
+    def get_or_set(
+        self, parts: tuple, default: Callable[[], T], timeout=DEFAULT_TIMEOUT
+    ) -> T:
+        key = self.make_key(*parts)
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            self._incr("hits")
+            return value
+
+        self._incr("misses")
+        value = default()
+        cache.set(key, value, timeout=timeout)
+        return value
+
+    def _get_counter_key(self, counter: str) -> str:
+        return f"{KEY_PREFIX}:{self.namespace}:stats:{counter}"
+
+    def _incr(self, counter: str) -> None:
+        key = self._get_counter_key(counter)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # no counter yet (or it expired/was evicted)
+            if not cache.add(key, 1, timeout=None):
+                cache.incr(key)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        counters = ("hits", "misses")
+        values = cache.get_many([self._get_counter_key(name) for name in counters])
+        return {name: values.get(self._get_counter_key(name), 0) for name in counters}
@@ -2,14 +2,23 @@ from dataclasses import dataclass
 from typing import Callable, Iterable, Iterator
 
 import elasticapm
-from json_logic import jsonLogic
 
+from openforms.forms.constants import LogicActionTypes
 from openforms.forms.models import FormLogic, FormStep
 
 from ..models import Submission, SubmissionStep
-from .actions import ActionOperation
+from .actions import ActionOperation, ServiceFetchAction
+from .compilation import get_compiled_rule
 from .datastructures import DataContainer
+from .dependencies import (
+    get_expression_inputs,
+    get_fetch_inputs,
+    get_rule_outputs,
+    paths_overlap,
+)
+from .incremental import IncrementalEvaluation, RuleResult
 from .log_utils import log_errors
+from .service_fetching import ServiceFetchBatch
 
 
 def _include_rule(form_steps: list[FormStep], rule: FormLogic, step_index: int) -> bool:
@@ -118,6 +127,7 @@ def iter_evaluate_rules(
     data_container: DataContainer,
     submission: Submission,
     on_rule_check: Callable[[EvaluatedRule], None] = lambda noop: None,
+    incremental: IncrementalEvaluation | None = None,
 ) -> Iterator[ActionOperation]:
     """
     Iterate over the rules and evaluate the trigger, yielding action operations.
@@ -134,30 +144,146 @@ def iter_evaluate_rules(
       variable values).
     :arg on_rule_check: Optional callable taking a :class:`EvaluatedRule` instance as
       sole argument. Useful to gather metadata about rule evaluation.
+    :arg incremental: Optional, prepared :class:`IncrementalEvaluation` instance. If
+      provided, only the rules affected by changed input data are evaluated, the
+      results of the other rules are replayed from the previous evaluation.
     :returns: An iterator yielding :class:`ActionOperation` instances.
     """
+    rules = list(rules)
+    batch = _prefetch_service_fetches(rules, data_container, submission, incremental)
+    try:
+        for rule in rules:
+            with elasticapm.capture_span(
+                "evaluate_rule",
+                span_type="app.submissions.logic",
+                labels={"ruleId": rule.pk},
+            ):
+                if incremental is not None and not incremental.needs_evaluation(rule):
+                    yield from _replay_rule(rule, data_container, incremental)
+                    on_rule_check(
+                        EvaluatedRule(
+                            rule=rule, triggered=incremental.get_result(rule).triggered
+                        )
+                    )
+                    continue
+
+                triggered = False
+                with log_errors(rule.json_logic_trigger, rule):
+                    compiled_rule = get_compiled_rule(rule)
+                    triggered = bool(
+                        compiled_rule.evaluate_trigger(data_container.data)
+                    )
+
+                evaluated_rule = EvaluatedRule(rule=rule, triggered=triggered)
+                result = RuleResult(triggered=triggered)
+
+                if not triggered:
+                    if incremental is not None:
+                        incremental.record(rule, result)
+                    on_rule_check(evaluated_rule)
+                    continue
+
+                for operation in rule.action_operations:
+                    if batch is not None and isinstance(operation, ServiceFetchAction):
+                        operation.batch = batch
+                    mutations = operation.eval(
+                        data_container.data, submission=submission
+                    )
+                    if mutations:
+                        data_container.update(mutations)
+                    result.mutations.append(mutations or None)
+                    yield operation
+                if incremental is not None:
+                    incremental.record(rule, result)
+                on_rule_check(evaluated_rule)
+    finally:
+        if batch is not None:
+            batch.close()
+
+
+def _prefetch_service_fetches(
+    rules: list[FormLogic],
+    data_container: DataContainer,
+    submission: Submission,
+    incremental: IncrementalEvaluation | None = None,
+) -> ServiceFetchBatch | None:
+    """
+    Start the service fetches that are known upfront to be performed in this pass.
+
+    The fetch actions of a rule are known to be performed if the trigger is truthy
+    and none of the trigger inputs are written by a preceding rule. A fetch is only
+    started upfront if none of the variables used in its request arguments are
+    written by a preceding rule or by the rule itself either - it would be performed
+    with stale data. Other fetches are performed in order, during the evaluation of
+    the rule.
+
+    :returns: a :class:`ServiceFetchBatch` if multiple fetches can be resolved
+      concurrently, ``None`` otherwise.
+    """
+
+    def _overlaps(paths: Iterable[str], others: Iterable[str]) -> bool:
+        return any(paths_overlap(path, other) for path in paths for other in others)
+
+    batch = ServiceFetchBatch(submission_uuid=str(submission.uuid))
+    candidates: list[ServiceFetchAction] = []
+    written: set[str] = set()
+    data = data_container.data
     for rule in rules:
-        with elasticapm.capture_span(
-            "evaluate_rule",
-            span_type="app.submissions.logic",
-            labels={"ruleId": rule.pk},
-        ):
-            triggered = False
-            with log_errors(rule.json_logic_trigger, rule):
-                triggered = bool(
-                    jsonLogic(rule.json_logic_trigger, data_container.data)
+        outputs = get_rule_outputs(rule)
+        # we can't tell what is affected by the remaining rules
+        if outputs is None:
+            break
+
+        if any(
+            action["action"].get("type") == LogicActionTypes.fetch_from_service
+            for action in rule.actions
+        ) and (incremental is None or incremental.needs_evaluation(rule)):
+            try:
+                inputs = get_expression_inputs(rule.json_logic_trigger)
+                triggered = not _overlaps(inputs, written) and bool(
+                    get_compiled_rule(rule).evaluate_trigger(data)
                 )
+            except Exception:
+                triggered = False
+            if triggered:
+                for operation in rule.action_operations:
+                    if not isinstance(operation, ServiceFetchAction):
+                        continue
+                    operation.batch = batch
+                    # any errors are reported when the action is evaluated
+                    try:
+                        var = operation.get_variable()
+                        fetch_inputs = get_fetch_inputs(var.service_fetch_configuration)
+                    except Exception:
+                        continue
+                    # the actions of the rule itself may write the inputs too
+                    if not _overlaps(fetch_inputs, written | outputs):
+                        candidates.append(operation)
 
-            evaluated_rule = EvaluatedRule(rule=rule, triggered=triggered)
+        written.update(outputs)
 
-            if not triggered:
-                on_rule_check(evaluated_rule)
-                continue
-
-            for i, operation in enumerate(rule.action_operations):
-                if mutations := operation.eval(
-                    data_container.data, submission=submission
-                ):
-                    data_container.update(mutations)
-                yield operation
-            on_rule_check(evaluated_rule)
+    if len(candidates) < 2:
+        return None
+
+    for operation in candidates:
+        # any errors are reported when the action is evaluated
+        try:
+            batch.prefetch(operation.get_variable(), data)
+        except Exception:
+            continue
+    return batch
+
+
+def _replay_rule(
+    rule: FormLogic,
+    data_container: DataContainer,
+    incremental: IncrementalEvaluation,
+) -> Iterator[ActionOperation]:
+    result = incremental.get_result(rule)
+    if not result.triggered:
+        return
+
+    for operation, mutations in zip(rule.action_operations, result.mutations):
+        if mutations:
+            data_container.update(mutations)
+        yield operation
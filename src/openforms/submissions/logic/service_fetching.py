@@ -1,17 +1,26 @@
 import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from http.cookiejar import DefaultCookiePolicy
+from typing import Callable, Hashable
 
-from django.core.cache import cache
+from django.conf import settings
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
 
 import jq
+from ape_pie import APIClient
 from json_logic import jsonLogic
 from zgw_consumers.client import build_client
+from zgw_consumers.models import Service
 
 from openforms.forms.models import FormVariable
 from openforms.typing import DataMapping, JSONObject, JSONValue
+from openforms.utils.cache import LRUCache
 from openforms.variables.models import DataMappingTypes, ServiceFetchConfiguration
 
+from .result_cache import ResultCache
+
 
 @dataclass
 class FetchResult:
@@ -37,35 +46,60 @@ def perform_service_fetch(
     instance.
 
     The value returned by the request is cached using the submission UUID and the
-    arguments to the request (hashed to make a cache key).
+    arguments to the request (hashed to make a cache key), see
+    :class:`openforms.submissions.logic.result_cache.ResultCache`. Responses of
+    configurations marked as shared are cached for all submissions.
     """
 
+    fetch_config = _get_fetch_config(var)
+    request_args = fetch_config.request_arguments(context)
+    client = get_service_client(fetch_config.service)
+    return _fetch(fetch_config, client, request_args, submission_uuid)
+
+
+def _get_fetch_config(var: FormVariable) -> ServiceFetchConfiguration:
     if not var.service_fetch_configuration:
         raise ValueError(
             f"Can't perform service fetch on {var}. "
             "It needs a service_fetch_configuration."
         )
-    fetch_config: ServiceFetchConfiguration = var.service_fetch_configuration
+    return var.service_fetch_configuration
 
-    client = build_client(fetch_config.service)
-    request_args = fetch_config.request_arguments(context)
 
+def get_result_cache(service: Service) -> ResultCache:
+    return ResultCache(namespace=f"service-fetch:{service.uuid}")
+
+
+def _fetch(
+    fetch_config: ServiceFetchConfiguration,
+    client: APIClient,
+    request_args: JSONObject,
+    submission_uuid: str,
+) -> FetchResult:
+    # Note that this may run in a worker thread - everything requiring database access
+    # must be resolved beforehand.
     def _do_fetch():
-        with client:
-            response = client.request(**request_args)
-            response.raise_for_status()
+        response = client.request(**request_args)
+        response.raise_for_status()
         return response.json()
 
-    if not submission_uuid:
+    if not (submission_uuid or fetch_config.cache_shared):
         raw_value = _do_fetch()
     else:
-        cache_key = hash(submission_uuid + json.dumps(request_args, sort_keys=True))
+        result_cache = get_result_cache(fetch_config.service)
+        # responses of configurations not involving personal data may be used for
+        # every submission
+        scope = "" if fetch_config.cache_shared else submission_uuid
         timeout = (
             _timeout
             if (_timeout := fetch_config.cache_timeout) is not None
             else DEFAULT_TIMEOUT
         )
-        raw_value = cache.get_or_set(cache_key, default=_do_fetch, timeout=timeout)
+        raw_value = result_cache.get_or_set(
+            (scope, client.base_url, request_args),
+            default=_do_fetch,
+            timeout=timeout,
+        )
 
     match fetch_config.data_mapping_type, fetch_config.mapping_expression:
         case DataMappingTypes.jq, expression:
@@ -81,3 +115,130 @@ def perform_service_fetch(
         request_parameters=request_args,
         response_json=raw_value,
     )
+
+
+_service_clients: LRUCache[tuple, APIClient] = LRUCache(maxsize=64)
+
+
+def _get_service_key(service: Service) -> tuple | None:
+    if service.pk is None:
+        return None
+    # everything affecting the session configuration, so that a modified service
+    # automatically gets a new session
+    return (
+        service.pk,
+        service.api_root,
+        service.nlx,
+        service.auth_type,
+        service.header_key,
+        service.header_value,
+        service.client_id,
+        service.secret,
+        service.user_id,
+        service.user_representation,
+        service.timeout,
+        service.client_certificate_id,
+        service.server_certificate_id,
+    )
+
+
+def _build_pooled_client(service: Service) -> APIClient:
+    client = build_client(service)
+    # the session is shared between submissions, never leak cookies set by the
+    # service from one submission into another one
+    client.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    # keep the session (and its connection pool) open rather than closing it after
+    # every request
+    client.__enter__()
+    return client
+
+
+def get_service_client(service: Service) -> APIClient:
+    """
+    Get a (pooled) client for the service, re-using the underlying HTTP connections.
+
+    A single client is kept per service configuration in every process. Unsaved
+    services get a fresh client, which closes its session after each request.
+    """
+    key = _get_service_key(service)
+    if key is None:
+        return build_client(service)
+    return _service_clients.get_or_set(key, lambda: _build_pooled_client(service))
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.SERVICE_FETCH_MAX_WORKERS,
+                thread_name_prefix="service-fetch",
+            )
+    return _executor
+
+
+class ServiceFetchBatch:
+    """
+    Resolve (independent) service fetches of a logic evaluation pass concurrently.
+
+    Fetches that are expected to be performed during the evaluation pass are started
+    upfront with :meth:`prefetch`, using the data at that point in time. When the
+    action is eventually evaluated, :meth:`resolve` renders the request arguments
+    again with the actual data. The prefetched result is only used if the request is
+    identical - if the inputs of the request depend on the output of an earlier rule
+    (e.g. another service fetch), the request is performed again, in order.
+    """
+
+    def __init__(self, submission_uuid: str = ""):
+        self.submission_uuid = submission_uuid
+        self._pending: dict[tuple[int, str], Future[FetchResult]] = {}
+        self._variables: dict[Hashable, FormVariable] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def get_variable(
+        self, key: Hashable, load: Callable[[], FormVariable]
+    ) -> FormVariable:
+        # avoid looking up the same variable (and its service) multiple times
+        if key not in self._variables:
+            self._variables[key] = load()
+        return self._variables[key]
+
+    @staticmethod
+    def _get_key(
+        fetch_config: ServiceFetchConfiguration, request_args: JSONObject
+    ) -> tuple[int, str]:
+        return (fetch_config.pk, json.dumps(request_args, sort_keys=True))
+
+    def prefetch(self, var: FormVariable, context: DataMapping) -> None:
+        fetch_config = _get_fetch_config(var)
+        if fetch_config.pk is None:
+            return
+        request_args = fetch_config.request_arguments(context)
+        key = self._get_key(fetch_config, request_args)
+        if key in self._pending:
+            return
+        client = get_service_client(fetch_config.service)
+        self._pending[key] = _get_executor().submit(
+            _fetch, fetch_config, client, request_args, self.submission_uuid
+        )
+
+    def resolve(self, var: FormVariable, context: DataMapping) -> FetchResult:
+        fetch_config = _get_fetch_config(var)
+        request_args = fetch_config.request_arguments(context)
+        future = self._pending.get(self._get_key(fetch_config, request_args))
+        if future is not None:
+            return future.result()
+        client = get_service_client(fetch_config.service)
+        return _fetch(fetch_config, client, request_args, self.submission_uuid)
+
+    def close(self) -> None:
+        # the results of fetches that turned out to be unnecessary are discarded
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
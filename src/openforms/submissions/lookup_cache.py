@@ -0,0 +1,95 @@
+"""
+Submission-scoped cache of (personal) data retrieved from external registries.
+
+While filling out a form, the same data is looked up several times in the BRP, KvK or
+StUF-BG - for example the family members of the authenticated person are retrieved
+every time a step with a family members component is loaded or its logic is checked.
+These registries are slow and often billed per call.
+
+The results of these lookups are cached for the duration of a session, scoped to the
+submission. The cached data is personal data, so it is encrypted with a key derived
+from the ``SECRET_KEY`` and the submission, and the queries (which contain the BSN/KvK
+number) only end up hashed in the cache keys.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.crypto import salted_hmac
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from openforms.typing import JSONValue
+
+if TYPE_CHECKING:
+    from .models import Submission
+
+__all__ = ["cached_lookup"]
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "submission-lookups"
+KEY_SALT = "openforms.submissions.lookup_cache"
+
+T = TypeVar("T", bound=JSONValue)
+
+
+def _get_fernet(submission: Submission) -> Fernet:
+    key = salted_hmac(
+        f"{KEY_SALT}.encryption", str(submission.uuid), algorithm="sha256"
+    ).digest()
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+def _get_cache_key(submission: Submission, namespace: str, query: JSONValue) -> str:
+    digest = salted_hmac(
+        f"{KEY_SALT}.key",
+        json.dumps(query, sort_keys=True, cls=DjangoJSONEncoder),
+        algorithm="sha256",
+    ).hexdigest()
+    return f"{KEY_PREFIX}:{submission.uuid}:{namespace}:{digest}"
+
+
+def cached_lookup(
+    submission: Submission | None,
+    namespace: str,
+    query: JSONValue,
+    fetch: Callable[[], T],
+) -> T:
+    """
+    Return the cached result of the lookup, or perform the lookup and cache it.
+
+    :param submission: the submission the lookup is done for. Without submission, the
+      lookup is always performed.
+    :param namespace: identifies the kind of lookup, e.g. ``haal-centraal:family``.
+    :param query: the parameters of the lookup, such as the identifier and the
+      requested attributes.
+    :param fetch: callback performing the lookup, which must return JSON serializable
+      data. ``None`` results (typically failed lookups) are not cached.
+    """
+    if submission is None:
+        return fetch()
+
+    key = _get_cache_key(submission, namespace, query)
+    fernet = _get_fernet(submission)
+    if (token := cache.get(key)) is not None:
+        try:
+            return json.loads(fernet.decrypt(token))
+        except InvalidToken:
+            logger.warning("Discarding undecryptable cached %s lookup", namespace)
+
+    result = fetch()
+    if result is not None:
+        token = fernet.encrypt(
+            json.dumps(result, cls=DjangoJSONEncoder).encode("utf-8")
+        )
+        # the data is only relevant while the user is filling out the form
+        cache.set(key, token, timeout=settings.SESSION_COOKIE_AGE)
+    return result
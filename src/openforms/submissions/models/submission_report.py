@@ -5,8 +5,9 @@ from django.utils.translation import gettext_lazy as _, override
 from celery.result import AsyncResult
 from privates.fields import PrivateMediaFileField
 
+from openforms.config.models import GlobalConfiguration
 from openforms.config.templatetags.theme import THEME_OVERRIDE_CONTEXT_VAR
-from openforms.utils.pdf import render_to_pdf
+from openforms.utils.pdf import PDFRenderStats, get_pdf_renderer
 
 from ..report import Report
 
@@ -57,6 +58,9 @@ class SubmissionReport(models.Model):
     def __str__(self):
         return self.title
 
+    # timings of the last PDF generation, not persisted
+    render_stats: PDFRenderStats | None = None
+
     def generate_submission_report_pdf(self) -> str:
         """
         Generate the submission report as a PDF.
@@ -67,12 +71,16 @@ class SubmissionReport(models.Model):
 
         with override(self.submission.language_code):
             form = self.submission.form
-            html_report, pdf_report = render_to_pdf(
+            theme = form.theme or GlobalConfiguration.get_solo().get_default_theme()
+            html_report, pdf_report, self.render_stats = get_pdf_renderer().render(
                 "report/submission_report.html",
                 context={
                     "report": Report(self.submission),
-                    THEME_OVERRIDE_CONTEXT_VAR: self.submission.form.theme,
+                    THEME_OVERRIDE_CONTEXT_VAR: theme,
                 },
+                # themes may use different font files for the same font family, and
+                # editing a theme may change the font files
+                font_config_key=theme.get_stylesheets_digest(),
             )
             self.content = ContentFile(
                 content=pdf_report,
@@ -12,6 +12,7 @@ from django.utils.functional import empty
 from django.utils.translation import gettext_lazy as _
 
 from openforms.formio.service import FormioData
+from openforms.forms.caching import get_form_variables
 from openforms.forms.models.form_variable import FormVariable
 from openforms.typing import DataMapping, JSONEncodable, JSONSerializable
 from openforms.utils.date import format_date_value, parse_datetime, parse_time
@@ -110,10 +111,11 @@ class SubmissionValueVariablesState:
             for form_step in submission_state.form_steps
         }
 
-        # Build a collection of all form variables
+        # Build a collection of all form variables - these are the same for every
+        # submission of the form and retrieved from the cache
         all_form_variables = {
             form_variable.key: form_variable
-            for form_variable in self.submission.form.formvariable_set.all()
+            for form_variable in get_form_variables(self.submission.form)
         }
         # optimize the access from form_variable.form_definition using the already
         # existing map, saving a `select_related` call on data we (probably) already
@@ -184,7 +186,7 @@ class SubmissionValueVariablesState:
 
         SubmissionValueVariable.objects.bulk_create(variables_to_prefill)
 
-    def set_values(self, data: DataMapping) -> None:
+    def set_values(self, data: DataMapping) -> list[str]:
         """
         Apply the values from ``data`` to the current state of the variables.
 
@@ -193,16 +195,20 @@ class SubmissionValueVariablesState:
         variables in the state.
 
         :arg data: mapping of variable key to value.
+        :returns: the keys of the variables that received a value.
 
         .. todo:: apply variable.datatype/format to obtain python objects? This also
            needs to properly serialize back to JSON though!
         """
         formio_data = FormioData(data)
+        updated_keys = []
         for key, variable in self.variables.items():
             new_value = formio_data.get(key, default=empty)
             if new_value is empty:
                 continue
             variable.value = new_value
+            updated_keys.append(key)
+        return updated_keys
 
 
 class SubmissionValueVariableManager(models.Manager):
@@ -0,0 +1,113 @@
+"""
+Track which submissions and temporary uploads belong to a user session.
+
+The UUIDs of the submissions and uploads a user is allowed to access are kept in a
+Redis set per session and per kind (see
+:const:`openforms.submissions.constants.SUBMISSIONS_SESSION_KEY` and
+:const:`openforms.submissions.constants.UPLOADS_SESSION_KEY`). Adding, removing and
+checking an UUID are single atomic Redis commands, so parallel requests of the same
+browser (e.g. uploading multiple files at once) don't have to be serialized and don't
+need to load and save the whole session.
+
+The session only holds the (stable) token identifying the sets, so that the ownership
+is discarded together with the session on logout, but is retained when the session key
+is cycled.
+"""
+
+from django.contrib.sessions.backends.base import SessionBase
+from django.utils.crypto import salted_hmac
+
+from django_redis import get_redis_connection
+
+from .constants import OWNERSHIP_SESSION_KEY
+
+__all__ = [
+    "add_to_session_set",
+    "remove_from_session_set",
+    "get_session_set",
+    "in_session_set",
+    "session_set_is_empty",
+]
+
+# See TODO in settings about renaming this cache
+REDIS_ALIAS = "portalocker"
+KEY_PREFIX = "django:session-ownership"
+
+
+def _get_token(session: SessionBase, create: bool = False) -> str | None:
+    if (token := session.get(OWNERSHIP_SESSION_KEY)) is not None:
+        return token
+
+    if session.session_key is None:
+        if not create:
+            return None
+        # persist the new session so that it has a key to derive the token from
+        session.save()
+
+    # Derive the token from the session key rather than generating a random one -
+    # parallel requests adding the first item to the session set must end up with the
+    # same token, and a session saved by a request that started before the token was
+    # stored doesn't lose access to its set.
+    token = salted_hmac(OWNERSHIP_SESSION_KEY, session.session_key).hexdigest()
+    if create:
+        session[OWNERSHIP_SESSION_KEY] = token
+    return token
+
+
+def _execute(session: SessionBase, token: str, kind: str, command: str, *args):
+    key = f"{KEY_PREFIX}:{token}:{kind}"
+    with get_redis_connection(REDIS_ALIAS).pipeline(transaction=False) as pipeline:
+        getattr(pipeline, command)(key, *args)
+        # every request extends the session, so the set must live as long as the
+        # session does
+        pipeline.expire(key, session.get_expiry_age())
+        result, _ = pipeline.execute()
+    return result
+
+
+def _migrate_legacy_list(session: SessionBase, kind: str) -> None:
+    # TODO: remove in the next release. Before the sets were introduced, the UUIDs were
+    # stored as a list in the session itself, under the same key as the kind. Move
+    # them to the set, so that users who were filling out a form during the upgrade
+    # keep access to their submission and uploads.
+    if (legacy_values := session.pop(kind, None)) is None:
+        return
+    values = [str(value) for value in legacy_values]
+    if values:
+        _execute(session, _get_token(session, create=True), kind, "sadd", *values)
+
+
+def add_to_session_set(session: SessionBase, kind: str, *values: str) -> None:
+    _migrate_legacy_list(session, kind)
+    if not values:
+        return
+    _execute(session, _get_token(session, create=True), kind, "sadd", *values)
+
+
+def remove_from_session_set(session: SessionBase, kind: str, *values: str) -> None:
+    _migrate_legacy_list(session, kind)
+    if not values or (token := _get_token(session)) is None:
+        return
+    _execute(session, token, kind, "srem", *values)
+
+
+def get_session_set(session: SessionBase, kind: str) -> set[str]:
+    _migrate_legacy_list(session, kind)
+    if (token := _get_token(session)) is None:
+        return set()
+    members = _execute(session, token, kind, "smembers")
+    return {member.decode("utf-8") for member in members}
+
+
+def in_session_set(session: SessionBase, kind: str, value: str) -> bool:
+    _migrate_legacy_list(session, kind)
+    if (token := _get_token(session)) is None:
+        return False
+    return bool(_execute(session, token, kind, "sismember", value))
+
+
+def session_set_is_empty(session: SessionBase, kind: str) -> bool:
+    _migrate_legacy_list(session, kind)
+    if (token := _get_token(session)) is None:
+        return True
+    return not _execute(session, token, kind, "scard")
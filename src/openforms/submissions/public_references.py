@@ -24,30 +24,30 @@ def set_submission_reference(submission: Submission) -> str | None:
         )
         return
 
-    # race-condition detection. There's no reason/logic after the number 5 other than
-    # gut feeling.
+    # The reference is picked at random from a space of about a billion references, so
+    # collisions with existing references are rare. Rather than checking if the
+    # reference is still available up front (which is a query per attempt, getting
+    # slower as the submissions table grows), the unique constraint on the column
+    # detects collisions (including those caused by concurrent submissions) and we
+    # simply try again with a different reference.
     MAX_NUM_ATTEMPTS = 5
-    race_condition_suspected, save_attempts = False, 0
 
-    while (
-        race_condition_suspected or save_attempts == 0
-    ) and save_attempts < MAX_NUM_ATTEMPTS:
+    for attempt in range(1, MAX_NUM_ATTEMPTS + 1):
         try:
             with transaction.atomic():
                 reference = generate_unique_submission_reference()
                 submission.public_registration_reference = reference
                 submission.save(update_fields=["public_registration_reference"])
         except IntegrityError as error:
-            race_condition_suspected = True
+            submission.public_registration_reference = ""
             logger.warning(
-                "Likely race condition being handled for submission %d, did %d save attempts.",
+                "Reference collision being handled for submission %d, did %d save attempts.",
                 submission.id,
-                save_attempts + 1,
+                attempt,
                 exc_info=error,
             )
-            save_attempts += 1
             # if we're about to leave the loop, re-raise the original exception
-            if save_attempts >= MAX_NUM_ATTEMPTS:
+            if attempt >= MAX_NUM_ATTEMPTS:
                 raise
         else:
             return reference
@@ -72,20 +72,10 @@ def get_random_reference() -> str:
 
 def generate_unique_submission_reference() -> str:
     """
-    Generate a random but unique reference.
-    """
-    MAX_ATTEMPTS = 100  # ensure we have finite loops (while is evil)
-    iterations = 0
-
-    for _ in range(MAX_ATTEMPTS):
-        iterations += 1
-        reference = get_random_reference()
-        exists = Submission.objects.filter(
-            public_registration_reference=reference
-        ).exists()
-        if exists is False:
-            return reference
+    Generate a random reference for a submission.
 
-    # loop ran all the way to the end without finding unused reference
-    # (otherwise it would have returned)
-    raise RuntimeError(f"Could not get a unused reference after {iterations} attempts!")
+    The reference is not checked against the existing references - the unique
+    constraint on :attr:`Submission.public_registration_reference` guarantees
+    uniqueness when the reference is saved, see :func:`set_submission_reference`.
+    """
+    return get_random_reference()
@@ -11,6 +11,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterator
 
+from openforms.formio.rendering.plan import RenderPlan, build_render_plan
 from openforms.forms.models import Form
 from openforms.variables.rendering.nodes import VariablesNode
 
@@ -47,6 +48,23 @@ class Renderer:
         """
         return self.submission.form
 
+    @property
+    def render_plan(self) -> RenderPlan:
+        """
+        Get the render plan with the static component information of the form.
+
+        The plan is cached on the form instance, so that it's built only once when
+        rendering many submissions of the same form (e.g. during exports).
+        """
+        form = self.form
+        plan = getattr(form, "_render_plan", None)
+        if plan is None:
+            form_steps = self.submission.load_execution_state().form_steps
+            plan = form._render_plan = build_render_plan(
+                form_step.form_definition.configuration for form_step in form_steps
+            )
+        return plan
+
     @property
     def steps(self):
         """
@@ -1,12 +1,13 @@
 import logging
+from functools import partial
 
-from django.db.models import F
+from django.db import transaction
 from django.db.models.base import ModelBase
 from django.db.models.signals import post_delete
 from django.dispatch import Signal, receiver
 from django.utils import timezone
 
-from openforms.forms.models.form_statistics import FormStatistics
+from openforms.forms.statistics import record_form_submission
 from openforms.submissions.models import Submission, SubmissionReport
 
 logger = logging.getLogger(__name__)
@@ -64,23 +65,8 @@ def delete_submission_report_files(
 
 @receiver(submission_complete, dispatch_uid="submission.increment_form_counter")
 def increment_form_counter(sender, instance: Submission, **kwargs):
-    submitted_form = instance.form
-
-    # TODO
-    # Replace get_or_create with update_or_create and do this in one block
-    # (needs Django v5.2+)
-    form_statistics, created = FormStatistics.objects.get_or_create(
-        form=submitted_form,
-        defaults={
-            "form": submitted_form,
-            "form_name": submitted_form.name,
-            "submission_count": 1,
-            "last_submission": timezone.now(),
-        },
+    # the counters are folded into the form statistics periodically, see
+    # :mod:`openforms.forms.statistics`
+    transaction.on_commit(
+        partial(record_form_submission, instance.form_id, timezone.now())
     )
-
-    if not created:
-        form_statistics.form_name = submitted_form.name
-        form_statistics.submission_count = F("submission_count") + 1
-        form_statistics.last_submission = timezone.now()
-        form_statistics.save()
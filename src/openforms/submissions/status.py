@@ -1,9 +1,19 @@
 """
 Utility to interact with the celery task status.
+
+The processing status is polled by the frontend until the post-completion tasks are
+done. Rather than consulting the result backend for every task on every poll, the
+tasks record their state in a per-submission summary in the cache as they finish (see
+:func:`openforms.submissions.tasks.record_post_completion_task_state`). The result
+backend is only consulted when there is no (usable) summary.
 """
 
+import time
 from dataclasses import dataclass
+from typing import TypedDict
 
+from django.conf import settings
+from django.core.cache import cache
 from django.urls import reverse
 
 from celery import states
@@ -14,8 +24,74 @@ from openforms.appointments.models import AppointmentInfo
 
 from .constants import ProcessingResults, ProcessingStatuses
 from .models import Submission
+from .tokens import submission_status_token_generator
 from .utils import add_submmission_to_session, get_report_download_url
 
+# the status can't be checked anymore once the token is expired
+SUMMARY_TIMEOUT = (submission_status_token_generator.token_timeout_days + 1) * 86400
+
+
+class ProcessingSummary(TypedDict, total=False):
+    task_ids: list[str]
+    created: float
+    confirmation_page_content: str
+    # derived from the states recorded by the individual tasks
+    states: dict[str, str]
+    updated: float
+
+
+def _get_summary_key(submission_id: int) -> str:
+    return f"submission-processing-status:{submission_id}"
+
+
+def _get_task_state_key(submission_id: int, task_id: str) -> str:
+    return f"submission-processing-status:{submission_id}:{task_id}"
+
+
+def _store_processing_summary(submission_id: int, summary: ProcessingSummary) -> None:
+    stored = {
+        key: value for key, value in summary.items() if key not in ("states", "updated")
+    }
+    cache.set(_get_summary_key(submission_id), stored, timeout=SUMMARY_TIMEOUT)
+
+
+def init_processing_summary(submission_id: int, task_ids: list[str]) -> None:
+    """
+    Start tracking the state of the tasks scheduled when the submission was completed.
+    """
+    summary: ProcessingSummary = {"task_ids": task_ids, "created": time.time()}
+    _store_processing_summary(submission_id, summary)
+
+
+def update_processing_summary(submission_id: int, task_id: str, state: str) -> None:
+    """
+    Record the state of a task that finished.
+
+    Every task has its own cache key, so there are no concurrent updates of the same
+    key and the state may be recorded before the summary is initialized.
+    """
+    key = _get_task_state_key(submission_id, task_id)
+    cache.set(key, (state, time.time()), timeout=SUMMARY_TIMEOUT)
+
+
+def get_processing_summary(submission_id: int) -> ProcessingSummary | None:
+    summary: ProcessingSummary | None = cache.get(_get_summary_key(submission_id))
+    if summary is None:
+        return None
+
+    keys = {
+        task_id: _get_task_state_key(submission_id, task_id)
+        for task_id in summary["task_ids"]
+    }
+    recorded = cache.get_many(list(keys.values()))
+    summary["states"] = {}
+    summary["updated"] = summary["created"]
+    for task_id, key in keys.items():
+        state, timestamp = recorded.get(key, (states.PENDING, 0))
+        summary["states"][task_id] = state
+        summary["updated"] = max(summary["updated"], timestamp)
+    return summary
+
 
 @dataclass
 class SubmissionProcessingStatus:
@@ -24,7 +100,7 @@ class SubmissionProcessingStatus:
 
     def get_async_results(self) -> list[AsyncResult]:
         """Retrieve the results for the task scheduled ONLY when the submission was completed."""
-        if not hasattr(self, "_async_result"):
+        if not hasattr(self, "_async_results"):
             task_ids = self.submission.post_completion_task_ids
             self._async_results = [AsyncResult(task_id) for task_id in task_ids]
         return self._async_results
@@ -48,12 +124,41 @@ class SubmissionProcessingStatus:
             self._all_async_results = [AsyncResult(task_id) for task_id in task_ids]
         return self._all_async_results
 
+    def get_summary(self) -> ProcessingSummary | None:
+        """
+        Retrieve the summary recorded by the tasks, if it can be relied upon.
+        """
+        if not hasattr(self, "_summary"):
+            summary = get_processing_summary(self.submission.pk)
+            # a task killed by the hard time limit does not get to record its state,
+            # so stop trusting a summary that didn't get any updates in the meantime
+            if summary is not None and (
+                time.time() - summary["updated"] > settings.CELERY_TASK_TIME_LIMIT
+                and not self._is_done(list(summary["states"].values()))
+            ):
+                summary = None
+            self._summary = summary
+        return self._summary
+
+    def get_task_states(self) -> list[str]:
+        if not hasattr(self, "_task_states"):
+            if (summary := self.get_summary()) is not None:
+                self._task_states = list(summary["states"].values())
+            else:
+                self._task_states = [
+                    result.state for result in self.get_async_results()
+                ]
+        return self._task_states
+
+    @staticmethod
+    def _is_done(task_states: list[str]) -> bool:
+        any_failed = any(state == states.FAILURE for state in task_states)
+        all_ready = all(state in states.READY_STATES for state in task_states)
+        return bool(task_states) and (any_failed or all_ready)
+
     @property
     def status(self) -> str:
-        results = self.get_async_results()
-        any_failed = any((result.state == states.FAILURE for result in results))
-        all_ready = all((result.state in states.READY_STATES for result in results))
-        if results and (any_failed or all_ready):
+        if self._is_done(self.get_task_states()):
             return ProcessingStatuses.done
         return ProcessingStatuses.in_progress
 
@@ -62,9 +167,9 @@ class SubmissionProcessingStatus:
         if self.status != ProcessingStatuses.done:
             return ""
 
-        results = self.get_async_results()
-        all_success = all((result.state == states.SUCCESS for result in results))
-        any_failed = any((result.state == states.FAILURE for result in results))
+        task_states = self.get_task_states()
+        all_success = all(state == states.SUCCESS for state in task_states)
+        any_failed = any(state == states.FAILURE for state in task_states)
 
         if all_success:
             return ProcessingResults.success
@@ -96,7 +201,18 @@ class SubmissionProcessingStatus:
     def confirmation_page_content(self) -> str:
         if self.result != ProcessingResults.success:
             return ""
-        return self.submission.render_confirmation_page()
+
+        summary = self.get_summary()
+        if summary is None:
+            return self.submission.render_confirmation_page()
+
+        # the submission doesn't change anymore once it's processed, render it only once
+        if (content := summary.get("confirmation_page_content")) is None:
+            content = summary["confirmation_page_content"] = (
+                self.submission.render_confirmation_page()
+            )
+            _store_processing_summary(self.submission.pk, summary)
+        return content
 
     @property
     def report_download_url(self) -> str:
@@ -135,6 +251,10 @@ class SubmissionProcessingStatus:
         results = self.get_all_async_results()
         for result in results:
             result.forget()
+        cache.delete_many(
+            [_get_summary_key(self.submission.pk)]
+            + [_get_task_state_key(self.submission.pk, result.id) for result in results]
+        )
 
     def ensure_failure_can_be_managed(self) -> None:
         """
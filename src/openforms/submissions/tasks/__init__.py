@@ -4,8 +4,9 @@ from datetime import timedelta
 from django.conf import settings
 from django.utils import timezone
 
-from celery import chain
+from celery import Task, chain
 from celery.result import AsyncResult
+from celery.signals import task_postrun
 
 from openforms.appointments.tasks import maybe_register_appointment
 from openforms.celery import app
@@ -13,6 +14,7 @@ from openforms.config.models import GlobalConfiguration
 
 from ..constants import PostSubmissionEvents, RegistrationStatuses
 from ..models import PostCompletionMetadata, Submission
+from ..status import init_processing_summary, update_processing_summary
 from .cleanup import *  # noqa
 from .emails import *  # noqa
 from .payments import *  # noqa
@@ -77,6 +79,8 @@ def on_post_submission_event(submission_id: int, event: PostSubmissionEvents) ->
             submission_id=submission_id,
             trigger_event=PostSubmissionEvents.on_completion,
         ).delete()
+        # the tasks record their state as they finish, for the status endpoint
+        init_processing_summary(submission_id, task_ids)
 
     PostCompletionMetadata.objects.create(
         tasks_ids=task_ids,
@@ -85,6 +89,19 @@ def on_post_submission_event(submission_id: int, event: PostSubmissionEvents) ->
     )
 
 
+@task_postrun.connect
+def record_post_completion_task_state(
+    sender: Task, task_id: str, args: tuple, state: str, **kwargs
+) -> None:
+    """
+    Record the state of a finished task of the completion chain in the summary.
+    """
+    if sender.name not in POST_SUBMISSION_TASK_NAMES or not args:
+        return
+    submission_id = args[0]
+    update_processing_summary(submission_id, task_id, state)
+
+
 @app.task(ignore_result=True)
 def retry_processing_submissions():
     """
@@ -151,3 +168,13 @@ def finalise_completion(submission_id: int) -> None:
         submission_id
     )
     hash_identifying_attributes_task.delay()
+
+
+POST_SUBMISSION_TASK_NAMES = {
+    maybe_register_appointment.name,
+    pre_registration.name,
+    generate_submission_report.name,
+    register_submission.name,
+    update_submission_payment_status.name,
+    finalise_completion.name,
+}
@@ -0,0 +1,63 @@
+from django.test import SimpleTestCase
+
+from openforms.forms.models import FormLogic
+from openforms.forms.tests.factories import FormLogicFactory
+
+from ...logic.actions import VariableAction
+from ...logic.compilation import get_compiled_rule
+
+
+class CompiledRuleTests(SimpleTestCase):
+    def test_compiled_rule_is_cached_per_revision(self):
+        rule = FormLogicFactory.build(
+            json_logic_trigger={"==": [{"var": "foo"}, "bar"]},
+            actions=[
+                {
+                    "variable": "baz",
+                    "action": {"type": "variable", "value": {"var": "foo"}},
+                }
+            ],
+        )
+        # simulate a fresh instance for a next request
+        same_rule = FormLogic(
+            uuid=rule.uuid,
+            json_logic_trigger=rule.json_logic_trigger,
+            actions=rule.actions,
+        )
+        modified_rule = FormLogic(
+            uuid=rule.uuid,
+            json_logic_trigger={"==": [{"var": "foo"}, "other"]},
+            actions=rule.actions,
+        )
+
+        compiled = get_compiled_rule(rule)
+
+        self.assertIs(get_compiled_rule(same_rule), compiled)
+        self.assertIsNot(get_compiled_rule(modified_rule), compiled)
+        self.assertTrue(compiled.evaluate_trigger({"foo": "bar"}))
+        self.assertFalse(
+            get_compiled_rule(modified_rule).evaluate_trigger({"foo": "bar"})
+        )
+
+    def test_action_operations_are_bound_to_the_rule(self):
+        rule = FormLogicFactory.build(
+            actions=[
+                {
+                    "variable": "baz",
+                    "action": {"type": "variable", "value": {"+": [{"var": "a"}, 1]}},
+                }
+            ],
+        )
+        other_rule = FormLogic(
+            uuid=rule.uuid,
+            json_logic_trigger=rule.json_logic_trigger,
+            actions=rule.actions,
+        )
+
+        (operation,) = rule.action_operations
+        (other_operation,) = other_rule.action_operations
+
+        self.assertIsInstance(operation, VariableAction)
+        self.assertIs(operation.rule, rule)
+        self.assertIs(other_operation.rule, other_rule)
+        self.assertEqual(operation.eval({"a": 1}, submission=None), {"baz": 2})
@@ -0,0 +1,39 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from openforms.forms.tests.factories import FormStepFactory
+
+from ...logic.datastructures import DataContainer
+from ..factories import SubmissionFactory
+
+
+class DataContainerTests(TestCase):
+    def test_data_view_is_built_once_and_patched_on_update(self):
+        form_step = FormStepFactory.create(
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "name"},
+                    {"type": "textfield", "key": "nested.name"},
+                ]
+            }
+        )
+        submission = SubmissionFactory.create(form=form_step.form)
+        state = submission.load_submission_value_variables_state()
+        state.set_values({"name": "Alice", "nested": {"name": "Bob"}})
+        data_container = DataContainer(state=state)
+
+        with patch.object(
+            DataContainer, "_build_data", wraps=data_container._build_data
+        ) as m_build_data:
+            data_container.data
+            data_container.data
+            data_container.update({"nested.name": "Carol"})
+            data = data_container.data
+
+        m_build_data.assert_called_once()
+        self.assertEqual(data["name"], "Alice")
+        self.assertEqual(data["nested"], {"name": "Carol"})
+        self.assertEqual(state.variables["nested.name"].value, "Carol")
+        # the initial data is not affected by the in-place updates
+        self.assertEqual(data_container.initial_data["nested"], {"name": "Bob"})
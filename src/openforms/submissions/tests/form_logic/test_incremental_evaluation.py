@@ -0,0 +1,229 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase
+
+from openforms.forms.models import FormStep
+from openforms.forms.tests.factories import (
+    FormFactory,
+    FormLogicFactory,
+    FormStepFactory,
+    FormVariableFactory,
+)
+from openforms.utils.tests.cache import clear_caches
+from openforms.variables.constants import FormVariableDataTypes, FormVariableSources
+from openforms.variables.tests.factories import ServiceFetchConfigurationFactory
+
+from ...form_logic import evaluate_form_logic
+from ...logic.compilation import get_compiled_rule
+from ...logic.dependencies import (
+    RuleDependencyGraph,
+    _VolatileExpression,
+    get_fetch_inputs,
+    get_rule_dependencies,
+)
+from ...models import Submission
+from ...models.submission_step import DirtyData
+from ..factories import SubmissionFactory, SubmissionStepFactory
+
+
+class RuleDependenciesTests(SimpleTestCase):
+    def test_trigger_and_variable_action_references(self):
+        rule = FormLogicFactory.build(
+            json_logic_trigger={"==": [{"var": "foo"}, "bar"]},
+            actions=[
+                {
+                    "variable": "total",
+                    "action": {
+                        "type": "variable",
+                        "value": {"+": [{"var": "a"}, {"var": "b.c"}]},
+                    },
+                }
+            ],
+        )
+
+        deps = get_rule_dependencies(rule)
+
+        self.assertEqual(deps.inputs, {"foo", "a", "b.c"})
+        self.assertEqual(deps.outputs, {"total"})
+        self.assertFalse(deps.volatile)
+
+    def test_scoped_logic_is_not_an_input(self):
+        rule = FormLogicFactory.build(
+            json_logic_trigger={
+                "reduce": [
+                    {"var": "items"},
+                    {"+": [{"var": "accumulator"}, {"var": "current.price"}]},
+                    0,
+                ]
+            },
+            actions=[],
+        )
+
+        deps = get_rule_dependencies(rule)
+
+        self.assertEqual(deps.inputs, {"items"})
+
+    def test_volatile_rules(self):
+        expressions = [
+            {"==": [{"today": []}, {"var": "date"}]},
+            {"!!": {"var": ""}},
+            {"!!": {"var": {"cat": ["foo", "bar"]}}},
+            {"missing": ["foo"]},
+        ]
+
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                rule = FormLogicFactory.build(json_logic_trigger=expression, actions=[])
+
+                deps = get_rule_dependencies(rule)
+
+                self.assertTrue(deps.volatile)
+
+    def test_fetch_request_argument_references(self):
+        fetch_config = ServiceFetchConfigurationFactory.build(
+            path="persons/{{ bsn }}",
+            headers={"X-Environment": "{{ environment|default:fallback }}"},
+            query_params={"zip": ["{{ address.postcode }}", "static"]},
+        )
+
+        inputs = get_fetch_inputs(fetch_config)
+
+        self.assertEqual(inputs, {"bsn", "environment", "fallback", "address.postcode"})
+
+    def test_fetch_request_arguments_with_tags_are_volatile(self):
+        fetch_config = ServiceFetchConfigurationFactory.build(
+            path="{% if foo %}persons{% endif %}"
+        )
+
+        with self.assertRaises(_VolatileExpression):
+            get_fetch_inputs(fetch_config)
+
+    def test_transitive_dependents_are_dirty(self):
+        rule1 = FormLogicFactory.build(
+            json_logic_trigger={"!!": {"var": "a"}},
+            actions=[
+                {
+                    "variable": "b",
+                    "action": {"type": "variable", "value": {"var": "a"}},
+                }
+            ],
+        )
+        rule2 = FormLogicFactory.build(
+            json_logic_trigger={"!!": {"var": "b.nested"}},
+            actions=[
+                {
+                    "variable": "c",
+                    "action": {"type": "variable", "value": {"var": "b"}},
+                }
+            ],
+        )
+        rule3 = FormLogicFactory.build(
+            json_logic_trigger={"!!": {"var": "c"}}, actions=[]
+        )
+        rule4 = FormLogicFactory.build(
+            json_logic_trigger={"!!": {"var": "unrelated"}}, actions=[]
+        )
+        graph = RuleDependencyGraph([rule1, rule2, rule3, rule4])
+
+        dirty = graph.get_dirty_rules(["a"])
+
+        self.assertEqual(dirty, {str(rule1.uuid), str(rule2.uuid), str(rule3.uuid)})
+
+
+class IncrementalEvaluationTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(clear_caches)
+
+    def test_only_affected_rules_are_reevaluated(self):
+        form = FormFactory.create()
+        step = FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "name"},
+                    {"type": "number", "key": "age"},
+                    {"type": "textfield", "key": "greeting", "hidden": False},
+                ]
+            },
+        )
+        FormVariableFactory.create(
+            form=form,
+            key="double_age",
+            source=FormVariableSources.user_defined,
+            data_type=FormVariableDataTypes.int,
+        )
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"==": [{"var": "name"}, "hide"]},
+            actions=[
+                {
+                    "component": "greeting",
+                    "action": {
+                        "type": "property",
+                        "property": {"value": "hidden", "type": "bool"},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={">": [{"var": "age"}, 0]},
+            actions=[
+                {
+                    "variable": "double_age",
+                    "action": {
+                        "type": "variable",
+                        "value": {"*": [{"var": "age"}, 2]},
+                    },
+                }
+            ],
+        )
+        submission = SubmissionFactory.create(form=form)
+
+        def check_logic(data):
+            # simulate separate requests - no in-memory state may be shared
+            _submission = Submission.objects.get(pk=submission.pk)
+            submission_step = SubmissionStepFactory.build(
+                submission=_submission, form_step=FormStep.objects.get(pk=step.pk)
+            )
+            submission_step.data = DirtyData(data)
+            configuration = evaluate_form_logic(
+                _submission, submission_step, data, dirty=True, incremental=True
+            )
+            state = _submission.load_submission_value_variables_state()
+            return configuration, state.variables["double_age"].value
+
+        with self.subTest("initial evaluation"):
+            with patch(
+                "openforms.submissions.logic.rules.get_compiled_rule",
+                wraps=get_compiled_rule,
+            ) as m_compiled_rule:
+                configuration, double_age = check_logic({"name": "hide", "age": 21})
+
+            self.assertEqual(m_compiled_rule.call_count, 2)
+            self.assertTrue(configuration["components"][2]["hidden"])
+            self.assertEqual(double_age, 42)
+
+        with self.subTest("unchanged name - only age rule is evaluated"):
+            with patch(
+                "openforms.submissions.logic.rules.get_compiled_rule",
+                wraps=get_compiled_rule,
+            ) as m_compiled_rule:
+                configuration, double_age = check_logic({"name": "hide", "age": 22})
+
+            m_compiled_rule.assert_called_once()
+            self.assertTrue(configuration["components"][2]["hidden"])
+            self.assertEqual(double_age, 44)
+
+        with self.subTest("unchanged age - replayed variable mutation"):
+            with patch(
+                "openforms.submissions.logic.rules.get_compiled_rule",
+                wraps=get_compiled_rule,
+            ) as m_compiled_rule:
+                configuration, double_age = check_logic({"name": "show", "age": 22})
+
+            m_compiled_rule.assert_called_once()
+            self.assertFalse(configuration["components"][2]["hidden"])
+            self.assertEqual(double_age, 44)
@@ -0,0 +1,94 @@
+import uuid
+
+from django.test import SimpleTestCase
+
+import requests_mock
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.test.factories import ServiceFactory
+
+from openforms.forms.tests.factories import FormVariableFactory
+from openforms.utils.tests.cache import clear_caches
+from openforms.utils.tests.nlx import DisableNLXRewritingMixin
+from openforms.variables.tests.factories import ServiceFetchConfigurationFactory
+
+from ...logic.result_cache import ResultCache
+from ...logic.service_fetching import get_result_cache, perform_service_fetch
+
+
+class ResultCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+
+    def test_keys_are_deterministic_and_namespaced(self):
+        result_cache = ResultCache(namespace="test")
+
+        key1 = result_cache.make_key("abc", {"a": 1, "b": [1, 2]})
+        key2 = result_cache.make_key("abc", {"b": [1, 2], "a": 1})
+        key3 = ResultCache(namespace="other").make_key("abc", {"a": 1, "b": [1, 2]})
+
+        self.assertEqual(key1, key2)
+        self.assertTrue(key1.startswith("logic-results:test:"))
+        self.assertEqual(key1.split(":")[-1], key3.split(":")[-1])
+        self.assertNotEqual(key1, key3)
+
+    def test_hits_and_misses_are_counted(self):
+        result_cache = ResultCache(namespace="test")
+        calls = []
+
+        def compute():
+            calls.append(None)
+            return None
+
+        for _ in range(3):
+            value = result_cache.get_or_set(("key",), default=compute)
+
+        self.assertIsNone(value)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(result_cache.stats, {"hits": 2, "misses": 1})
+
+
+class ServiceFetchCachingTests(DisableNLXRewritingMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+        self.service = ServiceFactory.build(
+            api_type=APITypes.orc,
+            api_root="https://httpbin.org/",
+            auth_type=AuthTypes.no_auth,
+        )
+
+    @requests_mock.Mocker()
+    def test_responses_are_cached_per_submission(self, m):
+        m.get("https://httpbin.org/get", json=42)
+        var = FormVariableFactory.build(
+            service_fetch_configuration=ServiceFetchConfigurationFactory.build(
+                service=self.service, path="get"
+            )
+        )
+        submission_uuid1, submission_uuid2 = str(uuid.uuid4()), str(uuid.uuid4())
+
+        perform_service_fetch(var, {}, submission_uuid1)
+        perform_service_fetch(var, {}, submission_uuid1)
+        perform_service_fetch(var, {}, submission_uuid2)
+
+        self.assertEqual(len(m.request_history), 2)
+        self.assertEqual(get_result_cache(self.service).stats, {"hits": 1, "misses": 2})
+
+    @requests_mock.Mocker()
+    def test_shared_responses_are_cached_for_all_submissions(self, m):
+        m.get("https://httpbin.org/get", json=42)
+        var = FormVariableFactory.build(
+            service_fetch_configuration=ServiceFetchConfigurationFactory.build(
+                service=self.service, path="get", cache_shared=True
+            )
+        )
+
+        result1 = perform_service_fetch(var, {}, str(uuid.uuid4()))
+        result2 = perform_service_fetch(var, {}, str(uuid.uuid4()))
+
+        self.assertEqual(result1.value, 42)
+        self.assertEqual(result2.value, 42)
+        self.assertEqual(len(m.request_history), 1)
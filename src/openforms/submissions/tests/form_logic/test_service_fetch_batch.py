@@ -0,0 +1,87 @@
+import threading
+
+from django.test import SimpleTestCase
+
+import requests_mock
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.test.factories import ServiceFactory
+
+from openforms.forms.tests.factories import FormVariableFactory
+from openforms.utils.tests.nlx import DisableNLXRewritingMixin
+from openforms.variables.tests.factories import ServiceFetchConfigurationFactory
+
+from ...logic.service_fetching import ServiceFetchBatch, get_service_client
+
+
+class ServiceFetchBatchTests(DisableNLXRewritingMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.service = ServiceFactory.build(
+            id=1,
+            api_type=APITypes.orc,
+            api_root="https://httpbin.org/",
+            auth_type=AuthTypes.no_auth,
+        )
+
+    def _get_variable(self, pk: int, **kwargs):
+        return FormVariableFactory.build(
+            key=f"var{pk}",
+            service_fetch_configuration=ServiceFetchConfigurationFactory.build(
+                pk=pk, service=self.service, **kwargs
+            ),
+        )
+
+    def test_prefetched_requests_are_performed_concurrently(self):
+        var1 = self._get_variable(1, path="one")
+        var2 = self._get_variable(2, path="two")
+        # both requests must be in flight at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def respond(value):
+            def callback(request, context):
+                barrier.wait()
+                return value
+
+            return callback
+
+        batch = ServiceFetchBatch()
+        with requests_mock.Mocker() as m:
+            m.get("https://httpbin.org/one", json=respond(1))
+            m.get("https://httpbin.org/two", json=respond(2))
+
+            batch.prefetch(var1, {})
+            batch.prefetch(var2, {})
+
+            result1 = batch.resolve(var1, {})
+            result2 = batch.resolve(var2, {})
+
+        self.assertEqual(result1.value, 1)
+        self.assertEqual(result2.value, 2)
+        self.assertEqual(len(m.request_history), 2)
+
+    def test_request_is_repeated_when_inputs_changed(self):
+        var = self._get_variable(1, path="get", query_params={"q": ["{{ q }}"]})
+        batch = ServiceFetchBatch()
+
+        with requests_mock.Mocker() as m:
+            m.get("https://httpbin.org/get?q=old", json="old")
+            m.get("https://httpbin.org/get?q=new", json="new")
+
+            batch.prefetch(var, {"q": "old"})
+            result = batch.resolve(var, {"q": "new"})
+            batch.close()
+
+        self.assertEqual(result.value, "new")
+        self.assertEqual(m.request_history[-1].url, "https://httpbin.org/get?q=new")
+
+    def test_clients_are_pooled_per_service_configuration(self):
+        client1 = get_service_client(self.service)
+        client2 = get_service_client(self.service)
+
+        self.service.timeout = 30
+        client3 = get_service_client(self.service)
+
+        self.assertIs(client1, client2)
+        self.assertIsNot(client1, client3)
+        self.assertEqual(client3._request_kwargs["timeout"], 30)
@@ -1,5 +1,6 @@
 import json
 from unittest import expectedFailure
+from unittest.mock import patch
 
 from django.db import connection
 from django.test import override_settings, tag
@@ -10,6 +11,7 @@ from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
+from openforms.formio.datastructures import FormioConfigurationWrapper
 from openforms.forms.tests.factories import (
     FormFactory,
     FormLogicFactory,
@@ -813,6 +815,53 @@ class CheckLogicSubmissionTest(SubmissionsMixin, APITestCase):
             data = response.json()
             self.assertEqual(data["step"]["data"], {"textfield1": ""})
 
+    def test_clearing_values_in_hidden_fieldset_scales_linearly(self):
+        children = [
+            {"key": f"textfield{index}", "type": "textfield", "clearOnHide": True}
+            for index in range(20)
+        ]
+        form = FormFactory.create(
+            generate_minimal_setup=True,
+            formstep__form_definition__configuration={
+                "components": [
+                    {
+                        "key": "fieldset",
+                        "type": "fieldset",
+                        "hidden": True,
+                        "components": children,
+                    },
+                ]
+            },
+        )
+        submission = SubmissionFactory.create(form=form)
+        self._add_submission_to_session(submission)
+        logic_check_endpoint = reverse(
+            "api:submission-steps-logic-check",
+            kwargs={
+                "submission_uuid": submission.uuid,
+                "step_uuid": form.formstep_set.get().uuid,
+            },
+        )
+
+        with patch.object(
+            FormioConfigurationWrapper,
+            "get_visibility",
+            autospec=True,
+            side_effect=FormioConfigurationWrapper.get_visibility,
+        ) as m_get_visibility:
+            response = self.client.post(
+                logic_check_endpoint,
+                {"data": {child["key"]: "foo" for child in children}},
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["step"]["data"],
+            {child["key"]: "" for child in children},
+        )
+        # clearing the values doesn't recompute the visibility of the whole tree
+        m_get_visibility.assert_called_once()
+
     @tag("gh-2409")
     @expectedFailure
     def test_component_values_hidden_fieldset_used_in_subsequent_logic(self):
@@ -5,6 +5,7 @@ from openforms.utils.tests.cache import clear_caches
 
 from ..constants import SUBMISSIONS_SESSION_KEY, UPLOADS_SESSION_KEY
 from ..models import Submission, TemporaryFileUpload
+from ..ownership import add_to_session_set, get_session_set, remove_from_session_set
 
 
 class SubmissionsMixin:
@@ -14,27 +15,22 @@ class SubmissionsMixin:
 
     def _add_submission_to_session(self, submission: Submission):
         session = self.client.session
-        ids = session.get(SUBMISSIONS_SESSION_KEY, [])
-        ids += [str(submission.uuid)]
-        session[SUBMISSIONS_SESSION_KEY] = ids
+        add_to_session_set(session, SUBMISSIONS_SESSION_KEY, str(submission.uuid))
         session.save()
 
     def _add_upload_to_session(self, upload: TemporaryFileUpload):
         session = self.client.session
-        ids = session.get(UPLOADS_SESSION_KEY, [])
-        ids += [str(upload.uuid)]
-        session[UPLOADS_SESSION_KEY] = ids
+        add_to_session_set(session, UPLOADS_SESSION_KEY, str(upload.uuid))
         session.save()
 
     def _clear_session(self):
         session = self.client.session
-        session[SUBMISSIONS_SESSION_KEY] = []
-        session[UPLOADS_SESSION_KEY] = []
-        session.save()
+        for kind in (SUBMISSIONS_SESSION_KEY, UPLOADS_SESSION_KEY):
+            remove_from_session_set(session, kind, *get_session_set(session, kind))
 
     def _get_session_submission_uuids(self):
         session = self.client.session
-        return session.get(SUBMISSIONS_SESSION_KEY, [])
+        return get_session_set(session, SUBMISSIONS_SESSION_KEY)
 
     def _get_csrf_token(self, submission):
         url = reverse("api:form-detail", kwargs={"uuid_or_slug": submission.form.uuid})
@@ -5,6 +5,7 @@ from openforms.forms.tests.factories import (
     FormLogicFactory,
     FormStepFactory,
 )
+from openforms.utils.tests.cache import clear_caches
 from openforms.variables.constants import FormVariableSources
 
 from ...rendering import Renderer, RenderModes
@@ -133,6 +134,9 @@ class FormNodeTests(TestCase):
         # preload the execution state - this usually happens only once and is then
         # cached.
         self.submission.load_execution_state()
+        # start with a cold form variables cache
+        clear_caches()
+        self.addCleanup(clear_caches)
 
         # Expected queries:
         # 1. Retrieve all the form variables
@@ -140,3 +144,40 @@ class FormNodeTests(TestCase):
         # 3. Query the form logic rules for the submission form (and this is cached)
         with self.assertNumQueries(3):
             list(renderer)
+
+
+class RenderPlanTests(TestCase):
+    def test_render_plan_is_shared_between_submissions_of_the_same_form(self):
+        step = FormStepFactory.create(
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "name", "label": "Name"},
+                    {"type": "textfield", "key": "nested.city", "label": "City"},
+                ]
+            },
+        )
+        submission1 = SubmissionStepFactory.create(
+            submission__form=step.form,
+            form_step=step,
+            data={"name": "Jane", "nested": {"city": "Amsterdam"}},
+        ).submission
+        submission2 = SubmissionStepFactory.create(
+            submission__form=step.form,
+            form_step=step,
+            data={"name": "John", "nested": {"city": "Utrecht"}},
+        ).submission
+        # share the form instance, like the exports do
+        submission2.form = submission1.form
+        renderer1 = Renderer(submission1, mode=RenderModes.export, as_html=False)
+        renderer2 = Renderer(submission2, mode=RenderModes.export, as_html=False)
+
+        values1 = [
+            (node.label, node.value) for node in renderer1 if hasattr(node, "component")
+        ]
+        values2 = [
+            (node.label, node.value) for node in renderer2 if hasattr(node, "component")
+        ]
+
+        self.assertIs(renderer1.render_plan, renderer2.render_plan)
+        self.assertEqual(values1, [("name", "Jane"), ("nested.city", "Amsterdam")])
+        self.assertEqual(values2, [("name", "John"), ("nested.city", "Utrecht")])
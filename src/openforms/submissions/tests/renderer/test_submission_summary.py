@@ -10,6 +10,7 @@ from openforms.submissions.tests.factories import (
     SubmissionStepFactory,
 )
 from openforms.submissions.tests.mixins import SubmissionsMixin
+from openforms.utils.tests.cache import clear_caches
 
 COMPONENTS_1 = [
     # visible component, leaf node
@@ -136,6 +137,9 @@ class SubmissionSummaryRendererTests(TestCase):
 
     def test_check_summary_renderer_queries(self):
         """Make sure we are not making a query to retrieve the form definition for each step"""
+        # start with a cold form variables cache
+        clear_caches()
+        self.addCleanup(clear_caches)
 
         # 1. Get form steps
         # 2. Get submission steps
@@ -1,14 +1,23 @@
 from datetime import datetime
+from io import BytesIO
+from unittest.mock import patch
 
-from django.test import TestCase, tag
+from django.test import SimpleTestCase, TestCase, tag
 from django.utils import timezone
 
+import tablib
 from freezegun import freeze_time
+from openpyxl import load_workbook
 
 from openforms.forms.tests.factories import FormFactory, FormStepFactory
 from openforms.variables.constants import FormVariableSources
 
-from ..exports import create_submission_export
+from ..exports import (
+    ExportFileTypes,
+    create_submission_export,
+    export_submissions,
+    iter_submission_export_rows,
+)
 from ..models import Submission
 from .factories import (
     SubmissionFactory,
@@ -266,3 +275,106 @@ class ExportTests(TestCase):
         export = create_submission_export(Submission.objects.all())
 
         self.assertIn(("Taalcode", "en"), zip(export.headers, export[0]))
+
+    @freeze_time("2022-05-09T13:00:00Z")
+    def test_export_rows_are_generated_per_submission(self):
+        form = FormFactory.create(name="Export form")
+        form_step = FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [{"type": "textfield", "key": "input1"}]
+            },
+        )
+        for index in range(3):
+            submission = SubmissionFactory.create(
+                form=form, completed=True, completed_on=timezone.now()
+            )
+            SubmissionStepFactory.create(
+                submission=submission,
+                form_step=form_step,
+                data={"input1": f"value {index}"},
+            )
+
+        rows = list(
+            iter_submission_export_rows(Submission.objects.order_by("pk"), chunk_size=2)
+        )
+
+        self.assertEqual(
+            rows,
+            [
+                ["Formuliernaam", "Inzendingdatum", "input1"],
+                ["Export form", datetime(2022, 5, 9, 15, 0, 0), "value 0"],
+                ["Export form", datetime(2022, 5, 9, 15, 0, 0), "value 1"],
+                ["Export form", datetime(2022, 5, 9, 15, 0, 0), "value 2"],
+            ],
+        )
+
+    def test_streaming_export_response(self):
+        SubmissionFactory.from_components(
+            [{"type": "textfield", "key": "input1"}],
+            submitted_data={"input1": "Input 1"},
+            form__name="Export test",
+            completed=True,
+        )
+
+        response = export_submissions(Submission.objects.all(), ExportFileTypes.CSV)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="submissions_export.csv"',
+        )
+        content = b"".join(response.streaming_content).decode()
+        self.assertEqual(content.splitlines()[0], "Formuliernaam,Inzendingdatum,input1")
+
+
+class StreamingExportFormatTests(SimpleTestCase):
+    """
+    Assert that the streamed exports are identical to the tablib exports.
+    """
+
+    headers = ["Formuliernaam", "Inzendingdatum", "input1", "input2"]
+    rows = [
+        ["Form", datetime(2022, 5, 9, 15, 0, 0), "Input 1", ["a", "b"]],
+        ["Form", None, {"nested": "value"}, "Multiple\nlines ü"],
+    ]
+
+    def _get_dataset(self) -> tablib.Dataset:
+        dataset = tablib.Dataset(headers=self.headers)
+        for row in self.rows:
+            dataset.append(row)
+        return dataset
+
+    def _stream(self, file_type) -> bytes:
+        # patch the row generation, this is covered by the tests above
+        with patch(
+            "openforms.submissions.exports.iter_submission_export_rows",
+            return_value=iter([self.headers, *self.rows]),
+        ):
+            response = export_submissions(Submission.objects.none(), file_type)
+        return b"".join(response.streaming_content)
+
+    def test_text_formats(self):
+        dataset = self._get_dataset()
+
+        for file_type in (
+            ExportFileTypes.CSV,
+            ExportFileTypes.JSON,
+            ExportFileTypes.XML,
+        ):
+            with self.subTest(file_type=file_type.extension):
+                expected = dataset.export(file_type.extension)
+                if isinstance(expected, str):
+                    expected = expected.encode("utf-8")
+
+                self.assertEqual(self._stream(file_type), expected)
+
+    def test_xlsx(self):
+        content = self._stream(ExportFileTypes.XLSX)
+
+        worksheet = load_workbook(BytesIO(content)).active
+        values = [[cell.value for cell in row] for row in worksheet.iter_rows()]
+        self.assertEqual(values[0], self.headers)
+        self.assertEqual(values[1][:3], self.rows[0][:3])
+        self.assertEqual(values[1][3], "['a', 'b']")
+        self.assertEqual(worksheet.freeze_panes, "A2")
@@ -0,0 +1,85 @@
+import uuid
+from unittest.mock import Mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from openforms.utils.tests.cache import clear_caches
+
+from ..lookup_cache import KEY_PREFIX, cached_lookup
+from ..models import Submission
+
+
+class SubmissionLookupCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+        self.submission = Submission(uuid=uuid.uuid4())
+
+    def test_identical_lookups_are_cached(self):
+        fetch = Mock(return_value={"naam": "Jane"})
+
+        result1 = cached_lookup(self.submission, "test", {"bsn": "111222333"}, fetch)
+        result2 = cached_lookup(self.submission, "test", {"bsn": "111222333"}, fetch)
+
+        self.assertEqual(result1, {"naam": "Jane"})
+        self.assertEqual(result2, {"naam": "Jane"})
+        fetch.assert_called_once_with()
+
+    def test_different_queries_are_not_shared(self):
+        fetch = Mock(return_value={})
+
+        cached_lookup(self.submission, "test", {"bsn": "111222333"}, fetch)
+        cached_lookup(self.submission, "test", {"bsn": "999990676"}, fetch)
+        cached_lookup(self.submission, "other", {"bsn": "111222333"}, fetch)
+
+        self.assertEqual(fetch.call_count, 3)
+
+    def test_lookups_are_scoped_to_the_submission(self):
+        fetch = Mock(return_value={})
+
+        cached_lookup(self.submission, "test", "111222333", fetch)
+        cached_lookup(Submission(uuid=uuid.uuid4()), "test", "111222333", fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_without_submission_nothing_is_cached(self):
+        fetch = Mock(return_value={})
+
+        cached_lookup(None, "test", "111222333", fetch)
+        cached_lookup(None, "test", "111222333", fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_failed_lookups_are_not_cached(self):
+        fetch = Mock(side_effect=[None, {"naam": "Jane"}])
+
+        result1 = cached_lookup(self.submission, "test", "111222333", fetch)
+        result2 = cached_lookup(self.submission, "test", "111222333", fetch)
+
+        self.assertIsNone(result1)
+        self.assertEqual(result2, {"naam": "Jane"})
+
+    def test_cached_data_is_encrypted(self):
+        cached_lookup(
+            self.submission, "test", "111222333", Mock(return_value={"naam": "Jane"})
+        )
+
+        keys = [key for key in cache._cache if KEY_PREFIX in key]
+        self.assertEqual(len(keys), 1)
+        self.assertNotIn("111222333", keys[0])
+        token = cache.get(keys[0].split(":", 2)[-1])
+        self.assertNotIn(b"Jane", token)
+
+    def test_undecryptable_data_is_discarded(self):
+        fetch = Mock(return_value={"naam": "Jane"})
+        cached_lookup(self.submission, "test", "111222333", fetch)
+        for key in cache._cache:
+            cache.set(key.split(":", 2)[-1], b"garbage")
+
+        with self.assertLogs("openforms.submissions.lookup_cache", "WARNING"):
+            result = cached_lookup(self.submission, "test", "111222333", fetch)
+
+        self.assertEqual(result, {"naam": "Jane"})
+        self.assertEqual(fetch.call_count, 2)
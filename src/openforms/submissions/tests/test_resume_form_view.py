@@ -13,6 +13,7 @@ from openforms.config.models import GlobalConfiguration
 from openforms.frontend.tests import FrontendRedirectMixin
 
 from ..constants import SUBMISSIONS_SESSION_KEY
+from ..ownership import get_session_set
 from ..tokens import submission_resume_token_generator
 from .factories import SubmissionFactory, SubmissionStepFactory
 
@@ -64,7 +65,8 @@ class SubmissionResumeViewTests(FrontendRedirectMixin, TestCase):
 
         # Assert submission is stored in session
         self.assertIn(
-            str(submission.uuid), self.client.session[SUBMISSIONS_SESSION_KEY]
+            str(submission.uuid),
+            get_session_set(self.client.session, SUBMISSIONS_SESSION_KEY),
         )
 
     def test_403_response_with_unfound_submission(self):
@@ -186,7 +188,9 @@ class SubmissionResumeViewTests(FrontendRedirectMixin, TestCase):
         self.assertRedirects(
             response, expected_redirect_url.url, fetch_redirect_response=False
         )
-        self.assertNotIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertFalse(
+            get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY)
+        )
 
     def test_after_successful_auth_redirects_to_form(self):
         submission = SubmissionFactory.from_components(
@@ -235,9 +239,10 @@ class SubmissionResumeViewTests(FrontendRedirectMixin, TestCase):
             fetch_redirect_response=False,
         )
 
-        self.assertIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertTrue(get_session_set(self.client.session, SUBMISSIONS_SESSION_KEY))
         self.assertIn(
-            str(submission.uuid), self.client.session[SUBMISSIONS_SESSION_KEY]
+            str(submission.uuid),
+            get_session_set(self.client.session, SUBMISSIONS_SESSION_KEY),
         )
 
     @tag("gh-2301")
@@ -278,7 +283,7 @@ class SubmissionResumeViewTests(FrontendRedirectMixin, TestCase):
 
         # resumed
         self.assertEqual(response.status_code, 302)
-        self.assertIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertTrue(get_session_set(self.client.session, SUBMISSIONS_SESSION_KEY))
         submission.refresh_from_db()
         self.assertEqual(submission.auth_info.value, "123456782")
 
@@ -317,7 +322,9 @@ class SubmissionResumeViewTests(FrontendRedirectMixin, TestCase):
         response = self.client.get(endpoint)
 
         self.assertEqual(403, response.status_code)
-        self.assertNotIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertFalse(
+            get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY)
+        )
 
     def test_invalid_auth_attribute_raises_exception(self):
         submission = SubmissionFactory.create(
@@ -355,7 +362,9 @@ class SubmissionResumeViewTests(FrontendRedirectMixin, TestCase):
         response = self.client.get(endpoint)
 
         self.assertEqual(403, response.status_code)
-        self.assertNotIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertFalse(
+            get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY)
+        )
 
     def test_invalid_auth_value_raises_exception(self):
         submission = SubmissionFactory.create(
@@ -392,7 +401,9 @@ class SubmissionResumeViewTests(FrontendRedirectMixin, TestCase):
         response = self.client.get(endpoint)
 
         self.assertEqual(403, response.status_code)
-        self.assertNotIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertFalse(
+            get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY)
+        )
 
     def test_resume_creates_valid_url(self):
         submission = SubmissionFactory.from_components(
@@ -455,4 +466,6 @@ class SubmissionResumeViewTests(FrontendRedirectMixin, TestCase):
         self.assertRedirects(
             response, expected_redirect_url.url, fetch_redirect_response=False
         )
-        self.assertNotIn(SUBMISSIONS_SESSION_KEY, self.client.session)
+        self.assertFalse(
+            get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY)
+        )
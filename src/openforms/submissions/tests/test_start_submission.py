@@ -31,6 +31,7 @@ from openforms.forms.tests.factories import (
 
 from ..constants import SUBMISSIONS_SESSION_KEY, SubmissionValueVariableSources
 from ..models import Submission, SubmissionValueVariable
+from ..ownership import get_session_set
 
 
 @override_settings(
@@ -75,8 +76,8 @@ class SubmissionStartTests(APITestCase):
 
         # check that the submission ID is in the session
         self.assertEqual(
-            response.wsgi_request.session[SUBMISSIONS_SESSION_KEY],
-            [str(submission.uuid)],
+            get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY),
+            {str(submission.uuid)},
         )
 
     def test_start_second_submission(self):
@@ -100,7 +101,7 @@ class SubmissionStartTests(APITestCase):
 
             ids = submissions.values_list("uuid", flat=True)
             self.assertEqual(
-                set(response.wsgi_request.session[SUBMISSIONS_SESSION_KEY]),
+                get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY),
                 {str(uuid) for uuid in ids},
             )
 
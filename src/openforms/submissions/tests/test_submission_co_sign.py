@@ -12,6 +12,7 @@ from openforms.authentication.constants import FORM_AUTH_SESSION_KEY
 from openforms.config.models import GlobalConfiguration
 
 from ..constants import SUBMISSIONS_SESSION_KEY
+from ..ownership import get_session_set
 from .factories import SubmissionFactory
 from .mixins import SubmissionsMixin
 
@@ -194,9 +195,9 @@ class SubmissionCosignEndpointTests(SubmissionsMixin, APITestCase):
         self.assertTrue(submission.cosign_statement_of_truth_accepted)
 
         session = self.client.session
-        ids = session.get(SUBMISSIONS_SESSION_KEY, [])
+        ids = get_session_set(session, SUBMISSIONS_SESSION_KEY)
 
-        self.assertNotIn(submission.uuid, ids)
+        self.assertNotIn(str(submission.uuid), ids)
 
     @override_settings(LANGUAGE_CODE="en")
     def test_cosign_did_not_accept_privacy_policy(self):
@@ -39,6 +39,7 @@ from openforms.variables.constants import FormVariableDataTypes, FormVariableSou
 from ..constants import SUBMISSIONS_SESSION_KEY, PostSubmissionEvents
 from ..logic.actions import LogicActionTypes
 from ..models import SubmissionStep
+from ..ownership import get_session_set
 from ..tasks import on_post_submission_event
 from .factories import (
     SubmissionFactory,
@@ -115,9 +116,11 @@ class SubmissionCompletionTests(SubmissionsMixin, APITestCase):
         self.assertTrue(submission.privacy_policy_accepted)
 
         # test that submission ID removed from session
-        submissions_in_session = response.wsgi_request.session[SUBMISSIONS_SESSION_KEY]
+        submissions_in_session = get_session_set(
+            response.wsgi_request.session, SUBMISSIONS_SESSION_KEY
+        )
         self.assertNotIn(str(submission.uuid), submissions_in_session)
-        self.assertEqual(submissions_in_session, [])
+        self.assertEqual(submissions_in_session, set())
 
     def test_submit_form_with_not_applicable_step(self):
         form = FormFactory.create()
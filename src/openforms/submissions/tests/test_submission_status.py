@@ -17,6 +17,7 @@ from openforms.config.models import GlobalConfiguration
 from openforms.payments.constants import PaymentStatus
 from openforms.payments.contrib.ogone.tests.factories import OgoneMerchantFactory
 from openforms.payments.tests.factories import SubmissionPaymentFactory
+from openforms.utils.tests.cache import clear_caches
 
 from ..constants import (
     SUBMISSIONS_SESSION_KEY,
@@ -24,7 +25,17 @@ from ..constants import (
     ProcessingResults,
     ProcessingStatuses,
 )
-from ..tasks import cleanup_on_completion_results
+from ..ownership import get_session_set
+from ..status import (
+    get_processing_summary,
+    init_processing_summary,
+    update_processing_summary,
+)
+from ..tasks import (
+    cleanup_on_completion_results,
+    pre_registration,
+    record_post_completion_task_state,
+)
 from ..tokens import submission_status_token_generator
 from .factories import (
     PostCompletionMetadataFactory,
@@ -218,8 +229,8 @@ class SubmissionStatusStatusAndResultTests(APITestCase):
             self.assertEqual(response_data["result"], ProcessingResults.failed)
             # check that the submission ID is in the session
             self.assertEqual(
-                response.wsgi_request.session[SUBMISSIONS_SESSION_KEY],
-                [str(submission.uuid)],
+                get_session_set(response.wsgi_request.session, SUBMISSIONS_SESSION_KEY),
+                {str(submission.uuid)},
             )
 
 
@@ -514,3 +525,118 @@ class CleanupTaskTests(TestCase):
         cleanup_on_completion_results()
 
         self.assertEqual(0, mock_forget.call_count)
+
+
+@temp_private_root()
+class SubmissionStatusSummaryTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(clear_caches)
+
+    def _get_status_url(self, submission) -> str:
+        token = submission_status_token_generator.make_token(submission)
+        return reverse(
+            "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
+        )
+
+    def test_tasks_record_their_state(self):
+        submission = SubmissionFactory.create(
+            completed=True, metadata__tasks_ids=["task-1", "task-2"]
+        )
+        init_processing_summary(submission.pk, ["task-1", "task-2"])
+
+        record_post_completion_task_state(
+            sender=pre_registration,
+            task_id="task-1",
+            args=(submission.pk, PostSubmissionEvents.on_completion),
+            state=states.SUCCESS,
+        )
+        # unrelated tasks are ignored
+        record_post_completion_task_state(
+            sender=cleanup_on_completion_results,
+            task_id="task-2",
+            args=(submission.pk,),
+            state=states.FAILURE,
+        )
+
+        summary = get_processing_summary(submission.pk)
+        self.assertEqual(
+            summary["states"], {"task-1": states.SUCCESS, "task-2": states.PENDING}
+        )
+
+    def test_states_recorded_before_initialization(self):
+        submission = SubmissionFactory.create(
+            completed=True, metadata__tasks_ids=["task-1", "task-2"]
+        )
+
+        # fast workers may finish a task before the summary is initialized
+        update_processing_summary(submission.pk, "task-1", states.SUCCESS)
+        init_processing_summary(submission.pk, ["task-1", "task-2"])
+
+        summary = get_processing_summary(submission.pk)
+        self.assertEqual(
+            summary["states"], {"task-1": states.SUCCESS, "task-2": states.PENDING}
+        )
+
+    def test_polling_uses_the_summary(self):
+        submission = SubmissionFactory.create(
+            completed=True,
+            form__submission_confirmation_template="You get a cookie!",
+            metadata__tasks_ids=["task-1", "task-2"],
+        )
+        SubmissionReportFactory.create(submission=submission)
+        init_processing_summary(submission.pk, ["task-1", "task-2"])
+        update_processing_summary(submission.pk, "task-1", states.SUCCESS)
+        check_status_url = self._get_status_url(submission)
+
+        with (
+            patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult,
+            patch(
+                "openforms.submissions.models.Submission.render_confirmation_page",
+                return_value="You get a cookie!",
+            ) as mock_render,
+        ):
+            with self.subTest("in progress"):
+                response = self.client.get(check_status_url)
+
+                self.assertEqual(
+                    response.json()["status"], ProcessingStatuses.in_progress
+                )
+
+            update_processing_summary(submission.pk, "task-2", states.SUCCESS)
+
+            with self.subTest("done"):
+                for _ in range(2):
+                    response = self.client.get(check_status_url)
+
+                    response_data = response.json()
+                    self.assertEqual(response_data["status"], ProcessingStatuses.done)
+                    self.assertEqual(response_data["result"], ProcessingResults.success)
+                    self.assertEqual(
+                        response_data["confirmationPageContent"], "You get a cookie!"
+                    )
+
+        mock_AsyncResult.assert_not_called()
+        mock_render.assert_called_once()
+
+    def test_stale_summary_falls_back_to_result_backend(self):
+        submission = SubmissionFactory.create(
+            completed=True, metadata__tasks_ids=["task-1"]
+        )
+        with freeze_time("2024-01-15T10:00:00+01:00"):
+            init_processing_summary(submission.pk, ["task-1"])
+
+        with (
+            freeze_time("2024-01-15T11:00:00+01:00"),
+            patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult,
+        ):
+            mock_AsyncResult.return_value.state = states.FAILURE
+            # the token must be valid at the time of the request
+            check_status_url = self._get_status_url(submission)
+
+            response = self.client.get(check_status_url)
+
+        response_data = response.json()
+        self.assertEqual(response_data["status"], ProcessingStatuses.done)
+        self.assertEqual(response_data["result"], ProcessingResults.failed)
+        mock_AsyncResult.assert_called_once_with("task-1")
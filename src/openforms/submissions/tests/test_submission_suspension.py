@@ -28,6 +28,7 @@ from openforms.forms.tests.factories import FormFactory, FormStepFactory
 from openforms.utils.tests.cache import clear_caches
 
 from ..constants import SUBMISSIONS_SESSION_KEY
+from ..ownership import get_session_set
 from ..tokens import submission_resume_token_generator
 from .factories import SubmissionFactory, SubmissionStepFactory
 from .mixins import SubmissionsMixin
@@ -67,7 +68,9 @@ class SubmissionSuspensionTests(SubmissionsMixin, APITestCase):
         self.assertEqual(submission.suspended_on, timezone.now())
 
         # test that submission ID is not removed from session
-        submissions_in_session = response.wsgi_request.session[SUBMISSIONS_SESSION_KEY]
+        submissions_in_session = get_session_set(
+            response.wsgi_request.session, SUBMISSIONS_SESSION_KEY
+        )
         self.assertIn(str(submission.uuid), submissions_in_session)
 
     @freeze_time("2020-12-11T10:53:19+01:00")
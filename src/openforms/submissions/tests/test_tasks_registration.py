@@ -2,9 +2,11 @@ import threading
 import time
 from unittest.mock import patch
 
-from django.db import close_old_connections
+from django.db import IntegrityError, close_old_connections
 from django.test import TestCase, TransactionTestCase
 
+import factory
+
 from ..public_references import set_submission_reference
 from .factories import SubmissionFactory
 
@@ -36,6 +38,49 @@ class ObtainSubmissionReferenceTests(TestCase):
         submission.refresh_from_db()
         self.assertEqual(submission.public_registration_reference, "OF-OTHER")
 
+    def test_reference_generation_does_not_scan_existing_references(self):
+        submission = SubmissionFactory.create(completed=True)
+
+        # savepoint, update, release savepoint
+        with self.assertNumQueries(3):
+            set_submission_reference(submission)
+
+        submission.refresh_from_db()
+        self.assertRegex(submission.public_registration_reference, r"^OF-[A-Z2-9]{6}$")
+
+    def test_query_count_constant_as_table_grows(self):
+        for num_existing in (0, 10, 100):
+            with self.subTest(num_existing=num_existing):
+                SubmissionFactory.create_batch(
+                    num_existing,
+                    completed=True,
+                    public_registration_reference=factory.Sequence(
+                        lambda n: f"OF-{n:06d}"
+                    ),
+                )
+                submission = SubmissionFactory.create(completed=True)
+
+                with self.assertNumQueries(3):
+                    set_submission_reference(submission)
+
+    def test_gives_up_after_repeated_collisions(self):
+        SubmissionFactory.create(
+            completed=True, public_registration_reference="OF-UNIQUE"
+        )
+        submission = SubmissionFactory.create(completed=True)
+
+        with (
+            patch(
+                "openforms.submissions.public_references.get_random_string",
+                return_value="UNIQUE",
+            ),
+            self.assertRaises(IntegrityError),
+        ):
+            set_submission_reference(submission)
+
+        submission.refresh_from_db()
+        self.assertEqual(submission.public_registration_reference, "")
+
 
 class RaceConditionTests(TransactionTestCase):
     def test_race_condition_generating_unique_reference(self):
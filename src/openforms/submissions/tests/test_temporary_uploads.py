@@ -1,7 +1,9 @@
 import os
 import uuid
 from datetime import timedelta
+from importlib import import_module
 
+from django.conf import settings
 from django.test import RequestFactory, tag
 
 from freezegun import freeze_time
@@ -20,6 +22,13 @@ from openforms.submissions.attachments import (
 from openforms.submissions.constants import UPLOADS_SESSION_KEY
 from openforms.submissions.models import TemporaryFileUpload
 from openforms.submissions.models.submission_files import SubmissionFileAttachment
+from openforms.submissions.ownership import (
+    add_to_session_set,
+    get_session_set,
+    in_session_set,
+    remove_from_session_set,
+    session_set_is_empty,
+)
 from openforms.submissions.tests.factories import (
     SubmissionFactory,
     SubmissionFileAttachmentFactory,
@@ -28,8 +37,6 @@ from openforms.submissions.tests.factories import (
 from openforms.submissions.tests.mixins import SubmissionsMixin
 from openforms.submissions.utils import (
     add_upload_to_session,
-    append_to_session_list,
-    remove_from_session_list,
     remove_upload_from_session,
 )
 
@@ -158,7 +165,9 @@ class TemporaryFileUploadTest(SubmissionsMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
         # gone
-        self.assertEqual([], self.client.session[UPLOADS_SESSION_KEY])
+        self.assertEqual(
+            set(), get_session_set(self.client.session, UPLOADS_SESSION_KEY)
+        )
 
     def test_delete_instance_method(self):
         upload = TemporaryFileUploadFactory.create()
@@ -247,22 +256,82 @@ class TemporaryFileUploadTest(SubmissionsMixin, APITestCase):
     def test_session_utils(self):
         session = self.client.session
 
-        # append values
-        append_to_session_list(session, "my_key", 1)
-        self.assertEqual(session["my_key"], [1])
-        append_to_session_list(session, "my_key", 2)
-        self.assertEqual(session["my_key"], [1, 2])
+        # add values
+        add_to_session_set(session, "my_key", "1")
+        self.assertEqual(get_session_set(session, "my_key"), {"1"})
+        add_to_session_set(session, "my_key", "2")
+        self.assertEqual(get_session_set(session, "my_key"), {"1", "2"})
+        self.assertTrue(in_session_set(session, "my_key", "2"))
 
         # no duplicates
-        append_to_session_list(session, "my_key", 2)
-        self.assertEqual(session["my_key"], [1, 2])
+        add_to_session_set(session, "my_key", "2")
+        self.assertEqual(get_session_set(session, "my_key"), {"1", "2"})
 
         # remove value
-        remove_from_session_list(session, "my_key", 2)
-        self.assertEqual(session["my_key"], [1])
+        remove_from_session_set(session, "my_key", "2")
+        self.assertEqual(get_session_set(session, "my_key"), {"1"})
+        self.assertFalse(in_session_set(session, "my_key", "2"))
 
         # ignore values never added
-        remove_from_session_list(session, "my_key", 3)
+        remove_from_session_set(session, "my_key", "3")
+
+        # the values are not stored in the session itself
+        self.assertNotIn("my_key", session)
+
+    def test_session_utils_without_session(self):
+        session = import_module(settings.SESSION_ENGINE).SessionStore()
+        self.assertIsNone(session.session_key)
+
+        self.assertTrue(session_set_is_empty(session, "my_key"))
+        self.assertEqual(get_session_set(session, "my_key"), set())
+
+        add_to_session_set(session, "my_key", "1")
+
+        self.assertIsNotNone(session.session_key)
+        self.assertFalse(session_set_is_empty(session, "my_key"))
+
+    def test_session_utils_flushed_session(self):
+        session = self.client.session
+        add_to_session_set(session, "my_key", "1")
+
+        session.flush()
+
+        self.assertEqual(get_session_set(session, "my_key"), set())
+
+    def test_session_utils_cycled_session_key(self):
+        session = self.client.session
+        add_to_session_set(session, "my_key", "1")
+
+        session.cycle_key()
+
+        self.assertEqual(get_session_set(session, "my_key"), {"1"})
+
+    def test_session_utils_migrate_legacy_session_list(self):
+        upload = TemporaryFileUploadFactory.create()
+        session = self.client.session
+        # the format used before the ownership sets were introduced
+        session[UPLOADS_SESSION_KEY] = [str(upload.uuid)]
+        session.save()
+
+        session = self.client.session
+        self.assertTrue(in_session_set(session, UPLOADS_SESSION_KEY, str(upload.uuid)))
+        self.assertNotIn(UPLOADS_SESSION_KEY, session)
+
+    def test_legacy_session_list_grants_access(self):
+        upload = TemporaryFileUploadFactory.create()
+        session = self.client.session
+        session[UPLOADS_SESSION_KEY] = [str(upload.uuid)]
+        session.save()
+        url = reverse("api:submissions:temporary-file", kwargs={"uuid": upload.uuid})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn(UPLOADS_SESSION_KEY, self.client.session)
+        self.assertEqual(
+            get_session_set(self.client.session, UPLOADS_SESSION_KEY),
+            {str(upload.uuid)},
+        )
 
     def test_session_upload_utils(self):
         session = self.client.session
@@ -272,8 +341,9 @@ class TemporaryFileUploadTest(SubmissionsMixin, APITestCase):
         add_upload_to_session(upload_1, session)
         add_upload_to_session(upload_2, session)
 
-        session_uploads = session[UPLOADS_SESSION_KEY]
-        self.assertEqual([str(upload_1.uuid), str(upload_2.uuid)], session_uploads)
+        session_uploads = get_session_set(session, UPLOADS_SESSION_KEY)
+        self.assertEqual({str(upload_1.uuid), str(upload_2.uuid)}, session_uploads)
 
         remove_upload_from_session(upload_1, session)
-        self.assertEqual([str(upload_2.uuid)], session_uploads)
+        session_uploads = get_session_set(session, UPLOADS_SESSION_KEY)
+        self.assertEqual({str(upload_2.uuid)}, session_uploads)
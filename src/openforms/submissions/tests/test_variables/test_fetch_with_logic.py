@@ -173,9 +173,12 @@ class ServiceFetchWithActionsTest(SubmissionsMixin, APITestCase):
         response = self.client.post(endpoint, data={"data": {"fieldC": 42}})
 
         self.assertEqual(response.status_code, 200)
+        # the requests are independent and performed concurrently, in any order
+        self.assertEqual(
+            {request.url for request in m.request_history},
+            {"https://httpbin.org/get", "https://httpbin.org/get?fieldC=42"},
+        )
         self.assertEqual(len(m.request_history), 2)
-        self.assertEqual(m.request_history[-1].url, "https://httpbin.org/get?fieldC=42")
-        self.assertEqual(m.request_history[-2].url, "https://httpbin.org/get")
 
         response = self.client.post(endpoint, data={"data": {"fieldC": 43}})
 
@@ -235,3 +238,76 @@ class ServiceFetchWithActionsTest(SubmissionsMixin, APITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(m.request_history), 2)
         self.assertEqual(m.request_history[-1].url, "https://httpbin.org/get")
+
+    @requests_mock.Mocker(case_sensitive=True)
+    def test_dependent_requests_are_performed_in_order(self, m):
+        submission = SubmissionFactory.from_components(
+            [
+                {"type": "textfield", "key": "fieldA"},
+                {"type": "textfield", "key": "fieldB"},
+                {"type": "textfield", "key": "fieldC"},
+            ]
+        )
+        fetch_config1 = ServiceFetchConfigurationFactory.create(
+            service=self.service, path="get", query_params={"source": ["a"]}
+        )
+        fetch_config2 = ServiceFetchConfigurationFactory.create(
+            service=self.service, path="get", query_params={"fieldA": ["{{ fieldA }}"]}
+        )
+        fetch_config3 = ServiceFetchConfigurationFactory.create(
+            service=self.service, path="get", query_params={"source": ["c"]}
+        )
+        for order, (variable, fetch_config) in enumerate(
+            [
+                ("fieldA", fetch_config1),
+                ("fieldB", fetch_config2),
+                ("fieldC", fetch_config3),
+            ]
+        ):
+            FormLogicFactory.create(
+                form=submission.form,
+                order=order,
+                json_logic_trigger=True,
+                actions=[
+                    {
+                        "variable": variable,
+                        "action": {
+                            "type": LogicActionTypes.fetch_from_service,
+                            "value": fetch_config.id,
+                        },
+                    }
+                ],
+            )
+        self._add_submission_to_session(submission)
+        m.get("https://httpbin.org/get?source=a", json="a")
+        m.get("https://httpbin.org/get?fieldA=a", json="b")
+        m.get("https://httpbin.org/get?source=c", json="c")
+        endpoint = reverse(
+            "api:submission-steps-logic-check",
+            kwargs={
+                "submission_uuid": submission.uuid,
+                "step_uuid": submission.form.formstep_set.first().uuid,
+            },
+        )
+
+        response = self.client.post(endpoint, data={"data": {}})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["step"]["data"],
+            {"fieldA": "a", "fieldB": "b", "fieldC": "c"},
+        )
+        # the dependent request is never made with the stale (empty) value of fieldA
+        urls = [request.url for request in m.request_history]
+        self.assertCountEqual(
+            urls,
+            [
+                "https://httpbin.org/get?source=a",
+                "https://httpbin.org/get?fieldA=a",
+                "https://httpbin.org/get?source=c",
+            ],
+        )
+        self.assertLess(
+            urls.index("https://httpbin.org/get?source=a"),
+            urls.index("https://httpbin.org/get?fieldA=a"),
+        )
@@ -11,6 +11,7 @@ from openforms.submissions.tests.factories import (
     SubmissionStepFactory,
     SubmissionValueVariableFactory,
 )
+from openforms.utils.tests.cache import clear_caches
 from openforms.variables.constants import FormVariableSources
 
 from ...models.submission_value_variable import (
@@ -21,6 +22,13 @@ from ...rendering import Renderer, RenderModes
 
 
 class SubmissionVariablesPerformanceTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        # the form variables are cached - start every test with a cold cache
+        clear_caches()
+        self.addCleanup(clear_caches)
+
     def test_evaluate_form_logic_without_rules(self):
         form = FormFactory.create()
         form_step1 = FormStepFactory.create(
@@ -60,10 +68,10 @@ class SubmissionVariablesPerformanceTests(APITestCase):
         submission.load_execution_state()
         del submission._variables_state  # force re-fetching this to count queries
 
-        # 1. Loading the variables state - fetch all the form variables
-        # 2. Loading the variables state - fetch all the submission variables
-        # 3. Retrieve all logic rules related to a form
-        with self.assertNumQueries(3):
+        # The form variables were cached when loading the submission data
+        # 1. Loading the variables state - fetch all the submission variables
+        # 2. Retrieve all logic rules related to a form
+        with self.assertNumQueries(2):
             evaluate_form_logic(submission, submission_step2, data)
 
     def test_evaluate_form_logic_with_rules(self):
@@ -119,17 +127,17 @@ class SubmissionVariablesPerformanceTests(APITestCase):
         submission.load_execution_state()
         del submission._variables_state  # force re-fetching this to count queries
 
-        # 1.  Loading the variables state - fetch all the form variables
-        # 2.  Loading the variables state - fetch all the submission variables
-        # 3.  Retrieve all logic rules related to a form
-        # 4.  Retrieve the submission variables to be deleted - deletion of data happens
+        # The form variables were cached when loading the submission data
+        # 1.  Loading the variables state - fetch all the submission variables
+        # 2.  Retrieve all logic rules related to a form
+        # 3.  Retrieve the submission variables to be deleted - deletion of data happens
         #     because the step is marked N/A
-        # 5.  Retrieve the submission attachment files to be deleted
-        # 6.  SAVEPOINT
-        # 7.  Delete submission attachment files
-        # 8.  RELEASE SAVEPOINT
-        # 9.  Delete submission values
-        with self.assertNumQueries(9):
+        # 4.  Retrieve the submission attachment files to be deleted
+        # 5.  SAVEPOINT
+        # 6.  Delete submission attachment files
+        # 7.  RELEASE SAVEPOINT
+        # 8.  Delete submission values
+        with self.assertNumQueries(8):
             evaluate_form_logic(submission, submission_step2, data)
 
     def test_update_step_data(self):
@@ -6,16 +6,19 @@ The ``template`` package provides generic template rendering constructs. Feature
 * Option to sandbox templates to only allow safe-ish public API
 * Utilities to evaluate templates from string (user-contributed content and inherently
   unsafe).
-
-Possible future features:
-
-* Caching for string-based templates
-* ...
+* Caching of the parsed string-based templates, see :mod:`openforms.template.cache`.
 """
 
 from .backends.sandboxed_django import backend as sandbox_backend, openforms_backend
+from .cache import template_cache
 
-__all__ = ["render_from_string", "parse", "sandbox_backend", "openforms_backend"]
+__all__ = [
+    "render_from_string",
+    "parse",
+    "sandbox_backend",
+    "openforms_backend",
+    "template_cache",
+]
 
 
 def parse(source: str, backend=sandbox_backend):
@@ -48,6 +51,6 @@ def render_from_string(
     """
     if disable_autoescape:
         source = f"{{% autoescape off %}}{source}{{% endautoescape %}}"
-    template = parse(source, backend=backend)
+    template = template_cache.get_template(source, backend=backend)
     res = template.render(context)
     return res
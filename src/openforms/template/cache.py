@@ -0,0 +1,75 @@
+"""
+In-process cache of parsed string-based templates.
+
+User-contributed templates (confirmation pages, email bodies, component labels and
+descriptions...) are rendered over and over again with different contexts, e.g. the
+component labels are interpolated on every logic check. Parsing (compiling) the
+template is a significant part of the rendering cost, and the resulting
+:class:`django.template.backends.django.Template` instances are safe to re-use across
+renders and threads (this is what Django's cached template loader relies on).
+
+The parsed templates are kept in a least-recently-used cache, keyed by the template
+backend and a digest of the source.
+"""
+
+import hashlib
+from functools import partial
+from typing import NamedTuple
+
+from django.conf import settings
+from django.template.backends.django import DjangoTemplates, Template
+
+from openforms.utils.cache import LRUCache
+
+__all__ = ["CacheInfo", "TemplateCache", "template_cache"]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TemplateCache(LRUCache[tuple[DjangoTemplates, str], Template]):
+    """
+    LRU cache of parsed templates.
+
+    The maximum number of templates is taken from the ``TEMPLATE_CACHE_SIZE`` setting,
+    sources larger than ``TEMPLATE_CACHE_MAX_SOURCE_SIZE`` characters are not cached.
+    """
+
+    def get_template(self, source: str, backend: DjangoTemplates) -> Template:
+        """
+        Return the parsed template, parsing it with the backend on a cache miss.
+
+        :raises: :class:`django.template.TemplateSyntaxError` if the template source is
+          invalid. Invalid templates are not cached.
+        """
+        # read at runtime, so that changes to the settings are respected
+        self.maxsize = settings.TEMPLATE_CACHE_SIZE
+        if self.maxsize <= 0 or len(source) > settings.TEMPLATE_CACHE_MAX_SOURCE_SIZE:
+            return backend.from_string(source)
+
+        key = (backend, hashlib.sha256(source.encode("utf-8")).hexdigest())
+        return self.get_or_set(key, partial(backend.from_string, source))
+
+    def info(self) -> CacheInfo:
+        stats = self.stats
+        return CacheInfo(
+            hits=stats["hits"],
+            misses=stats["misses"],
+            maxsize=settings.TEMPLATE_CACHE_SIZE,
+            currsize=stats["size"],
+        )
+
+
+template_cache = TemplateCache()
+"""
+The cache of parsed templates shared by all template backends.
+"""
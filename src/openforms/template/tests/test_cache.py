@@ -0,0 +1,74 @@
+from django.template import TemplateSyntaxError
+from django.test import SimpleTestCase, override_settings
+
+from .. import openforms_backend, render_from_string, sandbox_backend
+from ..cache import TemplateCache, template_cache
+
+
+class TemplateCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.cache = TemplateCache()
+
+    def test_parsed_template_is_reused(self):
+        template1 = self.cache.get_template("{{ foo }}", backend=sandbox_backend)
+        template2 = self.cache.get_template("{{ foo }}", backend=sandbox_backend)
+
+        self.assertIs(template1, template2)
+        self.assertEqual(template2.render({"foo": "bar"}), "bar")
+        info = self.cache.info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+        self.assertEqual(info.hit_rate, 0.5)
+
+    def test_templates_are_cached_per_backend(self):
+        template1 = self.cache.get_template("{{ foo }}", backend=sandbox_backend)
+        template2 = self.cache.get_template("{{ foo }}", backend=openforms_backend)
+
+        self.assertIsNot(template1, template2)
+        self.assertEqual(self.cache.info().currsize, 2)
+
+    @override_settings(TEMPLATE_CACHE_SIZE=2)
+    def test_least_recently_used_template_is_evicted(self):
+        first = self.cache.get_template("first", backend=sandbox_backend)
+        self.cache.get_template("second", backend=sandbox_backend)
+        # use the first template again, so the second is the least recently used
+        self.cache.get_template("first", backend=sandbox_backend)
+        self.cache.get_template("third", backend=sandbox_backend)
+
+        self.assertEqual(self.cache.info().currsize, 2)
+        self.assertIs(self.cache.get_template("first", backend=sandbox_backend), first)
+        self.cache.get_template("second", backend=sandbox_backend)
+        self.assertEqual(self.cache.info().misses, 4)
+
+    @override_settings(TEMPLATE_CACHE_SIZE=0)
+    def test_cache_disabled(self):
+        template1 = self.cache.get_template("{{ foo }}", backend=sandbox_backend)
+        template2 = self.cache.get_template("{{ foo }}", backend=sandbox_backend)
+
+        self.assertIsNot(template1, template2)
+        self.assertEqual(self.cache.info().currsize, 0)
+
+    @override_settings(TEMPLATE_CACHE_MAX_SOURCE_SIZE=5)
+    def test_large_templates_are_not_cached(self):
+        self.cache.get_template("{{ foo }}", backend=sandbox_backend)
+
+        self.assertEqual(self.cache.info().currsize, 0)
+
+    def test_invalid_templates_are_not_cached(self):
+        with self.assertRaises(TemplateSyntaxError):
+            self.cache.get_template("{% invalid %}", backend=sandbox_backend)
+
+        self.assertEqual(self.cache.info().currsize, 0)
+
+    def test_render_from_string_uses_cache(self):
+        self.addCleanup(template_cache.clear)
+        template_cache.clear()
+
+        render_from_string("{{ foo }}", {"foo": "bar"})
+        result = render_from_string("{{ foo }}", {"foo": "baz"})
+        render_from_string("{{ foo }}", {"foo": "<b>"}, disable_autoescape=True)
+
+        self.assertEqual(result, "baz")
+        info = template_cache.info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
@@ -1,4 +1,6 @@
 import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
 
 from django.core import signals
 from django.core.cache import DEFAULT_CACHE_ALIAS, caches
@@ -98,6 +100,110 @@ def mark_request_proxy_caches(**kwargs):
         cache.mark_request_started()
 
 
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Thread-safe, bounded in-process cache with least-recently-used eviction.
+
+    Used for expensive derived (read-only) structures that are fully determined by
+    their cache key, like compiled logic or parsed configuration. Values are shared
+    between threads, so callers must treat them as immutable.
+
+    Hit/miss counters are tracked to be able to report on the effectiveness.
+
+    The optional ``on_evict`` callback is called with the key and value of every entry
+    that is dropped from the cache (evicted, replaced, deleted or cleared), e.g. to
+    release the resources held by the value.
+
+    By default, ``maxsize`` is the maximum number of entries. With the optional
+    ``get_size`` callable, it is the maximum of the summed sizes of the values instead,
+    e.g. the number of bytes.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        on_evict: Callable[[K, V], None] | None = None,
+        get_size: Callable[[V], int] | None = None,
+    ):
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self.get_size = get_size
+        self.hits = 0
+        self.misses = 0
+        self.currsize = 0
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._data
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def _size(self, value: V) -> int:
+        return 1 if self.get_size is None else self.get_size(value)
+
+    def _pop(self, key: K, evicted: bool = True) -> V:
+        value = self._data.pop(key)
+        self.currsize -= self._size(value)
+        if evicted and self.on_evict is not None:
+            self.on_evict(key, value)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            if key in self._data:
+                self._pop(key, evicted=self._data[key] is not value)
+            self._data[key] = value
+            self.currsize += self._size(value)
+            while self.currsize > self.maxsize:
+                self._pop(next(iter(self._data)))
+
+    def get_or_set(self, key: K, default: Callable[[], V]) -> V:
+        sentinel = object()
+        value = self.get(key, default=sentinel)  # type: ignore
+        if value is sentinel:
+            value = default()
+            self.set(key, value)
+        return value  # type: ignore
+
+    def delete(self, key: K) -> None:
+        with self._lock:
+            if key in self._data:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            while self._data:
+                self._pop(next(iter(self._data)))
+            self.hits = self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "currsize": self.currsize,
+            "maxsize": self.maxsize,
+        }
+
+
 signals.request_started.connect(
     mark_request_proxy_caches,
     dispatch_uid="openforms.cache.mark_request_start",
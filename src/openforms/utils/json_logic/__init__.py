@@ -2,6 +2,7 @@
 Utilities to parse/process jsonLogic expressions.
 """
 
+from .compiler import *  # noqa
 from .datastructures import *  # noqa
 from .introspection import *  # noqa
 
@@ -10,4 +11,6 @@ __all__ = [
     "generate_rule_description",
     "ComponentMeta",
     "introspect_json_logic",
+    "CompiledExpression",
+    "compile_expression",
 ]
@@ -0,0 +1,122 @@
+"""
+Compile JSON-logic expressions into a tree of Python closures.
+
+:func:`json_logic.jsonLogic` interprets the raw expression on every call - it
+destructures every node, looks up the operators and splits the ``var`` paths over and
+over again. For expressions that are evaluated many times (like logic rule triggers),
+we do that work once and produce a callable taking the data as its only argument.
+
+The compiled program has the exact same semantics as :func:`json_logic.jsonLogic`.
+Nodes that cannot be compiled fall back to the interpreter.
+"""
+
+from typing import Any, Callable, Sequence
+
+from json_logic import (
+    empty_operand_values_for_operators,
+    get_var,
+    jsonLogic,
+    missing,
+    missing_some,
+    operations,
+    scoped_operations,
+)
+from json_logic.meta.expressions import destructure
+from json_logic.typing import JSON
+
+__all__ = ["CompiledExpression", "compile_expression"]
+
+CompiledExpression = Callable[[Any], Any]
+
+_NOT_FOUND = object()
+
+
+def compile_expression(expression: JSON) -> CompiledExpression:
+    """
+    Compile a JSON-logic expression into a callable ``program(data) -> result``.
+    """
+    try:
+        return _compile(expression)
+    except Exception:
+        # leave error handling/reporting to evaluation time, like the interpreter
+        return lambda data: jsonLogic(expression, data)
+
+
+def _compile(expression: JSON) -> CompiledExpression:
+    if isinstance(expression, list):
+        items = [_compile(item) for item in expression]
+        return lambda data: [item(data) for item in items]
+
+    # primitives evaluate to themselves
+    if expression is None or not isinstance(expression, dict):
+        return lambda data: expression
+
+    operator, values = destructure(expression)
+    if not isinstance(values, (list, tuple)):
+        values = [values]
+
+    if operator in scoped_operations:
+        scoped_operation = scoped_operations[operator]
+        return lambda data: scoped_operation(data or {}, *values)
+
+    arguments = [_compile(value) for value in values]
+
+    match operator:
+        case "var":
+            return _compile_var(values, arguments)
+        case "missing":
+            return lambda data: missing(
+                data or {}, *[argument(data or {}) for argument in arguments]
+            )
+        case "missing_some":
+            return lambda data: missing_some(
+                data or {}, *[argument(data or {}) for argument in arguments]
+            )
+
+    if operator not in operations:
+        raise ValueError("Unrecognized operation %s" % operator)
+
+    operation = operations[operator]
+    empty_values = empty_operand_values_for_operators.get(operator)
+
+    def evaluate(data):
+        data = data or {}
+        operands = [argument(data) for argument in arguments]
+        if empty_values and any(value in empty_values for value in operands):
+            return None
+        return operation(*operands)
+
+    return evaluate
+
+
+def _compile_var(
+    values: Sequence[JSON], arguments: list[CompiledExpression]
+) -> CompiledExpression:
+    path = values[0] if values else None
+    # dynamic paths or other exotic usage - defer to the library implementation
+    if not (isinstance(path, str) and path and 1 <= len(values) <= 2):
+        return lambda data: get_var(
+            data or {}, *[argument(data or {}) for argument in arguments]
+        )
+
+    # resolve the path once
+    keys = path.split(".")
+    get_default = arguments[1] if len(arguments) == 2 else (lambda data: None)
+
+    def lookup(data):
+        data = data or {}
+        not_found = get_default(data)
+        value = data
+        try:
+            for key in keys:
+                try:
+                    value = value[key]
+                except TypeError:
+                    value = value[int(key)]
+        except (KeyError, TypeError, ValueError, IndexError):
+            return not_found
+        if value is None and not_found is not None:
+            return not_found
+        return value
+
+    return lookup
@@ -1,7 +1,23 @@
+"""
+Render (HTML) templates to PDF with WeasyPrint.
+
+Setting up WeasyPrint is expensive - loading the (system) font configuration and
+reading the stylesheets, fonts and images from disk takes a considerable amount of the
+time needed to render a typical submission report. The :class:`PDFRenderer` is
+therefore long-lived: one instance is kept per (worker) thread, which holds on to the
+font configurations. The static and media assets are kept in a bounded in-memory cache
+shared by all renderers.
+"""
+
 import logging
 import mimetypes
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
 from io import BytesIO
 from pathlib import PurePosixPath
+from typing import TYPE_CHECKING, Hashable
 from urllib.parse import ParseResult, urljoin, urlparse
 
 from django.conf import settings
@@ -10,15 +26,42 @@ from django.contrib.staticfiles.storage import staticfiles_storage
 from django.core.files.storage import FileSystemStorage, default_storage
 from django.template.loader import render_to_string
 
+import elasticapm
+
+from .cache import LRUCache
+
+if TYPE_CHECKING:
+    from weasyprint.text.fonts import FontConfiguration
+
 logger = logging.getLogger(__name__)
 
+# assets larger than this are read from disk every time
+MAX_CACHED_ASSET_SIZE = 2 * 1024 * 1024
+
+# static/media file contents, keyed by the URL and the modification time of the file,
+# bounded by the total number of bytes (see the ``PDF_ASSET_CACHE_SIZE`` setting)
+_asset_cache: LRUCache[tuple[str, int], bytes] = LRUCache(
+    maxsize=settings.PDF_ASSET_CACHE_SIZE, get_size=len
+)
+
+
+def _default_url_fetcher(url: str) -> dict:
+    import weasyprint  # heavy import
+
+    return weasyprint.default_url_fetcher(url)
+
 
 class UrlFetcher:
     """
     URL fetcher that skips the network for /static/* files.
+
+    The file contents are cached in memory, keyed by URL and modification time, so
+    that the same assets are only read once for all the PDFs rendered in a process.
     """
 
     def __init__(self):
+        self.hits = 0
+        self.misses = 0
         self.static_url = self._get_fully_qualified_url(settings.STATIC_URL)
         is_static_local_storage = issubclass(
             staticfiles_storage.__class__, FileSystemStorage
@@ -42,8 +85,6 @@ class UrlFetcher:
         return urlparse(fully_qualified_url)
 
     def __call__(self, url: str) -> dict:
-        import weasyprint  # heavy import
-
         orig_url = url
         parsed_url = urlparse(url)
 
@@ -62,7 +103,7 @@ class UrlFetcher:
 
             if absolute_path is None:
                 logger.error("Could not resolve path '%s'", path)
-                return weasyprint.default_url_fetcher(orig_url)
+                return _default_url_fetcher(orig_url)
 
             content_type, encoding = mimetypes.guess_type(absolute_path)
             result = dict(
@@ -71,10 +112,26 @@ class UrlFetcher:
                 redirected_url=orig_url,
                 filename=path.parts[-1],
             )
-            with open(absolute_path, "rb") as f:
-                result["file_obj"] = BytesIO(f.read())
+            result["file_obj"] = BytesIO(self._read(orig_url, absolute_path))
             return result
-        return weasyprint.default_url_fetcher(orig_url)
+        return _default_url_fetcher(orig_url)
+
+    def _read(self, url: str, absolute_path: str) -> bytes:
+        stat = os.stat(absolute_path)
+        key = (url, stat.st_mtime_ns)
+        content = _asset_cache.get(key)
+        if content is not None:
+            self.hits += 1
+            return content
+
+        self.misses += 1
+        with open(absolute_path, "rb") as f:
+            content = f.read()
+        if len(content) <= MAX_CACHED_ASSET_SIZE:
+            # read at runtime, so that changes to the settings are respected
+            _asset_cache.maxsize = settings.PDF_ASSET_CACHE_SIZE
+            _asset_cache.set(key, content)
+        return content
 
     def get_match_candidate(
         self, url: ParseResult
@@ -94,17 +151,106 @@ class UrlFetcher:
         return None
 
 
+@dataclass
+class PDFRenderStats:
+    """
+    Timings (in milliseconds) of the phases of rendering a PDF.
+    """
+
+    template: float = 0.0
+    layout: float = 0.0
+    write: float = 0.0
+    asset_cache_hits: int = 0
+    asset_cache_misses: int = 0
+
+    @property
+    def total(self) -> float:
+        return self.template + self.layout + self.write
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {**asdict(self), "total": self.total}
+
+
+class PDFRenderer:
+    """
+    Long-lived PDF renderer, holding on to the WeasyPrint setup between renders.
+
+    Instances are not thread-safe, use :func:`get_pdf_renderer` to obtain the renderer
+    for the current thread.
+    """
+
+    def __init__(self):
+        self._font_configs: LRUCache[Hashable, "FontConfiguration"] = LRUCache(
+            maxsize=8
+        )
+
+    def get_font_config(self, key: Hashable = None) -> "FontConfiguration":
+        """
+        Get the font configuration to use, keyed by the (theme) fonts in use.
+
+        The fonts added through @font-face rules are tracked in the font configuration
+        and only loaded once, identified by their family and style. Documents using
+        different font files for the same font family must use a different key.
+        """
+        from weasyprint.text.fonts import FontConfiguration  # heavy import
+
+        return self._font_configs.get_or_set(key, FontConfiguration)
+
+    def render(
+        self, template_name: str, context: dict, font_config_key: Hashable = None
+    ) -> tuple[str, bytes, PDFRenderStats]:
+        import weasyprint  # heavy import
+
+        stats = PDFRenderStats()
+        # the base URLs depend on the (runtime) settings, so they are not kept around
+        url_fetcher = UrlFetcher()
+
+        start = time.perf_counter()
+        with elasticapm.capture_span(name="render-template", span_type="app.pdf"):
+            rendered_html = render_to_string(template_name, context=context)
+        stats.template = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        with elasticapm.capture_span(name="layout", span_type="app.pdf"):
+            html_object = weasyprint.HTML(
+                string=rendered_html,
+                url_fetcher=url_fetcher,
+                base_url=settings.BASE_URL,
+            )
+            document = html_object.render(
+                font_config=self.get_font_config(font_config_key)
+            )
+        stats.layout = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        with elasticapm.capture_span(name="write-pdf", span_type="app.pdf"):
+            pdf: bytes = document.write_pdf()
+        stats.write = (time.perf_counter() - start) * 1000
+
+        stats.asset_cache_hits = url_fetcher.hits
+        stats.asset_cache_misses = url_fetcher.misses
+        logger.info(
+            "Rendered template '%s' to PDF in %.1fms",
+            template_name,
+            stats.total,
+            extra={"template_name": template_name, **stats.as_dict()},
+        )
+        return rendered_html, pdf, stats
+
+
+_renderers = threading.local()
+
+
+def get_pdf_renderer() -> PDFRenderer:
+    renderer = getattr(_renderers, "renderer", None)
+    if renderer is None:
+        renderer = _renderers.renderer = PDFRenderer()
+    return renderer
+
+
 def render_to_pdf(template_name: str, context: dict) -> tuple[str, bytes]:
     """
     Render a (HTML) template to PDF with the given context.
     """
-    import weasyprint  # heavy import
-
-    rendered_html = render_to_string(template_name, context=context)
-    html_object = weasyprint.HTML(
-        string=rendered_html,
-        url_fetcher=UrlFetcher(),
-        base_url=settings.BASE_URL,
-    )
-    pdf: bytes = html_object.write_pdf()
+    rendered_html, pdf, _ = get_pdf_renderer().render(template_name, context)
     return rendered_html, pdf
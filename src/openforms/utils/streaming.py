@@ -0,0 +1,85 @@
+"""
+Streaming request bodies for (large) document uploads.
+
+Both the Documenten API and StUF-ZDS expect the document content base64 encoded and
+embedded in the JSON/XML payload. Reading the whole file, encoding it and embedding the
+result in the serialized payload requires several copies of the file content in memory.
+
+Instead, the payload is serialized with a marker in place of the content, and the
+content is base64 encoded chunk by chunk while the HTTP client reads the request body.
+The length of the body is known upfront, so the usual ``Content-Length`` header is sent.
+"""
+
+import base64
+import math
+from dataclasses import dataclass, field
+from typing import IO, Iterator
+from uuid import uuid4
+
+from django.conf import settings
+
+__all__ = ["Base64Content", "Base64StreamingBody", "should_stream"]
+
+# multiple of 3, so that the base64 encoded chunks can simply be concatenated
+CHUNK_SIZE = 3 * 64 * 1024
+
+
+def should_stream(size: int | None) -> bool:
+    """
+    Decide if content of the given size should be streamed rather than encoded in
+    memory.
+    """
+    return size is not None and size >= settings.DOCUMENT_UPLOAD_STREAMING_THRESHOLD
+
+
+@dataclass
+class Base64Content:
+    file: IO[bytes]
+    size: int
+    marker: str = field(default_factory=lambda: f"base64-content-{uuid4().hex}")
+
+
+class Base64StreamingBody:
+    """
+    File-like request body with the base64 encoded content embedded in a payload.
+
+    Pass an instance as ``data`` to :mod:`requests`, which then reads the body in
+    blocks while sending it.
+    """
+
+    def __init__(self, payload: str, content: Base64Content):
+        prefix, marker, suffix = payload.partition(content.marker)
+        assert marker, "The content marker must be present in the payload"
+        self.prefix = prefix.encode("utf-8")
+        self.suffix = suffix.encode("utf-8")
+        self.content = content
+        self._chunks = self._iter_chunks()
+        self._buffer = bytearray()
+
+    def __len__(self) -> int:
+        encoded_size = 4 * math.ceil(self.content.size / 3)
+        return len(self.prefix) + encoded_size + len(self.suffix)
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        yield self.prefix
+        # only encode multiples of 3 bytes, otherwise padding ends up in the middle
+        remainder = b""
+        while chunk := self.content.file.read(CHUNK_SIZE):
+            chunk = remainder + chunk
+            cutoff = len(chunk) - len(chunk) % 3
+            remainder = chunk[cutoff:]
+            yield base64.b64encode(chunk[:cutoff])
+        yield base64.b64encode(remainder)
+        yield self.suffix
+
+    def read(self, size: int = -1) -> bytes:
+        for chunk in self._chunks:
+            self._buffer += chunk
+            if 0 <= size <= len(self._buffer):
+                break
+
+        if size < 0:
+            size = len(self._buffer)
+        result = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return result
@@ -4,9 +4,11 @@ from unittest.mock import patch
 
 from django.core.cache import caches
 from django.http import HttpResponse
-from django.test import Client, TestCase, override_settings
+from django.test import Client, SimpleTestCase, TestCase, override_settings
 from django.urls import path
 
+from ..cache import LRUCache
+
 
 @override_settings(
     CACHES={
@@ -229,3 +231,87 @@ class WithinRequestProxyCacheTests(TestCase):
                 client.get("/")
             except Exception:
                 self.fail("Assertions in test view failed")
+
+
+class LRUCacheTests(SimpleTestCase):
+    def test_get_or_set_computes_once(self):
+        cache = LRUCache(maxsize=2)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return "value"
+
+        first = cache.get_or_set("key", compute)
+        second = cache.get_or_set("key", compute)
+
+        self.assertEqual(first, "value")
+        self.assertEqual(second, "value")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.stats["hits"], 1)
+        self.assertEqual(cache.stats["misses"], 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # mark "a" as recently used
+
+        cache.set("c", 3)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_delete_and_clear(self):
+        cache = LRUCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        cache.delete("missing")
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats["hits"], 0)
+
+    def test_on_evict_is_called_for_dropped_entries(self):
+        evicted = []
+        cache = LRUCache(maxsize=2, on_evict=lambda key, value: evicted.append(key))
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        self.assertEqual(evicted, ["a"])
+
+        cache.set("b", 2)  # same value, nothing dropped
+        cache.set("b", 20)
+        self.assertEqual(evicted, ["a", "b"])
+
+        cache.delete("c")
+        cache.clear()
+
+        self.assertEqual(evicted, ["a", "b", "c", "b"])
+
+    def test_maxsize_bounds_summed_value_sizes(self):
+        cache = LRUCache(maxsize=10, get_size=len)
+        cache.set("a", b"1234")
+        cache.set("b", b"1234")
+        cache.set("a", b"12")
+        self.assertEqual(cache.currsize, 6)
+
+        cache.set("c", b"123456")
+
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.currsize, 8)
+
+        cache.set("d", b"12345678901")
+
+        self.assertNotIn("d", cache)
+        self.assertEqual(cache.currsize, 0)
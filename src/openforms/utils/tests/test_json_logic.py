@@ -5,11 +5,12 @@ from unittest import skipIf
 from django.test import SimpleTestCase, override_settings
 
 import requests
+from json_logic import jsonLogic
 from json_logic.typing import JSON
 
 from openforms.tests.utils import can_connect
 
-from ..json_logic import generate_rule_description
+from ..json_logic import compile_expression, generate_rule_description
 
 
 @cache
@@ -153,3 +154,64 @@ class RuleDescriptionTests(SimpleTestCase):
                 output = generate_rule_description(cast(JSON, rule))
 
                 self.assertEqual(output, expected_description)
+
+
+class CompiledExpressionTests(SimpleTestCase):
+    def assertSameResult(self, expression: JSON, data: JSON):
+        try:
+            expected = jsonLogic(expression, data)
+        except Exception as exc:
+            with self.assertRaises(type(exc)):
+                compile_expression(expression)(data)
+        else:
+            self.assertEqual(compile_expression(expression)(data), expected)
+
+    def test_same_results_as_interpreter(self):
+        data = {
+            "foo": "bar",
+            "number": 3,
+            "nested": {"key": [{"value": 1}, {"value": None}]},
+            "items": [{"price": 2}, {"price": 5}],
+            "empty": None,
+        }
+        expressions = (
+            {"var": "foo"},
+            {"var": ["nested.key.0.value"]},
+            {"var": ["nested.key.1.value", "default"]},
+            {"var": ["missing", {"cat": ["de", "fault"]}]},
+            {"var": ""},
+            {"var": {"cat": ["fo", "o"]}},
+            {"==": [{"var": "foo"}, "bar"]},
+            {"+": [{"var": "number"}, {"var": "empty"}]},
+            {">": [{"var": "number"}, 2]},
+            {"if": [{"var": "empty"}, "yes", {"var": "foo"}]},
+            {"missing": ["foo", "bar"]},
+            {"missing_some": [1, ["foo", "bar"]]},
+            {
+                "reduce": [
+                    {"var": "items"},
+                    {"+": [{"var": "accumulator"}, {"var": "current.price"}]},
+                    0,
+                ]
+            },
+            {"map": [{"var": "items"}, {"var": "price"}]},
+            {"in": [{"var": "foo"}, ["bar", "baz"]]},
+            {"date": "2023-01-03"},
+            [{"var": "foo"}, 1, None],
+            "a primitive",
+            {"unknown-operator": [1]},
+        )
+
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                self.assertSameResult(expression, data)
+
+    @skipIf(
+        not can_connect("jsonlogic.com:443"),
+        "Shared tests download requires internet connection",
+    )
+    def test_shared_logic(self):
+        shared_tests = _load_shared_tests()
+        for rule, data, _ in shared_tests:
+            with self.subTest(shared_rule=rule, data=data):
+                self.assertSameResult(rule, data)
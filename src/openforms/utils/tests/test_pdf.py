@@ -0,0 +1,107 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from ..pdf import PDFRenderer, PDFRenderStats, UrlFetcher, _asset_cache
+
+
+class UrlFetcherTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.media_root = Path(tmpdir.name)
+
+        overrides = override_settings(
+            BASE_URL="https://example.com",
+            MEDIA_ROOT=tmpdir.name,
+            MEDIA_URL="/media/",
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+        _asset_cache.clear()
+        self.addCleanup(_asset_cache.clear)
+
+    def test_assets_are_read_once(self):
+        (self.media_root / "logo.svg").write_bytes(b"<svg/>")
+        fetcher = UrlFetcher()
+
+        result1 = fetcher("https://example.com/media/logo.svg")
+        result2 = fetcher("https://example.com/media/logo.svg")
+
+        self.assertEqual(result1["file_obj"].read(), b"<svg/>")
+        self.assertEqual(result2["file_obj"].read(), b"<svg/>")
+        self.assertEqual(result2["mime_type"], "image/svg+xml")
+        self.assertEqual((fetcher.hits, fetcher.misses), (1, 1))
+
+    def test_modified_assets_are_read_again(self):
+        logo = self.media_root / "logo.svg"
+        logo.write_bytes(b"<svg/>")
+        fetcher = UrlFetcher()
+        fetcher("https://example.com/media/logo.svg")
+
+        logo.write_bytes(b"<svg></svg>")
+        stat = logo.stat()
+        os.utime(logo, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        result = fetcher("https://example.com/media/logo.svg")
+
+        self.assertEqual(result["file_obj"].read(), b"<svg></svg>")
+        self.assertEqual((fetcher.hits, fetcher.misses), (0, 2))
+
+    @override_settings(PDF_ASSET_CACHE_SIZE=10)
+    def test_cache_is_bounded_by_total_size(self):
+        (self.media_root / "a.svg").write_bytes(b"<svg/>")
+        (self.media_root / "b.svg").write_bytes(b"<svg/>")
+        fetcher = UrlFetcher()
+
+        fetcher("https://example.com/media/a.svg")
+        fetcher("https://example.com/media/b.svg")
+        fetcher("https://example.com/media/b.svg")
+        fetcher("https://example.com/media/a.svg")
+
+        self.assertEqual((fetcher.hits, fetcher.misses), (1, 3))
+        self.assertLessEqual(_asset_cache.currsize, 10)
+
+
+class PDFRendererTests(SimpleTestCase):
+    @patch("weasyprint.text.fonts.FontConfiguration", side_effect=object)
+    def test_font_configurations_are_kept_per_key(self, m_font_config):
+        renderer = PDFRenderer()
+
+        config1 = renderer.get_font_config("theme-digest-1")
+        config2 = renderer.get_font_config("theme-digest-2")
+
+        self.assertIs(renderer.get_font_config("theme-digest-1"), config1)
+        self.assertIsNot(config1, config2)
+        self.assertEqual(m_font_config.call_count, 2)
+
+    @patch("openforms.utils.pdf.render_to_string", return_value="<p></p>")
+    def test_url_fetcher_uses_current_settings(self, m_render_to_string):
+        renderer = PDFRenderer()
+
+        with (
+            patch("weasyprint.HTML") as m_html,
+            patch.object(renderer, "get_font_config"),
+        ):
+            for base_url in ("https://one.example.com", "https://two.example.com"):
+                with override_settings(BASE_URL=base_url, MEDIA_URL="/media/"):
+                    renderer.render("report.html", context={})
+
+        media_hosts = [
+            call.kwargs["url_fetcher"].media_url.netloc
+            for call in m_html.call_args_list
+        ]
+        self.assertEqual(media_hosts, ["one.example.com", "two.example.com"])
+
+
+class PDFRenderStatsTests(SimpleTestCase):
+    def test_total(self):
+        stats = PDFRenderStats(template=1.5, layout=10.0, write=2.5)
+
+        self.assertEqual(stats.total, 14.0)
+        self.assertEqual(stats.as_dict()["total"], 14.0)
@@ -0,0 +1,55 @@
+import base64
+import json
+from io import BytesIO
+
+from django.test import SimpleTestCase
+
+from ..streaming import Base64Content, Base64StreamingBody
+
+
+def read_all(body: Base64StreamingBody, block_size: int) -> bytes:
+    return b"".join(iter(lambda: body.read(block_size), b""))
+
+
+class Base64StreamingBodyTests(SimpleTestCase):
+    def test_content_is_embedded_base64_encoded(self):
+        # not a multiple of 3 bytes, and spread over multiple chunks
+        raw = bytes(range(256)) * 5000 + b"x"
+        content = Base64Content(file=BytesIO(raw), size=len(raw))
+        payload = json.dumps({"name": "foo", "inhoud": content.marker, "size": 1})
+
+        for block_size in (1, 8192, -1):
+            with self.subTest(block_size=block_size):
+                content.file.seek(0)
+                body = Base64StreamingBody(payload, content)
+                expected_length = len(body)
+
+                data = read_all(body, block_size) if block_size > 0 else body.read()
+
+                self.assertEqual(len(data), expected_length)
+                result = json.loads(data)
+                self.assertEqual(result["name"], "foo")
+                self.assertEqual(base64.b64decode(result["inhoud"]), raw)
+                self.assertEqual(body.read(), b"")
+
+    def test_short_reads_from_the_file(self):
+        class ShortReadFile(BytesIO):
+            def read(self, size=-1):
+                return super().read(min(size, 5) if size > 0 else 5)
+
+        raw = b"some content which is not too long"
+        content = Base64Content(file=ShortReadFile(raw), size=len(raw))
+
+        body = Base64StreamingBody(f"<inhoud>{content.marker}</inhoud>", content)
+
+        data = read_all(body, 7)
+        self.assertEqual(data, b"<inhoud>" + base64.b64encode(raw) + b"</inhoud>")
+        self.assertEqual(len(data), len(body))
+
+    def test_empty_content(self):
+        content = Base64Content(file=BytesIO(b""), size=0)
+
+        body = Base64StreamingBody(f"<inhoud>{content.marker}</inhoud>", content)
+
+        self.assertEqual(len(body), 17)
+        self.assertEqual(body.read(), b"<inhoud></inhoud>")
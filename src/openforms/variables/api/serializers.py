@@ -45,6 +45,7 @@ class ServiceFetchConfigurationSerializer(serializers.HyperlinkedModelSerializer
             "data_mapping_type",
             "mapping_expression",
             "cache_timeout",
+            "cache_shared",
         )
         validators = [
             ModelValidator[ServiceFetchConfiguration](validate_mapping_expression),
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.10 on 2024-03-04 09:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("variables", "0012_servicefetchconfiguration_cache_timeout"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="servicefetchconfiguration",
+            name="cache_shared",
+            field=models.BooleanField(
+                default=False,
+                help_text="Re-use the cached responses for all submissions making the same request, rather than only within a single submission. Only enable this if the responses do not contain personal data.",
+                verbose_name="share cached responses",
+            ),
+        ),
+    ]
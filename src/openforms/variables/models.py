@@ -87,6 +87,15 @@ class ServiceFetchConfiguration(models.Model):
             "timeout (in seconds)."
         ),
     )
+    cache_shared = models.BooleanField(
+        _("share cached responses"),
+        default=False,
+        help_text=_(
+            "Re-use the cached responses for all submissions making the same request, "
+            "rather than only within a single submission. Only enable this if the "
+            "responses do not contain personal data."
+        ),
+    )
 
     class Meta:
         verbose_name = _("service fetch configuration")
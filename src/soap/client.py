@@ -1,15 +1,38 @@
+import hashlib
+from http.cookiejar import DefaultCookiePolicy
+
+from django.conf import settings
+from django.core.cache import cache
+
 from ape_pie.client import APIClient as SessionBase, is_base_url
+from zeep.cache import Base as ZeepCacheBase
 from zeep.client import Client
 from zeep.transports import Transport
 
+from openforms.utils.cache import LRUCache
+
 from .models import SoapService
 from .session_factory import SessionFactory
 
+# number of shared clients kept per process
+MAX_SHARED_CLIENTS = 16
+
+
+def _close_client(key: tuple, client: Client) -> None:
+    client.transport.session.close()
+
+
+# typically, an evicted client is one for an outdated configuration
+_shared_clients: LRUCache[tuple, Client] = LRUCache(
+    maxsize=MAX_SHARED_CLIENTS, on_evict=_close_client
+)
+
 
 def build_client(
     service: SoapService,
     transport_factory=Transport,
     client_factory=Client,
+    shared: bool = False,
     **kwargs,
 ) -> Client:
     """
@@ -18,12 +41,41 @@ def build_client(
     The mTLS and authentication parameters are taken from the service configuration
     and configured on the session, which is then used as transport for the zeep client.
 
+    Building a client loads and parses the WSDL (and the XSDs it imports), which is
+    often more expensive than the actual SOAP call. With ``shared=True``, the client is
+    built once per process for the current configuration of the service and re-used
+    (including the connection pool of its session) by subsequent calls. Shared sessions
+    don't store the cookies set by the service, as they are used for all users. The
+    WSDL/XSD documents of shared clients are also cached in the Django cache, so that
+    other processes don't need to download them again.
+
     Any additional kwargs are passed through to the :class:`zeep.Client` instantiation.
     """
+    if shared:
+        return _get_shared_client(service, transport_factory, client_factory, **kwargs)
+    return _build_client(service, transport_factory, client_factory, **kwargs)
+
+
+def _build_client(
+    service: SoapService,
+    transport_factory,
+    client_factory,
+    wsdl_cache: ZeepCacheBase | None = None,
+    shared: bool = False,
+    **kwargs,
+) -> Client:
     session_factory = SessionFactory(service)
     session = SOAPSession.configure_from(session_factory)
+    if shared:
+        # the session is shared between users, never leak cookies set by the service
+        # from one user to another one
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        # keep the session (and its connection pool) open rather than closing it
+        # after every request
+        session.__enter__()
     transport = transport_factory(
         session=session,
+        cache=wsdl_cache,
         timeout=service.timeout,
         # operation_timeout gets passed as a parameter on all requests, overriding any
         # monkeypatched requests.Session defaults
@@ -38,6 +90,64 @@ def build_client(
     return client
 
 
+def _get_client_cache_key(service: SoapService, *args, **kwargs) -> tuple:
+    # Changing the service configuration (or the certificates it uses) results in a
+    # new key, so that every process picks up the changes.
+    return (
+        service.pk,
+        service.url,
+        service.soap_version,
+        service.timeout,
+        service.endpoint_security,
+        service.user,
+        service.password,
+        service.get_cert(),
+        service.get_verify(),
+        args,
+        tuple(sorted((key, repr(value)) for key, value in kwargs.items())),
+    )
+
+
+def _get_shared_client(
+    service: SoapService, transport_factory, client_factory, **kwargs
+) -> Client:
+    key = _get_client_cache_key(service, transport_factory, client_factory, **kwargs)
+    return _shared_clients.get_or_set(
+        key,
+        lambda: _build_client(
+            service,
+            transport_factory,
+            client_factory,
+            wsdl_cache=DocumentCache(timeout=settings.SOAP_WSDL_CACHE_TIMEOUT),
+            shared=True,
+            **kwargs,
+        ),
+    )
+
+
+def clear_shared_clients() -> None:
+    _shared_clients.clear()
+
+
+class DocumentCache(ZeepCacheBase):
+    """
+    Cache the WSDL/XSD documents loaded by zeep in the Django cache.
+    """
+
+    def __init__(self, timeout: int):
+        self.timeout = timeout
+
+    @staticmethod
+    def _get_key(url: str) -> str:
+        return f"soap:document:{hashlib.sha256(url.encode('utf-8')).hexdigest()}"
+
+    def add(self, url: str, content: bytes) -> None:
+        cache.set(self._get_key(url), content, timeout=self.timeout)
+
+    def get(self, url: str) -> bytes | None:
+        return cache.get(self._get_key(url))
+
+
 class SOAPSession(SessionBase):
     def to_absolute_url(self, maybe_relative_url: str) -> str:
         """
@@ -2,6 +2,8 @@
 Test the client factory from SOAPService configuration.
 """
 
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 from django.test import TestCase
@@ -13,9 +15,10 @@ from simple_certmanager.test.factories import CertificateFactory
 from zeep.exceptions import XMLSyntaxError
 from zeep.wsse import Signature, UsernameToken
 
+from openforms.utils.tests.cache import clear_caches
 from openforms.utils.tests.vcr import OFVCRMixin
 
-from ..client import SOAPSession, build_client
+from ..client import SOAPSession, build_client, clear_shared_clients
 from ..constants import EndpointSecurity
 from ..session_factory import SessionFactory
 from .factories import SoapServiceFactory
@@ -25,6 +28,21 @@ WSDL = DATA_DIR / "sample.wsdl"
 WSDL_URI = str(WSDL)
 
 
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.client_ports.add(self.client_address[1])
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.send_header("Set-Cookie", "session=secret")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+
 class ClientTransportTests(OFVCRMixin, TestCase):
     VCR_TEST_FILES = DATA_DIR
 
@@ -257,3 +275,61 @@ class ClientTransportTimeoutTests(TestCase):
             except XMLSyntaxError:
                 # timeout time has passed and we're trying
                 self.fail("timeout not honoured by SOAP client")
+
+
+class SharedClientTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+        self.addCleanup(clear_shared_clients)
+
+    def test_client_is_shared_for_the_same_configuration(self):
+        service = SoapServiceFactory.create(url=WSDL_URI, timeout=10)
+
+        client1 = build_client(service, shared=True)
+        client2 = build_client(service, shared=True)
+
+        self.assertIs(client1, client2)
+        self.assertIsNot(build_client(service), client1)
+
+    def test_changed_configuration_builds_new_client(self):
+        service = SoapServiceFactory.create(url=WSDL_URI, timeout=10)
+        client1 = build_client(service, shared=True)
+
+        service.timeout = 20
+        service.save()
+        client2 = build_client(service, shared=True)
+
+        self.assertIsNot(client1, client2)
+        self.assertEqual(client2.transport.operation_timeout, 20)
+
+    @requests_mock.Mocker()
+    def test_wsdl_is_cached_across_processes(self, m):
+        m.get("http://example.com/service?wsdl", text=WSDL.read_text())
+        service = SoapServiceFactory.create(url="http://example.com/service?wsdl")
+
+        build_client(service, shared=True)
+        # simulate another process, which doesn't have the client yet
+        clear_shared_clients()
+        build_client(service, shared=True)
+
+        self.assertEqual(m.call_count, 1)
+
+    def test_shared_client_reuses_connections_and_ignores_cookies(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        server.client_ports = set()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_port}/"
+        service = SoapServiceFactory.create(url=WSDL_URI)
+
+        for _ in range(2):
+            session = build_client(service, shared=True).transport.session
+            response = session.get(url)
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(len(server.client_ports), 1)
+        # cookies set for one user must not be sent along for another one
+        self.assertEqual(len(session.cookies), 0)
@@ -22,6 +22,7 @@ from ape_pie import APIClient, InvalidURLError
 from ape_pie.client import is_base_url
 from requests.models import Response
 
+from openforms.utils.streaming import Base64Content, Base64StreamingBody
 from soap.constants import SOAP_VERSION_CONTENT_TYPES, SOAPVersion
 
 from .constants import EndpointType
@@ -155,7 +156,7 @@ class BaseClient(APIClient):
     def soap_request(
         self,
         soap_action: str,
-        body: str,
+        body: str | Base64StreamingBody,
         endpoint_type: EndpointType = EndpointType.vrije_berichten,
     ) -> Response:
         normalized_url = self.to_absolute_url(endpoint_type)
@@ -163,7 +164,7 @@ class BaseClient(APIClient):
 
         response = self.post(
             normalized_url,
-            data=body.encode("utf-8"),
+            data=body.encode("utf-8") if isinstance(body, str) else body,
             # See https://docs.python-requests.org/en/latest/user/advanced/#session-objects,
             # both the session.headers and these run-time headers are sent.
             headers={
@@ -204,12 +205,17 @@ class BaseClient(APIClient):
         template: str,
         context: dict[str, Any] | None = None,
         endpoint_type: EndpointType = EndpointType.vrije_berichten,
+        base64_content: Base64Content | None = None,
     ) -> Response:
         """
         Make a request by templating out a template with the provided context.
 
         The context is merged with the base context and the resolved template is
         rendered into a string, suitable to be passed down to :meth:`request`.
+
+        If ``base64_content`` is provided, its marker (included in the context by the
+        caller) is replaced with the base64 encoded content while the request body is
+        being sent.
         """
         full_context = {**self.build_base_context(), **(context or {})}
         ref_nr = full_context["referentienummer"]
@@ -220,6 +226,8 @@ class BaseClient(APIClient):
             extra={"ref_nr": ref_nr, "sector_alias": self.sector_alias},
         )
         body = loader.render_to_string(template, full_context)
+        if base64_content is not None:
+            body = Base64StreamingBody(body, base64_content)
         response = self.soap_request(
             soap_action, body=body, endpoint_type=endpoint_type
         )
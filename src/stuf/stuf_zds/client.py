@@ -18,6 +18,7 @@ from openforms.logging import logevent
 from openforms.plugins.exceptions import InvalidPluginConfiguration
 from openforms.registrations.exceptions import RegistrationFailed
 from openforms.submissions.models import SubmissionFileAttachment, SubmissionReport
+from openforms.utils.streaming import Base64Content, should_stream
 
 from ..client import BaseClient
 from ..constants import EndpointType
@@ -302,7 +303,12 @@ class Client(BaseClient):
         doc_data: dict,
     ) -> None:
         document.content.seek(0)
-        base64_body = base64.b64encode(document.content.read()).decode()
+        base64_content = None
+        if should_stream(size := document.content.size):
+            base64_content = Base64Content(file=document.content, size=size)
+            base64_body = base64_content.marker
+        else:
+            base64_body = base64.b64encode(document.content.read()).decode()
 
         now = timezone.now()
         # TODO: vertrouwelijkAanduiding
@@ -329,6 +335,7 @@ class Client(BaseClient):
             template="stuf_zds/soap/voegZaakdocumentToe.xml",
             context=context,
             endpoint_type=EndpointType.ontvang_asynchroon,
+            base64_content=base64_content,
         )
 
     def create_zaak_document(